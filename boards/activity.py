@@ -0,0 +1,92 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from config.async_cache import aset_many
+
+from datetime import timedelta
+
+
+# 보드 사용 기록
+# 보드를 조회하거나 수정할 때마다 마지막 사용 시각을 캐시에 남기고
+# 미리 캐싱할 때 이 기록으로 캐싱할 보드를 고름
+
+
+# 하루(초)
+DAY = 60 * 60 * 24
+# get_many로 한 번에 읽는 사용 기록 수
+ACTIVITY_READ_BATCH_SIZE = 1000
+
+
+# 보드의 마지막 사용 시각이 저장되는 캐시 키
+# weekday(0: 월요일 ~ 6: 일요일)가 주어지면 해당 요일의 마지막 사용 시각
+def board_activity_key(board_id, weekday=None):
+    if weekday is None:
+        return f'board:activity:{board_id}'
+
+    return f'board:activity:{board_id}:{weekday}'
+
+
+def _activity_data(board):
+    now = timezone.localtime()
+    timestamp = now.timestamp()
+
+    return {
+        board_activity_key(board.id): timestamp,
+        board_activity_key(board.id, now.weekday()): timestamp,
+    }
+
+
+# 보드 사용 기록 남기기
+# 사용 기록은 BOARD_PRELOAD_ACTIVE_DAYS가 지나면 사라짐
+# client에 cache_pipeline()을 넘기면 다른 캐시 작업과 함께 한 번에 저장됨
+def record_board_activity(board, client=cache):
+    client.set_many(_activity_data(board), settings.BOARD_PRELOAD_ACTIVE_DAYS * DAY)
+
+
+# record_board_activity의 비동기 버전
+async def arecord_board_activity(board):
+    await aset_many(_activity_data(board), settings.BOARD_PRELOAD_ACTIVE_DAYS * DAY)
+
+
+# 보드별 마지막 사용 시각
+# 사용 기록이 없는 보드는 결과에 포함되지 않음
+def _last_activity(board_ids, weekday=None):
+    activity = {}
+    for i in range(0, len(board_ids), ACTIVITY_READ_BATCH_SIZE):
+        keys = {
+            board_activity_key(board_id, weekday): board_id
+            for board_id in board_ids[i:i + ACTIVITY_READ_BATCH_SIZE]
+        }
+
+        for key, timestamp in cache.get_many(list(keys)).items():
+            activity[keys[key]] = timestamp
+
+    return activity
+
+
+# 미리 캐싱할 보드 id 목록
+# BOARD_PRELOAD_POLICY
+# 'all': 전체 보드
+# 'recent': BOARD_PRELOAD_ACTIVE_DAYS 안에 사용된 보드 중 최근에 사용된 순서로 BOARD_PRELOAD_TOP_N개
+# 'weekday': 'recent'와 같지만 오늘과 같은 요일에 사용된 보드만(요일마다 사용하는 팀이 다른 경우)
+def select_preload_boards(board_ids, policy=None, now=None):
+    policy = policy or settings.BOARD_PRELOAD_POLICY
+    if policy == 'all':
+        return list(board_ids)
+
+    if policy not in ('recent', 'weekday'):
+        raise ValueError(f'알 수 없는 보드 미리 캐싱 정책입니다: {policy!r}')
+
+    now = timezone.localtime(now)
+    weekday = now.weekday() if policy == 'weekday' else None
+    since = (now - timedelta(days=settings.BOARD_PRELOAD_ACTIVE_DAYS)).timestamp()
+
+    activity = _last_activity(list(board_ids), weekday)
+    active = [
+        board_id for board_id, timestamp in activity.items() if timestamp >= since
+    ]
+    # 최근에 사용된 보드부터
+    active.sort(key=lambda board_id: activity[board_id], reverse=True)
+
+    return active[:settings.BOARD_PRELOAD_TOP_N]
@@ -0,0 +1,329 @@
+from django.conf import settings
+from django.db.models import Count, F, Max, Q
+
+from users.models import User
+from .models import Column, Ticket
+from .ranks import is_rank_ordering, append_ranks
+from .versions import VersionConflict
+
+from datetime import datetime
+
+
+# 티켓 일괄 생성, 수정, 삭제
+# 요청 하나에 들어온 티켓 전체를 한꺼번에 검증하고 하나라도 잘못되었다면 아무것도 저장하지 않음
+# 컬럼, 담당자, 티켓은 티켓 수와 관계없이 한 번씩만 조회함
+# 검증 오류는 입력된 티켓과 같은 순서의 리스트로 반환하며 오류가 없는 티켓은 빈 딕셔너리
+
+
+# 일괄 처리 요청의 티켓 목록
+def bulk_items(data):
+    items = data.get('ticket')
+    if (not isinstance(items, list)) or (not items):
+        raise ValueError('ticket에 티켓 목록을 입력해주세요.')
+    if len(items) > settings.BOARD_BULK_MAX_TICKETS:
+        raise ValueError(
+            f'한 번에 최대 {settings.BOARD_BULK_MAX_TICKETS}개의 티켓만 처리할 수 있습니다.'
+        )
+
+    return items
+
+
+# 태그 코드(FE, BE ...)나 태그명(Frontend, Backend ...)을 DB에 저장될 태그 코드로 변환
+# 일치하는 태그가 없다면 None
+def tag_code(tag):
+    for code, name in Ticket.TAG_CHOICES:
+        if tag in (code, name):
+            return code
+
+    return None
+
+
+# 입력된 담당자 계정명 중 보드를 소유한 팀의 구성원만 {계정명: 사용자} 형태로 가져옴
+def _team_members(board, items):
+    usernames = {
+        item['charge'] for item in items
+        if isinstance(item, dict) and isinstance(item.get('charge'), str)
+    }
+    if not usernames:
+        return {}
+
+    return {
+        user.username: user for user in User.objects.filter(
+            username__in=usernames,
+            groups__name=board.team.name
+        )
+    }
+
+
+# 티켓 하나의 입력값을 검증해 모델 필드값으로 변환
+# 입력되지 않은 필드는 건너뛰고, required에 있는 필드가 없다면 오류
+def _clean_ticket_fields(item, members, required):
+    values = {}
+    errors = {}
+
+    for field in required:
+        if item.get(field) is None:
+            errors[field] = '필수값입니다.'
+
+    if item.get('title') is not None:
+        if (not isinstance(item['title'], str)) or (not item['title']):
+            errors['title'] = '제목을 입력해주세요.'
+        else:
+            values['title'] = item['title']
+
+    if item.get('tag') is not None:
+        values['tag'] = tag_code(item['tag'])
+        if values['tag'] is None:
+            errors['tag'] = '잘못된 태그가 입력되었습니다.'
+
+    if item.get('volume') is not None:
+        try:
+            values['volume'] = float(item['volume'])
+        except (ValueError, TypeError) as error:
+            errors['volume'] = f'{error}'
+
+    if item.get('ended_at') is not None:
+        try:
+            values['ended_at'] = datetime.strptime(item['ended_at'], '%Y-%m-%d').date()
+            # 마감일이 오늘 미만일 수 없음
+            if values['ended_at'] < datetime.now().date():
+                raise ValueError('마감일은 오늘 이후여야 합니다.')
+        except (ValueError, TypeError) as error:
+            errors['ended_at'] = f'{error}'
+
+    if item.get('charge') is not None:
+        values['charge'] = (
+            members.get(item['charge']) if isinstance(item['charge'], str) else None
+        )
+        if values['charge'] is None:
+            errors['charge'] = '팀 구성원의 계정명을 입력해주세요.'
+
+    return values, errors
+
+
+# 컬럼별로 마지막 순서값, 정렬 키와 티켓 수를 한 번에 가져옴
+def _column_tails(column_ids):
+    return {
+        tail['column_id']: tail for tail in Ticket.objects.filter(
+            column_id__in=column_ids
+        ).values('column_id').annotate(
+            last_sequence=Max('sequence'),
+            last_rank=Max('rank'),
+            count=Count('id')
+        )
+    }
+
+
+# 생성할 티켓 객체 목록과 검증 오류
+# 순서값, 정렬 키는 저장하기 직전에 assign_ticket_positions로 배정
+def prepare_ticket_create(board, items):
+    columns = {column.id: column for column in Column.objects.filter(board=board)}
+    members = _team_members(board, items)
+
+    cleaned = []
+    errors = []
+    for item in items:
+        if not isinstance(item, dict):
+            errors.append({'ticket': '티켓 데이터는 객체여야 합니다.'})
+            continue
+
+        values, item_errors = _clean_ticket_fields(
+            item, members, ['column', 'title', 'tag', 'volume', 'ended_at']
+        )
+
+        try:
+            values['column'] = columns[int(item.get('column'))]
+        except (KeyError, ValueError, TypeError):
+            item_errors.setdefault('column', '보드에 없는 컬럼입니다.')
+
+        cleaned.append(values)
+        errors.append(item_errors)
+
+    if any(errors):
+        return None, errors
+
+    return [Ticket(**values) for values in cleaned], None
+
+
+# 새 티켓들에 컬럼별 순서값, 정렬 키를 한 번에 배정
+# 티켓은 입력된 순서대로 각 컬럼의 맨 뒤에 추가됨
+# 티켓이 추가될 컬럼들을 잠근(lock_columns) 트랜잭션 안에서 호출해야 함
+def assign_ticket_positions(tickets):
+    tails = _column_tails({ticket.column_id for ticket in tickets})
+    added = {}
+    for ticket in tickets:
+        added[ticket.column_id] = added.get(ticket.column_id, 0) + 1
+
+    ranks = {}
+    if is_rank_ordering():
+        ranks = {
+            column_id: append_ranks(
+                Ticket.objects.filter(column_id=column_id),
+                tails.get(column_id, {}).get('last_rank'),
+                count
+            ) for column_id, count in added.items()
+        }
+
+    positions = {}
+    for ticket in tickets:
+        tail = tails.get(ticket.column_id, {})
+        position = positions.get(ticket.column_id, 0)
+        positions[ticket.column_id] = position + 1
+
+        # 정렬 키 방식에서는 정렬 키 순서상의 위치가 순서값
+        if is_rank_ordering():
+            ticket.sequence = tail.get('count', 0) + position + 1
+            ticket.rank = ranks[ticket.column_id][position]
+        else:
+            ticket.sequence = (tail.get('last_sequence') or 0) + position + 1
+
+
+# 수정된 티켓 객체 목록, 수정된 필드 목록, 티켓별로 입력된 버전({티켓 id: 버전})과 검증 오류
+def prepare_ticket_update(board, items):
+    ticket_ids = []
+    for item in items:
+        try:
+            ticket_ids.append(int(item.get('ticket')))
+        except (AttributeError, ValueError, TypeError):
+            ticket_ids.append(None)
+
+    tickets = Ticket.objects.select_related('charge').in_bulk(
+        [ticket_id for ticket_id in ticket_ids if ticket_id is not None]
+    )
+    members = _team_members(board, items)
+    board_columns = set(
+        Column.objects.filter(board=board).values_list('id', flat=True)
+    )
+
+    updated = {}
+    fields = set()
+    versions = {}
+    errors = []
+    for item, ticket_id in zip(items, ticket_ids):
+        ticket = tickets.get(ticket_id)
+        if (ticket is None) or (ticket.column_id not in board_columns):
+            errors.append({'ticket': '보드에 없는 티켓입니다.'})
+            continue
+        if ticket_id in updated:
+            errors.append({'ticket': '같은 티켓이 여러 번 입력되었습니다.'})
+            continue
+
+        # 컬럼, 순서 변경은 순서 변경 API에서만 가능
+        if ('sequence' in item) or ('column' in item):
+            errors.append({'ticket': '순서 변경은 시도할 수 없습니다.'})
+            continue
+
+        values, item_errors = _clean_ticket_fields(item, members, [])
+        errors.append(item_errors)
+
+        # 클라이언트가 알고 있는 티켓 버전(선택)
+        if item.get('version') is not None:
+            try:
+                versions[ticket_id] = int(item['version'])
+                if versions[ticket_id] <= 0:
+                    raise ValueError('버전은 1 이상이어야 합니다.')
+            except (ValueError, TypeError) as error:
+                item_errors['version'] = f'{error}'
+
+        for field, value in values.items():
+            setattr(ticket, field, value)
+        fields.update(values)
+        updated[ticket_id] = ticket
+
+    if any(errors):
+        return None, None, None, errors
+
+    return list(updated.values()), sorted(fields), versions, None
+
+
+# 수정할 티켓들의 버전을 한 번의 UPDATE 문으로 1씩 올림
+# 버전이 입력된 티켓은 버전이 같을 때만 올리고, 하나라도 다르다면 VersionConflict 발생
+# 수정과 같은 트랜잭션 안에서 호출해야 충돌했을 때 전체가 롤백됨
+def claim_ticket_versions(tickets, versions):
+    condition = Q(id__in=[ticket.id for ticket in tickets if ticket.id not in versions])
+    # 같은 버전끼리 묶어 조건의 수를 줄임
+    expected = {}
+    for ticket_id, version in versions.items():
+        expected.setdefault(version, []).append(ticket_id)
+    for version, ticket_ids in expected.items():
+        condition |= Q(id__in=ticket_ids, version=version)
+
+    if Ticket.objects.filter(condition).update(version=F('version') + 1) != len(tickets):
+        raise VersionConflict(None)
+
+    current = dict(
+        Ticket.objects.filter(
+            id__in=[ticket.id for ticket in tickets]
+        ).values_list('id', 'version')
+    )
+    for ticket in tickets:
+        ticket.version = current[ticket.id]
+
+
+# 입력된 버전이 DB와 다른 티켓의 검증 오류(입력된 티켓과 같은 순서)
+def version_conflict_errors(items, versions):
+    current = dict(
+        Ticket.objects.filter(id__in=list(versions)).values_list('id', 'version')
+    )
+
+    errors = []
+    for item in items:
+        ticket_id = int(item['ticket'])
+        if (ticket_id in versions) and (current.get(ticket_id) != versions[ticket_id]):
+            errors.append({
+                'version': '다른 사용자가 먼저 수정했습니다.',
+                'current_version': current.get(ticket_id),
+            })
+        else:
+            errors.append({})
+
+    return errors
+
+
+# 삭제할 티켓 id 목록, 티켓이 속한 컬럼 id 목록과 검증 오류
+def prepare_ticket_delete(board, items):
+    ticket_ids = []
+    errors = []
+    for item in items:
+        try:
+            ticket_ids.append(int(item))
+            errors.append({})
+        except (ValueError, TypeError):
+            ticket_ids.append(None)
+            errors.append({'ticket': '티켓 id를 입력해주세요.'})
+
+    # {티켓 id: 컬럼 id}
+    found = dict(
+        Ticket.objects.filter(
+            id__in=[ticket_id for ticket_id in ticket_ids if ticket_id is not None],
+            column__board=board
+        ).values_list('id', 'column_id')
+    )
+    for i, ticket_id in enumerate(ticket_ids):
+        if (ticket_id is not None) and (ticket_id not in found):
+            errors[i] = {'ticket': '보드에 없는 티켓입니다.'}
+
+    if any(errors):
+        return None, None, errors
+
+    return list(found), sorted(set(found.values())), None
+
+
+# 티켓이 삭제된 컬럼들의 순서값을 1부터 다시 매김
+# 정렬 키 방식에서는 위치가 자동으로 당겨지므로 수정할 필요 없음
+def renumber_tickets(column_ids):
+    if is_rank_ordering():
+        return
+
+    tickets = []
+    positions = {}
+    remaining = Ticket.objects.filter(
+        column_id__in=column_ids
+    ).order_by('sequence', 'id').only('id', 'column_id', 'sequence')
+    for ticket in remaining:
+        positions[ticket.column_id] = positions.get(ticket.column_id, 0) + 1
+        if ticket.sequence != positions[ticket.column_id]:
+            ticket.sequence = positions[ticket.column_id]
+            tickets.append(ticket)
+
+    Ticket.objects.bulk_update(tickets, ['sequence'], batch_size=500)
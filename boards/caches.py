@@ -0,0 +1,889 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils.http import quote_etag
+
+from .models import Column, Ticket
+from .activity import record_board_activity, arecord_board_activity
+from . import events
+from .ranks import is_rank_ordering
+from .serializers import (
+    BoardSerializer,
+    build_ticket_data,
+    build_board_v2_data,
+    build_ticket_v2_data
+)
+from .snapshots import encode_board, load_board
+from .local_cache import (
+    BOARD_INVALIDATION_CHANNEL,
+    board_invalidation_message,
+    board_local_cache
+)
+from config.async_cache import aget, aget_many
+from config.cache_pipeline import cache_pipeline
+from config.circuit_breaker import CACHE_UNAVAILABLE, cache_circuit
+
+from asgiref.sync import sync_to_async
+
+from threading import Thread
+from time import monotonic, sleep, time
+
+
+# 보드 캐시 만료 시간(1시간)
+BOARD_CACHE_TIMEOUT = 60 * 60
+# 다른 요청이 보드를 직렬화하는 동안 캐시를 다시 확인하는 간격(초)
+BOARD_CACHE_POLL_INTERVAL = 0.05
+
+
+# 캐시된 보드 데이터에 변경 사항을 그대로 반영할 수 없을 때 발생
+# 이 경우 보드 전체를 다시 직렬화함
+class BoardCachePatchError(Exception):
+    pass
+
+
+# 보드 버전이 저장되는 캐시 키
+def board_version_key(board):
+    return f'board:version:{board.team.name}'
+
+
+# 보드의 현재 버전
+# 컬럼, 티켓이 바뀔 때마다 증가하며 캐시 키와 ETag에 사용됨
+# 버전이 캐시에서 사라졌다면 현재 시각(마이크로초)으로 다시 시작해 이전 버전보다 커지도록 함
+def get_board_version(board):
+    version = cache.get(board_version_key(board))
+    if version is not None:
+        return version
+
+    cache.add(board_version_key(board), _initial_board_version(), None)
+
+    return cache.get(board_version_key(board))
+
+
+# 보드 버전의 초기값
+def _initial_board_version():
+    return int(time() * 1000000)
+
+
+# 보드 버전을 1 올리고 올라간 버전을 반환
+def bump_board_version(board):
+    try:
+        return cache.incr(board_version_key(board))
+    # 버전이 캐시에 없는 경우
+    except ValueError:
+        get_board_version(board)
+
+        return cache.incr(board_version_key(board))
+
+
+# 보드 버전으로 만든 ETag
+def board_etag(board, version):
+    return quote_etag(f'board-{board.id}-{version}')
+
+
+# 보드 데이터가 저장되는 캐시 키
+# 버전이 바뀌면 키도 바뀌므로 이전 버전의 데이터를 읽을 일이 없음
+def board_cache_key(board, version=None):
+    if version is None:
+        version = get_board_version(board)
+
+    return f'{board.team.name}:v{version}'
+
+
+# v2 보드 데이터가 저장되는 캐시 키
+def board_v2_cache_key(board, version=None):
+    if version is None:
+        version = get_board_version(board)
+
+    return f'{board.team.name}:v2:v{version}'
+
+
+# v2 보드 데이터의 ETag
+# 같은 버전이라도 v1과 형식이 다르므로 ETag를 구분함
+def board_v2_etag(board, version):
+    return quote_etag(f'board-v2-{board.id}-{version}')
+
+
+# 보드 데이터가 만료되지 않았음을 표시하는 캐시 키
+# 이 키가 사라진 뒤에도 보드 데이터는 BOARD_CACHE_STALE_TIMEOUT 동안 남아있음
+def board_fresh_key(board):
+    return f'board:fresh:{board.team.name}'
+
+
+# 보드를 다시 직렬화하는 요청이 하나만 실행되도록 잡는 잠금 키
+def board_lock_key(board):
+    return f'board:lock:{board.team.name}'
+
+
+# 보드 데이터와 만료 표시를 함께 캐싱
+# 보드 데이터는 압축된 바이너리 형식(boards.snapshots)으로 저장됨
+def _store_board_data(board, data, version, client=None):
+    pipeline = client or cache_pipeline()
+    snapshot = encode_board(data)
+
+    # 만료 이후에도 잠시 이전 데이터를 제공할 수 있도록 보드 데이터는 더 오래 유지
+    pipeline.set(
+        board_cache_key(board, version),
+        snapshot,
+        BOARD_CACHE_TIMEOUT + settings.BOARD_CACHE_STALE_TIMEOUT
+    )
+    pipeline.set(board_fresh_key(board), True, BOARD_CACHE_TIMEOUT)
+    board_local_cache.set(board.team.name, version, data, len(snapshot))
+
+    if client is None:
+        pipeline.execute()
+
+
+# 보드 버전을 1 올린 다음 올라간 버전을 반환
+# 수정 요청은 사용 기록과 함께 한 번의 왕복으로 처리함
+# 버전이 캐시에 없다면 get_board_version과 같이 현재 시각으로 다시 시작한 다음 올림
+def _next_board_version(board, record_activity=False):
+    pipeline = cache_pipeline()
+    if record_activity:
+        record_board_activity(board, pipeline)
+    pipeline.add(board_version_key(board), _initial_board_version(), None)
+    pipeline.incr(board_version_key(board))
+
+    return pipeline.execute()[-1]
+
+
+# 해당 버전의 v1, v2 보드 데이터 캐시 키
+def _board_data_keys(board, version):
+    return [board_cache_key(board, version), board_v2_cache_key(board, version)]
+
+
+# 보드 버전이 바뀌었음을 모든 프로세스의 L1 캐시(boards.local_cache)에 알림
+# 새 버전의 데이터를 저장하는 파이프라인에 함께 넣어 데이터가 저장된 다음 전달되도록 함
+def _announce_board_version(board, version, pipeline):
+    board_local_cache.invalidate(board.team.name, version)
+    pipeline.publish(
+        BOARD_INVALIDATION_CHANNEL, board_invalidation_message(board.team.name, version)
+    )
+
+
+# 여러 보드의 데이터를 한 번에 캐싱
+# boards_data는 {보드: 보드 데이터} 형태, set_many로 한 번에 저장됨
+def store_boards_data(boards_data, timeout=BOARD_CACHE_TIMEOUT):
+    version_keys = {board: board_version_key(board) for board in boards_data}
+    versions = cache.get_many(list(version_keys.values()))
+
+    data = {}
+    fresh = {}
+    for board, board_data in boards_data.items():
+        version = versions.get(version_keys[board])
+        # 버전이 없는 보드만 따로 버전을 만듦
+        if version is None:
+            version = get_board_version(board)
+
+        data[board_cache_key(board, version)] = encode_board(board_data)
+        fresh[board_fresh_key(board)] = True
+
+    cache.set_many(data, timeout + settings.BOARD_CACHE_STALE_TIMEOUT)
+    cache.set_many(fresh, timeout)
+
+
+# 보드 전체를 다시 직렬화해 캐싱
+def refresh_board_cache(board, version=None):
+    if version is None:
+        version = get_board_version(board)
+
+    data = BoardSerializer(board).data
+
+    _store_board_data(board, data, version)
+
+    return data
+
+
+# 보드 버전을 올려 캐싱된 데이터를 더 이상 사용하지 않도록 함
+# 버전이 바뀌므로 클라이언트의 ETag도 함께 무효화됨
+# 캐시를 사용할 수 없다면(config.circuit_breaker) 이 프로세스의 L1 캐시만 비움
+def invalidate_board_cache(board):
+    try:
+        with cache_circuit:
+            _invalidate_board_cache(board)
+    except CACHE_UNAVAILABLE:
+        board_local_cache.forget(board.team.name)
+
+
+def _invalidate_board_cache(board):
+    version = _next_board_version(board)
+
+    pipeline = cache_pipeline()
+    pipeline.delete_many(_board_data_keys(board, version - 1))
+    _announce_board_version(board, version, pipeline)
+    pipeline.execute()
+
+    # 변경된 부분을 알 수 없으므로 구독 중인 클라이언트가 보드 전체를 다시 조회하도록 알림
+    events.publish_board_event(board, version, events.board_reloaded())
+
+
+# 캐시 장애로 수정된 보드를 캐싱하지 못했을 때
+# 이 프로세스의 L1 캐시에 남은 이전 데이터를 지우고 DB에서 직렬화한 데이터를 반환
+# DB 수정은 이미 끝났으므로 수정 요청은 실패하지 않음
+def _board_cache_unavailable(board):
+    board_local_cache.forget(board.team.name)
+
+    return BoardSerializer(board).data
+
+
+# 한 번에 많은 티켓이 바뀌었을 때 변경 사항마다 캐시를 수정하지 않고
+# 버전을 한 번만 올린 다음 보드 전체를 다시 직렬화해 캐싱
+# 캐시를 사용할 수 없다면(config.circuit_breaker) 캐싱을 건너뜀
+def rebuild_board_cache(board):
+    try:
+        with cache_circuit:
+            return _rebuild_board_cache(board)
+    except CACHE_UNAVAILABLE:
+        return _board_cache_unavailable(board)
+
+
+def _rebuild_board_cache(board):
+    # 수정도 보드를 사용한 것이므로 사용 기록을 남김
+    version = _next_board_version(board, record_activity=True)
+
+    data = BoardSerializer(board).data
+
+    # 이전 버전의 데이터 삭제와 새 버전의 데이터 저장을 한 번에 처리
+    pipeline = cache_pipeline()
+    pipeline.delete_many(_board_data_keys(board, version - 1))
+    _store_board_data(board, data, version, pipeline)
+    _announce_board_version(board, version, pipeline)
+    pipeline.execute()
+
+    events.publish_board_event(board, version, events.board_reloaded())
+
+    return data
+
+
+# 잠금을 잡은 요청만 보드를 다시 직렬화함
+# 잠금을 잡지 못했다면 None 반환
+def _refresh_with_lock(board, version):
+    lock_key = board_lock_key(board)
+    if not cache.add(lock_key, True, settings.BOARD_CACHE_LOCK_TIMEOUT):
+        return None
+
+    try:
+        return refresh_board_cache(board, version)
+    finally:
+        cache.delete(lock_key)
+
+
+# 만료된 보드 데이터를 제공한 다음 별도 스레드에서 다시 직렬화
+def _refresh_in_background(board, version):
+    def refresh():
+        try:
+            _refresh_with_lock(board, version)
+        finally:
+            # 스레드에서 연 DB 연결은 직접 닫아야 함
+            connection.close()
+
+    Thread(target=refresh, daemon=True).start()
+
+
+# Redis에서 읽은 보드 데이터를 L1 캐시에도 저장
+def _store_local_board_data(board, version, value, data):
+    if isinstance(value, bytes):
+        board_local_cache.set(board.team.name, version, data, len(value))
+
+
+# 캐싱된 보드 데이터를 가져오고 없다면 다시 직렬화해 캐싱
+# 프로세스 안의 L1 캐시(boards.local_cache)에 있다면 Redis를 거치지 않음
+# 동시에 여러 요청이 캐시를 찾지 못해도 보드를 다시 직렬화하는 요청은 하나뿐이고
+# 나머지 요청은 만료된 데이터를 받거나 다시 캐싱될 때까지 기다림
+def get_board_data(board, version=None):
+    if version is None:
+        version = get_board_version(board)
+
+    data = board_local_cache.get(board.team.name, version)
+    if data is not None:
+        return data
+
+    data_key = board_cache_key(board, version)
+
+    cached = cache.get_many([data_key, board_fresh_key(board)])
+    data = load_board(cached.get(data_key))
+
+    if data is not None:
+        # 같은 버전의 데이터는 바뀌지 않으므로 만료 여부와 관계없이 L1 캐시에 저장
+        _store_local_board_data(board, version, cached.get(data_key), data)
+
+        # 만료되지 않은 데이터
+        if (board_fresh_key(board) in cached) or (not settings.BOARD_CACHE_STALE_TIMEOUT):
+            return data
+
+        # 만료되었지만 아직 남아있는 데이터는 그대로 제공하고 백그라운드에서 갱신
+        if not cache.get(board_lock_key(board)):
+            _refresh_in_background(board, version)
+
+        return data
+
+    data = _refresh_with_lock(board, version)
+    if data is not None:
+        return data
+
+    # 다른 요청이 보드를 직렬화하는 중이므로 캐싱될 때까지 기다림
+    deadline = monotonic() + settings.BOARD_CACHE_LOCK_WAIT
+    while monotonic() < deadline:
+        sleep(BOARD_CACHE_POLL_INTERVAL)
+
+        data = load_board(cache.get(data_key))
+        if data is not None:
+            return data
+
+    # 기다려도 캐싱되지 않았다면 직접 직렬화
+    return refresh_board_cache(board, version)
+
+
+# 보드 조회의 사용 기록을 남기고 현재 버전을 반환
+# L1 캐시가 버전을 알고 있고 최근에 사용 기록을 남겼다면 Redis에 요청하지 않음
+# Redis 장애, 응답 지연으로 캐시를 사용할 수 없다면(config.circuit_breaker) None
+def record_and_get_board_version(board):
+    team_name = board.team.name
+    version = board_local_cache.get_version(team_name)
+    record = board_local_cache.should_record_activity(team_name)
+    if (version is not None) and (not record):
+        return version
+
+    try:
+        with cache_circuit:
+            # 미리 캐싱할 보드를 고를 수 있도록 사용 기록을 남김
+            if record:
+                record_board_activity(board)
+
+            if version is None:
+                version = get_board_version(board)
+                board_local_cache.set_version(team_name, version)
+    except CACHE_UNAVAILABLE:
+        pass
+
+    return version
+
+
+# record_and_get_board_version의 비동기 버전
+async def arecord_and_get_board_version(board):
+    team_name = board.team.name
+    version = board_local_cache.get_version(team_name)
+    record = board_local_cache.should_record_activity(team_name)
+    if (version is not None) and (not record):
+        return version
+
+    try:
+        with cache_circuit:
+            if record:
+                await arecord_board_activity(board)
+
+            if version is None:
+                version = await aget_board_version(board)
+                board_local_cache.set_version(team_name, version)
+    except CACHE_UNAVAILABLE:
+        pass
+
+    return version
+
+
+# 보드 조회 응답의 캐시 관련 헤더
+# 버전을 모른다면(캐시를 사용할 수 없음) ETag 없이 응답을 저장하지 않도록 함
+def board_cache_headers(etag, board, version):
+    if version is None:
+        return {'Cache-Control': 'no-store'}
+
+    return {
+        'ETag': etag(board, version),
+        'Cache-Control': 'private, no-cache'
+    }
+
+
+# get_board_version의 비동기 버전
+# 버전이 캐시에 없을 때만 동기 함수로 다시 시작함
+async def aget_board_version(board):
+    version = await aget(board_version_key(board))
+    if version is not None:
+        return version
+
+    return await sync_to_async(get_board_version)(board)
+
+
+# get_board_data의 비동기 버전
+# 만료되지 않은 데이터가 캐시에 있다면(대부분의 요청) 이벤트 루프 안에서 바로 반환
+# 캐시가 없거나 만료되었다면 잠금, 직렬화를 처리하는 get_board_data를 스레드에서 실행
+async def aget_board_data(board, version=None):
+    if version is None:
+        version = await aget_board_version(board)
+
+    data = board_local_cache.get(board.team.name, version)
+    if data is not None:
+        return data
+
+    data_key = board_cache_key(board, version)
+
+    cached = await aget_many([data_key, board_fresh_key(board)])
+    data = load_board(cached.get(data_key))
+    if (data is not None) and (
+        (board_fresh_key(board) in cached) or (not settings.BOARD_CACHE_STALE_TIMEOUT)
+    ):
+        _store_local_board_data(board, version, cached.get(data_key), data)
+
+        return data
+
+    return await sync_to_async(get_board_data)(board, version)
+
+
+# 캐싱된 v2 보드 데이터를 가져오고 없다면 다시 직렬화해 캐싱
+def get_board_v2_data(board, version=None):
+    if version is None:
+        version = get_board_version(board)
+    data_key = board_v2_cache_key(board, version)
+
+    data = cache.get(data_key)
+    if data is None:
+        data = build_board_v2_data(board)
+        cache.set(data_key, data, BOARD_CACHE_TIMEOUT)
+
+    return data
+
+
+# 캐시된 v2 보드 데이터를 수정해 반환
+# 수정할 수 없다면 None을 반환하고 다음 조회 때 다시 직렬화함
+def _patch_board_v2_data(data, patch, *args):
+    if data is None:
+        return None
+
+    try:
+        BOARD_V2_PATCHES[patch](data, *args)
+    except BoardCachePatchError:
+        return None
+
+    return data
+
+
+# 캐시된 보드 데이터에서 변경된 컬럼, 티켓 부분만 수정해 새 버전으로 캐싱
+# patch는 아래의 *_column, *_ticket 함수 중 하나
+# 캐싱된 v2 보드 데이터도 대응하는 *_v2 함수로 함께 수정되고 변경 이벤트가 발행됨
+# 캐시 요청은 버전 올리기, 이전 데이터 읽기, 새 데이터 저장의 세 번의 왕복으로 처리함
+# 캐시를 사용할 수 없다면(config.circuit_breaker) 수정을 건너뜀
+def patch_board_cache(board, patch, *args):
+    try:
+        with cache_circuit:
+            return _patch_board_cache(board, patch, *args)
+    except CACHE_UNAVAILABLE:
+        return _board_cache_unavailable(board)
+
+
+def _patch_board_cache(board, patch, *args):
+    # 수정도 보드를 사용한 것이므로 사용 기록을 남김
+    # 변경 사항이 있으므로 데이터를 수정할 수 없더라도 버전은 올림
+    version = _next_board_version(board, record_activity=True)
+
+    old_keys = _board_data_keys(board, version - 1)
+    cached = cache.get_many(old_keys)
+    data = load_board(cached.get(old_keys[0]))
+    v2_data = _patch_board_v2_data(cached.get(old_keys[1]), patch, *args)
+
+    # 캐시된 데이터가 없거나 수정할 수 없다면 전체를 직렬화
+    if data is not None:
+        try:
+            patch(data, *args)
+        except BoardCachePatchError:
+            data = None
+    if data is None:
+        data = BoardSerializer(board).data
+
+    # 이전 버전의 데이터는 더 이상 읽히지 않으므로 삭제
+    pipeline = cache_pipeline()
+    pipeline.delete_many(old_keys)
+    if v2_data is not None:
+        pipeline.set(board_v2_cache_key(board, version), v2_data, BOARD_CACHE_TIMEOUT)
+    _store_board_data(board, data, version, pipeline)
+    _announce_board_version(board, version, pipeline)
+    pipeline.execute()
+
+    events.publish_board_event(board, version, BOARD_EVENTS[patch](*args))
+
+    return data
+
+
+# 캐시된 데이터와 새로 직렬화한 데이터를 비교해 다른 부분을 목록으로 반환
+# 일치하면 빈 리스트
+def diff_board_cache(board):
+    cached = load_board(cache.get(board_cache_key(board)))
+    if cached is None:
+        return ['캐시된 보드 데이터가 없습니다.']
+
+    fresh = BoardSerializer(board).data
+
+    differences = []
+    if cached['team'] != fresh['team']:
+        differences.append(f"team: {cached['team']} != {fresh['team']}")
+
+    # 딕셔너리의 순서도 응답에 그대로 드러나므로 순서까지 비교
+    if list(cached['column']) != list(fresh['column']):
+        differences.append(
+            f"column 순서: {list(cached['column'])} != {list(fresh['column'])}"
+        )
+
+    for title, fresh_column in fresh['column'].items():
+        cached_column = cached['column'].get(title)
+        if cached_column is None:
+            continue
+
+        for key in ('id', 'sequence'):
+            if cached_column[key] != fresh_column[key]:
+                differences.append(
+                    f'{title}.{key}: {cached_column[key]} != {fresh_column[key]}'
+                )
+
+        cached_tickets = cached_column.get('ticket', {})
+        fresh_tickets = fresh_column.get('ticket', {})
+        if list(cached_tickets) != list(fresh_tickets):
+            differences.append(
+                f'{title}.ticket 순서: {list(cached_tickets)} != {list(fresh_tickets)}'
+            )
+
+        for ticket_title, fresh_ticket in fresh_tickets.items():
+            cached_ticket = cached_tickets.get(ticket_title)
+            if (cached_ticket is not None) and (cached_ticket != fresh_ticket):
+                differences.append(
+                    f'{title}.{ticket_title}: {cached_ticket} != {fresh_ticket}'
+                )
+
+    return differences
+
+
+# 캐시된 데이터에서 컬럼 항목을 찾음
+# 제목이 중복되어 다른 컬럼의 항목이 들어있는 경우에도 오류 발생
+def _column_entry(data, column, title=None):
+    entry = data['column'].get(column.title if title is None else title)
+    if (entry is None) or (entry['id'] != column.id):
+        raise BoardCachePatchError
+
+    return entry
+
+
+# 캐시된 컬럼 항목에서 티켓 항목을 찾음
+def _ticket_entry(column_entry, ticket, title=None):
+    entry = column_entry.get('ticket', {}).get(
+        ticket.title if title is None else title
+    )
+    if (entry is None) or (entry['id'] != ticket.id):
+        raise BoardCachePatchError
+
+    return entry
+
+
+# 같은 제목의 다른 컬럼이 있다면 캐시에는 하나만 남아있으므로 수정할 수 없음
+def _check_unique_column_title(column, title):
+    if Column.objects.filter(board_id=column.board_id, title=title).exclude(id=column.id).exists():
+        raise BoardCachePatchError
+
+
+# 같은 컬럼 안에 같은 제목의 다른 티켓이 있다면 캐시에는 하나만 남아있으므로 수정할 수 없음
+def _check_unique_ticket_title(ticket, column_id, title):
+    if Ticket.objects.filter(column_id=column_id, title=title).exclude(id=ticket.id).exists():
+        raise BoardCachePatchError
+
+
+# 캐시된 컬럼 안의 티켓 수와 실제 티켓 수가 다르면 제목이 중복된 티켓이 있는 것
+def _check_complete_tickets(column_entry, column_id):
+    if len(column_entry.get('ticket', {})) != Ticket.objects.filter(column_id=column_id).count():
+        raise BoardCachePatchError
+
+
+# 딕셔너리 항목들을 순서값 기준으로 다시 정렬
+def _sort_by_sequence(entries):
+    return dict(sorted(entries.items(), key=lambda item: item[1]['sequence']))
+
+
+# 새 컬럼 추가
+# 새 컬럼은 항상 마지막 순서이므로 맨 뒤에 추가됨
+def insert_column(data, column):
+    data['column'][column.title] = {
+        'id': column.id,
+        'sequence': column.sequence
+    }
+
+
+# 컬럼 제목 수정
+def update_column(data, column, old_title):
+    if column.title == old_title:
+        return
+
+    _column_entry(data, column, old_title)
+    if column.title in data['column']:
+        raise BoardCachePatchError
+    _check_unique_column_title(column, old_title)
+
+    # 기존 위치를 유지한 채로 키만 변경
+    data['column'] = {
+        (column.title if title == old_title else title): value
+        for title, value in data['column'].items()
+    }
+
+
+# 컬럼 순서 변경
+# 보드의 컬럼 순서를 DB와 같은 방식으로 옮긴 다음 다시 정렬
+def move_column(data, column, old_sequence, column_count):
+    # 캐시된 컬럼 수가 실제와 다르면 제목이 중복된 컬럼이 있는 것
+    if len(data['column']) != column_count:
+        raise BoardCachePatchError
+    # 다른 요청이 이미 옮겨진 상태로 다시 직렬화했다면 한 번 더 옮기지 않음
+    if _column_entry(data, column)['sequence'] != old_sequence:
+        raise BoardCachePatchError
+
+    for entry in data['column'].values():
+        if entry['id'] == column.id:
+            entry['sequence'] = column.sequence
+        elif column.sequence <= entry['sequence'] < old_sequence:
+            entry['sequence'] += 1
+        elif old_sequence < entry['sequence'] <= column.sequence:
+            entry['sequence'] -= 1
+
+    data['column'] = _sort_by_sequence(data['column'])
+
+
+# 컬럼 삭제
+def delete_column(data, column):
+    _column_entry(data, column)
+    _check_unique_column_title(column, column.title)
+
+    del data['column'][column.title]
+
+    # 정렬 키 방식에서는 뒤에 있던 컬럼들의 위치가 하나씩 당겨짐
+    if is_rank_ordering():
+        for entry in data['column'].values():
+            if entry['sequence'] > column.sequence:
+                entry['sequence'] -= 1
+
+
+# 새 티켓 추가
+# 새 티켓은 항상 컬럼의 마지막 순서이므로 맨 뒤에 추가됨
+def insert_ticket(data, ticket):
+    column_entry = _column_entry(data, ticket.column)
+
+    column_entry.setdefault('ticket', {})[ticket.title] = build_ticket_data(ticket)
+
+
+# 티켓 내용 수정
+def update_ticket(data, ticket, old_title, old_column_id):
+    # 다른 컬럼으로 옮겨진 경우는 순서 변경에서 처리
+    if ticket.column_id != old_column_id:
+        raise BoardCachePatchError
+
+    column_entry = _column_entry(data, ticket.column)
+    _ticket_entry(column_entry, ticket, old_title)
+
+    if ticket.title == old_title:
+        column_entry['ticket'][old_title] = build_ticket_data(ticket)
+        return
+
+    if ticket.title in column_entry['ticket']:
+        raise BoardCachePatchError
+    _check_unique_ticket_title(ticket, ticket.column_id, old_title)
+
+    # 기존 위치를 유지한 채로 키와 값을 변경
+    column_entry['ticket'] = {
+        (ticket.title if title == old_title else title): (
+            build_ticket_data(ticket) if title == old_title else value
+        )
+        for title, value in column_entry['ticket'].items()
+    }
+
+
+# 같은 컬럼 안에서 티켓 순서 변경
+def move_ticket(data, ticket, old_sequence):
+    column_entry = _column_entry(data, ticket.column)
+    # 다른 요청이 이미 옮겨진 상태로 다시 직렬화했다면 한 번 더 옮기지 않음
+    if _ticket_entry(column_entry, ticket)['sequence'] != old_sequence:
+        raise BoardCachePatchError
+    _check_complete_tickets(column_entry, ticket.column_id)
+
+    for entry in column_entry['ticket'].values():
+        if entry['id'] == ticket.id:
+            entry['sequence'] = ticket.sequence
+        elif ticket.sequence <= entry['sequence'] < old_sequence:
+            entry['sequence'] += 1
+        elif old_sequence < entry['sequence'] <= ticket.sequence:
+            entry['sequence'] -= 1
+
+    column_entry['ticket'] = _sort_by_sequence(column_entry['ticket'])
+
+
+# 다른 컬럼으로 티켓 이동
+def move_ticket_to_column(data, ticket, past_column):
+    past_entry = _column_entry(data, past_column)
+    # 다른 요청이 이미 옮겨진 상태로 다시 직렬화했다면 티켓이 원래 컬럼에 없으므로 오류 발생
+    _ticket_entry(past_entry, ticket)
+    destination_entry = _column_entry(data, ticket.column)
+
+    # DB에서는 이미 티켓이 옮겨졌으므로 캐시된 티켓 수와 1씩 차이가 나야 함
+    if len(past_entry['ticket']) - 1 != Ticket.objects.filter(column=past_column).count():
+        raise BoardCachePatchError
+    if len(destination_entry.get('ticket', {})) + 1 != Ticket.objects.filter(column_id=ticket.column_id).count():
+        raise BoardCachePatchError
+    past_sequence = past_entry['ticket'].pop(ticket.title)['sequence']
+
+    # 원래 있던 컬럼에서 티켓이 빠진 자리 뒤의 티켓들은 순서값 -1
+    for entry in past_entry['ticket'].values():
+        if entry['sequence'] > past_sequence:
+            entry['sequence'] -= 1
+    # 남은 티켓이 없다면 ticket 키 자체가 없어야 함
+    if not past_entry['ticket']:
+        del past_entry['ticket']
+
+    # 도착한 컬럼에서 들어갈 자리 이상의 티켓들은 순서값 +1
+    destination_tickets = destination_entry.setdefault('ticket', {})
+    for entry in destination_tickets.values():
+        if entry['sequence'] >= ticket.sequence:
+            entry['sequence'] += 1
+    destination_tickets[ticket.title] = build_ticket_data(ticket)
+
+    destination_entry['ticket'] = _sort_by_sequence(destination_tickets)
+
+
+# 티켓 삭제
+def delete_ticket(data, ticket):
+    column_entry = _column_entry(data, ticket.column)
+    _ticket_entry(column_entry, ticket)
+    _check_unique_ticket_title(ticket, ticket.column_id, ticket.title)
+
+    del column_entry['ticket'][ticket.title]
+    if not column_entry['ticket']:
+        del column_entry['ticket']
+
+    # 티켓이 빠진 자리 뒤의 티켓들은 순서값 -1
+    for entry in column_entry.get('ticket', {}).values():
+        if entry['sequence'] > ticket.sequence:
+            entry['sequence'] -= 1
+
+
+# v2 보드 데이터 수정
+# 컬럼, 티켓을 id로 찾으므로 제목이 같은 컬럼, 티켓이 있어도 DB를 조회하지 않고 수정할 수 있음
+# 순서는 배열 안의 위치이므로 옮겨지는 항목 하나만 빼서 다시 넣으면 됨
+# 인자는 대응하는 v1 함수와 같음
+
+
+# v2 보드 데이터에서 컬럼 항목을 찾음
+def _column_v2_entry(data, column_id):
+    for entry in data['column']:
+        if entry['id'] == column_id:
+            return entry
+
+    raise BoardCachePatchError
+
+
+# v2 보드 데이터에서 티켓 항목을 찾음
+def _ticket_v2_entry(data, ticket):
+    entry = data['ticket'].get(ticket.id)
+    if entry is None:
+        raise BoardCachePatchError
+
+    return entry
+
+
+# 배열에서 값을 빼고 빠진 위치(1부터)를 반환
+def _pop_id(ids, value):
+    try:
+        position = ids.index(value)
+    except ValueError:
+        raise BoardCachePatchError
+
+    del ids[position]
+
+    return position + 1
+
+
+def insert_column_v2(data, column):
+    data['column'].append({
+        'id': column.id,
+        'title': column.title,
+        'version': column.version,
+        'ticket': []
+    })
+
+
+def update_column_v2(data, column, old_title):
+    entry = _column_v2_entry(data, column.id)
+    entry['title'] = column.title
+    entry['version'] = column.version
+
+
+def move_column_v2(data, column, old_sequence, column_count):
+    if len(data['column']) != column_count:
+        raise BoardCachePatchError
+
+    entry = _column_v2_entry(data, column.id)
+    if _pop_id(data['column'], entry) != old_sequence:
+        raise BoardCachePatchError
+
+    data['column'].insert(column.sequence - 1, entry)
+    entry['version'] = column.version
+
+
+def delete_column_v2(data, column):
+    entry = _column_v2_entry(data, column.id)
+    data['column'].remove(entry)
+
+    # 컬럼이 삭제되면 소속된 티켓도 함께 삭제됨
+    for ticket_id in entry['ticket']:
+        data['ticket'].pop(ticket_id, None)
+
+
+def insert_ticket_v2(data, ticket):
+    _column_v2_entry(data, ticket.column_id)['ticket'].append(ticket.id)
+    data['ticket'][ticket.id] = build_ticket_v2_data(ticket)
+
+
+def update_ticket_v2(data, ticket, old_title, old_column_id):
+    # 다른 컬럼으로 옮겨진 경우는 순서 변경에서 처리
+    if (ticket.column_id != old_column_id) or (ticket.id not in data['ticket']):
+        raise BoardCachePatchError
+
+    data['ticket'][ticket.id] = build_ticket_v2_data(ticket)
+
+
+def move_ticket_v2(data, ticket, old_sequence):
+    ticket_ids = _column_v2_entry(data, ticket.column_id)['ticket']
+    if _pop_id(ticket_ids, ticket.id) != old_sequence:
+        raise BoardCachePatchError
+
+    ticket_ids.insert(ticket.sequence - 1, ticket.id)
+    _ticket_v2_entry(data, ticket)['version'] = ticket.version
+
+
+def move_ticket_to_column_v2(data, ticket, past_column):
+    _pop_id(_column_v2_entry(data, past_column.id)['ticket'], ticket.id)
+    _column_v2_entry(data, ticket.column_id)['ticket'].insert(
+        ticket.sequence - 1, ticket.id
+    )
+    _ticket_v2_entry(data, ticket)['version'] = ticket.version
+
+
+def delete_ticket_v2(data, ticket):
+    _pop_id(_column_v2_entry(data, ticket.column_id)['ticket'], ticket.id)
+    data['ticket'].pop(ticket.id, None)
+
+
+# patch_board_cache에 전달되는 v1 수정 함수에 대응하는 v2 수정 함수
+BOARD_V2_PATCHES = {
+    insert_column: insert_column_v2,
+    update_column: update_column_v2,
+    move_column: move_column_v2,
+    delete_column: delete_column_v2,
+    insert_ticket: insert_ticket_v2,
+    update_ticket: update_ticket_v2,
+    move_ticket: move_ticket_v2,
+    move_ticket_to_column: move_ticket_to_column_v2,
+    delete_ticket: delete_ticket_v2,
+}
+
+
+# patch_board_cache에 전달되는 수정 함수에 대응하는 변경 이벤트
+BOARD_EVENTS = {
+    insert_column: events.column_created,
+    update_column: events.column_updated,
+    move_column: events.column_moved,
+    delete_column: events.column_deleted,
+    insert_ticket: events.ticket_created,
+    update_ticket: events.ticket_updated,
+    move_ticket: events.ticket_moved,
+    move_ticket_to_column: events.ticket_moved_to_column,
+    delete_ticket: events.ticket_deleted,
+}
@@ -0,0 +1,253 @@
+from rest_framework.utils.encoders import JSONEncoder
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from .serializers import build_ticket_v2_data
+from config.circuit_breaker import CACHE_UNAVAILABLE, cache_circuit
+
+from threading import Lock
+import asyncio
+import json
+
+
+# 보드 변경 알림
+# 컬럼, 티켓이 바뀌면 바뀐 부분만 담은 이벤트를 보드(팀)별 채널로 발행하고
+# 보드 이벤트 API(/api/v1/boards/board/events/)가 구독 중인 클라이언트에게 Server-Sent Events로 전달함
+# 클라이언트는 보드 전체를 반복해서 조회하지 않고 처음 한 번 조회한 다음 이벤트로 받은 변경 사항만 반영하면 됨
+#
+# 이벤트에는 변경 후의 보드 버전(version)이 들어있음
+# 버전이 1보다 크게 건너뛰었거나 'board.reload' 이벤트를 받으면 보드를 다시 조회해야 함
+#
+# 채널 구현은 BOARD_EVENTS_BACKEND 설정으로 선택
+# InMemoryBoardEvents: 같은 프로세스 안에서만 전달, 개발 서버와 테스트용
+# RedisBoardEvents: Redis pub/sub으로 여러 프로세스, 서버 사이에 전달
+
+
+# 보드 이벤트 채널명
+def board_events_channel(board_id):
+    return f'board:events:{board_id}'
+
+
+# 같은 프로세스 안의 구독자에게만 이벤트를 전달하는 채널
+# 발행은 동기 코드(뷰)의 스레드에서, 구독은 이벤트 루프에서 실행되므로
+# 구독자의 큐에는 해당 이벤트 루프를 통해서만 넣음
+class InMemoryBoardEvents:
+    def __init__(self):
+        self.lock = Lock()
+        # {채널명: {구독, ...}}
+        self.subscribers = {}
+
+    def publish(self, channel, message):
+        with self.lock:
+            subscriptions = list(self.subscribers.get(channel, ()))
+
+        for subscription in subscriptions:
+            subscription.loop.call_soon_threadsafe(
+                subscription.queue.put_nowait, message
+            )
+
+    async def subscribe(self, channel):
+        subscription = InMemorySubscription(self, channel)
+        with self.lock:
+            self.subscribers.setdefault(channel, set()).add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.subscribers.get(subscription.channel, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self.subscribers.pop(subscription.channel, None)
+
+
+class InMemorySubscription:
+    def __init__(self, backend, channel):
+        self.backend = backend
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+
+    # 다음 메시지, timeout초 동안 메시지가 없으면 None
+    async def get(self, timeout):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        self.backend.unsubscribe(self)
+
+
+# Redis pub/sub으로 이벤트를 전달하는 채널
+# 발행은 보드 캐시와 같은 Redis 연결을 사용하고 구독은 구독마다 비동기 연결을 엶
+class RedisBoardEvents:
+    def publish(self, channel, message):
+        from django_redis import get_redis_connection
+
+        get_redis_connection().publish(channel, message)
+
+    async def subscribe(self, channel):
+        from redis.asyncio import Redis
+
+        client = Redis.from_url(settings.CACHES['default']['LOCATION'])
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+
+        return RedisSubscription(client, pubsub, channel)
+
+
+class RedisSubscription:
+    def __init__(self, client, pubsub, channel):
+        self.client = client
+        self.pubsub = pubsub
+        self.channel = channel
+
+    # 다음 메시지, timeout초 동안 메시지가 없으면 None
+    async def get(self, timeout):
+        message = await self.pubsub.get_message(timeout=timeout)
+        if message is None:
+            return None
+
+        return message['data'].decode()
+
+    async def close(self):
+        await self.pubsub.unsubscribe(self.channel)
+        await self.pubsub.aclose()
+        await self.client.aclose()
+
+
+_backend = None
+_backend_lock = Lock()
+
+
+# 설정된 채널 구현
+# 같은 프로세스 안에서는 하나의 객체를 같이 사용함
+def board_events():
+    global _backend
+
+    with _backend_lock:
+        backend_class = import_string(settings.BOARD_EVENTS_BACKEND)
+        if not isinstance(_backend, backend_class):
+            _backend = backend_class()
+
+        return _backend
+
+
+# 보드 이벤트 발행
+# 트랜잭션 안에서 호출되었다면 커밋된 다음에 발행하므로 클라이언트가 커밋 전의 데이터를 조회하지 않음
+def publish_board_event(board, version, event):
+    message = json.dumps(
+        {**event, 'version': version},
+        cls=JSONEncoder,
+        ensure_ascii=False,
+        separators=(',', ':')
+    )
+
+    # 캐시를 사용할 수 없다면 이벤트를 보내지 않음
+    # 커밋된 수정 요청이 실패하지 않도록 하고, 클라이언트는 다시 연결할 때 보드를 다시 조회함
+    def publish():
+        try:
+            with cache_circuit:
+                board_events().publish(board_events_channel(board.id), message)
+        except CACHE_UNAVAILABLE:
+            pass
+
+    transaction.on_commit(publish)
+
+
+# 컬럼, 티켓 변경 이벤트
+# 인자는 boards.caches의 대응하는 수정 함수와 같음
+# 내용은 v2 보드 데이터(/api/v1/boards/board/list/v2/)의 항목과 같은 형식
+
+
+def _column_data(column):
+    return {
+        'id': column.id,
+        'title': column.title,
+        'version': column.version
+    }
+
+
+def _ticket_data(ticket):
+    return {
+        'id': ticket.id,
+        **build_ticket_v2_data(ticket)
+    }
+
+
+def column_created(column):
+    return {
+        'type': 'column.create',
+        'column': _column_data(column),
+        'sequence': column.sequence
+    }
+
+
+def column_updated(column, old_title):
+    return {
+        'type': 'column.update',
+        'column': _column_data(column)
+    }
+
+
+def column_moved(column, old_sequence, column_count):
+    return {
+        'type': 'column.move',
+        'column': _column_data(column),
+        'sequence': column.sequence
+    }
+
+
+def column_deleted(column):
+    return {
+        'type': 'column.delete',
+        'column': column.id
+    }
+
+
+def ticket_created(ticket):
+    return {
+        'type': 'ticket.create',
+        'ticket': _ticket_data(ticket),
+        'column': ticket.column_id,
+        'sequence': ticket.sequence
+    }
+
+
+def ticket_updated(ticket, old_title, old_column_id):
+    return {
+        'type': 'ticket.update',
+        'ticket': _ticket_data(ticket)
+    }
+
+
+def ticket_moved(ticket, old_sequence):
+    return {
+        'type': 'ticket.move',
+        'ticket': _ticket_data(ticket),
+        'column': ticket.column_id,
+        'sequence': ticket.sequence
+    }
+
+
+def ticket_moved_to_column(ticket, past_column):
+    return {
+        **ticket_moved(ticket, None),
+        'past_column': past_column.id
+    }
+
+
+def ticket_deleted(ticket):
+    return {
+        'type': 'ticket.delete',
+        'ticket': ticket.id,
+        'column': ticket.column_id
+    }
+
+
+# 변경 사항을 하나씩 보낼 수 없을 때(일괄 처리 등) 보드 전체를 다시 조회하도록 알림
+def board_reloaded():
+    return {'type': 'board.reload'}
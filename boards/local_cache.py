@@ -0,0 +1,289 @@
+from django.conf import settings
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from config.cache_backends import is_redis_cache
+from config.process_stats import load_process_stats, store_process_stats
+
+from collections import OrderedDict
+from threading import Lock, Thread
+from time import monotonic, sleep
+import json
+
+
+# 프로세스 안의 보드 데이터 캐시(L1)
+# Redis의 보드 캐시(L2) 앞에서 자주 조회되는 보드를 프로세스 메모리에 두고 바로 제공함
+#
+# 보드 데이터는 (팀명, 보드 버전)을 키로 저장함
+# 같은 버전의 데이터는 바뀌지 않으므로 저장된 데이터가 DB와 달라지지 않음
+# BOARD_LOCAL_CACHE_MAX_BYTES(Redis에 저장된 스냅샷 크기 기준)를 넘으면 가장 오래 사용되지 않은 보드부터 삭제(LRU)하고
+# BOARD_LOCAL_CACHE_TTL초가 지난 데이터도 삭제함
+#
+# 팀의 현재 보드 버전도 함께 기억해 조회할 때 Redis에 버전을 묻지 않음
+# 보드가 바뀌면 바뀐 버전이 Redis pub/sub(BOARD_INVALIDATION_CHANNEL)으로 모든 프로세스에 전달되어 바로 반영됨
+# 구독이 끊겨 있는 동안에는 버전을 기억하지 않고 매번 Redis에서 조회하며
+# 메시지가 유실되더라도 BOARD_LOCAL_VERSION_TTL초가 지나면 다시 조회함
+# Redis가 아닌 캐시(config.cache_backends)에서는 pub/sub이 없으므로 버전은 기억하지 않고 보드 데이터만 저장함
+#
+# 조회 결과(hits, misses ...)는 프로세스마다 모아두었다가 BOARD_LOCAL_CACHE_STATS_FLUSH_EVERY번 조회마다 캐시에 저장하고
+# board_local_cache_stats 명령으로 프로세스별로 확인할 수 있음
+
+
+# 보드 버전이 바뀔 때 바뀐 팀명과 버전이 발행되는 채널
+BOARD_INVALIDATION_CHANNEL = 'board:invalidate'
+
+# 프로세스별 조회 결과가 저장되는 캐시 키(config.process_stats)
+LOCAL_CACHE_STATS_KEY_PREFIX = 'board:local:stats:'
+
+
+# 보드 버전이 바뀌었음을 알리는 메시지
+def board_invalidation_message(team_name, version):
+    return json.dumps({'team': team_name, 'version': version}, ensure_ascii=False)
+
+
+class BoardLocalCache:
+    def __init__(self):
+        self.lock = Lock()
+        # {(팀명, 버전): (보드 데이터, 크기, 만료 시각)}, 가장 최근에 사용된 항목이 마지막
+        self.entries = OrderedDict()
+        self.size = 0
+        # {팀명: (버전, 만료 시각)}
+        self.versions = {}
+        # {팀명: 마지막으로 사용 기록을 남긴 시각}
+        self.activity = {}
+        self.counters = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'invalidations': 0,
+            'version_hits': 0,
+            'version_misses': 0,
+        }
+        self.lookups = 0
+        # 무효화 메시지를 구독 중인지 여부
+        self.listening = False
+        self.listener = None
+
+    @property
+    def enabled(self):
+        return settings.BOARD_LOCAL_CACHE_MAX_BYTES > 0
+
+    # 저장된 보드 데이터, 없다면 None
+    # 반환된 데이터는 여러 요청이 함께 사용하므로 수정하면 안 됨
+    def get(self, team_name, version):
+        if not self.enabled:
+            return None
+
+        with self.lock:
+            entry = self.entries.get((team_name, version))
+            if (entry is not None) and (entry[2] <= monotonic()):
+                self._remove((team_name, version))
+                entry = None
+
+            if entry is None:
+                self.counters['misses'] += 1
+            else:
+                self.entries.move_to_end((team_name, version))
+                self.counters['hits'] += 1
+
+        self._count_lookup()
+
+        return None if entry is None else entry[0]
+
+    # size는 보드 데이터의 크기(Redis에 저장된 스냅샷의 바이트 수)
+    def set(self, team_name, version, data, size):
+        if (not self.enabled) or (size > settings.BOARD_LOCAL_CACHE_MAX_BYTES):
+            return
+
+        key = (team_name, version)
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+            self.entries[key] = (data, size, monotonic() + settings.BOARD_LOCAL_CACHE_TTL)
+            self.size += size
+
+            # 가장 오래 사용되지 않은 보드부터 삭제
+            while self.size > settings.BOARD_LOCAL_CACHE_MAX_BYTES:
+                self._remove(next(iter(self.entries)))
+                self.counters['evictions'] += 1
+
+    def _remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.size -= size
+
+    # 기억하고 있는 팀의 현재 보드 버전, 모른다면 None
+    # 무효화 메시지를 구독하고 있을 때만 사용함
+    def get_version(self, team_name):
+        if not self.enabled:
+            return None
+
+        self._ensure_listener()
+
+        with self.lock:
+            cached = self.versions.get(team_name) if self.listening else None
+            if (cached is not None) and (cached[1] <= monotonic()):
+                del self.versions[team_name]
+                cached = None
+
+            self.counters['version_misses' if cached is None else 'version_hits'] += 1
+
+        return None if cached is None else cached[0]
+
+    def set_version(self, team_name, version):
+        if not self.enabled:
+            return
+
+        with self.lock:
+            if not self.listening:
+                return
+
+            # 무효화 메시지로 이미 더 최신 버전을 알고 있다면 유지
+            cached = self.versions.get(team_name)
+            if (cached is not None) and (cached[0] > version) and (cached[1] > monotonic()):
+                return
+
+            self.versions[team_name] = (version, monotonic() + settings.BOARD_LOCAL_VERSION_TTL)
+
+    # 보드 버전이 바뀌었을 때 호출됨
+    # 새 버전을 기억하고 이전 버전의 데이터는 더 이상 조회되지 않으므로 삭제
+    def invalidate(self, team_name, version):
+        with self.lock:
+            self.counters['invalidations'] += 1
+
+            for key in [key for key in self.entries if key[0] == team_name and key[1] < version]:
+                self._remove(key)
+
+            cached = self.versions.get(team_name)
+            if (cached is None) or (cached[0] < version):
+                self.versions[team_name] = (
+                    version, monotonic() + settings.BOARD_LOCAL_VERSION_TTL
+                )
+
+    # 새 버전을 알 수 없을 때(캐시 장애로 버전을 올리지 못함) 호출됨
+    # 팀의 데이터와 버전을 모두 지워 다음 조회가 L1 캐시를 거치지 않도록 함
+    def forget(self, team_name):
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == team_name]:
+                self._remove(key)
+
+            self.versions.pop(team_name, None)
+
+    # 조회할 때마다 사용 기록을 Redis에 남기지 않도록 BOARD_LOCAL_ACTIVITY_INTERVAL초에 한 번만 남김
+    # 남겨야 한다면 True
+    def should_record_activity(self, team_name):
+        if not self.enabled:
+            return True
+
+        now = monotonic()
+        with self.lock:
+            last = self.activity.get(team_name)
+            if (last is not None) and (now - last < settings.BOARD_LOCAL_ACTIVITY_INTERVAL):
+                return False
+
+            self.activity[team_name] = now
+
+        return True
+
+    # 현재 프로세스의 조회 결과와 저장된 보드 수, 크기
+    def stats(self):
+        with self.lock:
+            total = self.counters['hits'] + self.counters['misses']
+
+            return {
+                **self.counters,
+                'hit_ratio': (self.counters['hits'] / total) if total else 0.0,
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'max_bytes': settings.BOARD_LOCAL_CACHE_MAX_BYTES,
+                'listening': self.listening,
+            }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+            self.versions.clear()
+            self.activity.clear()
+            for counter in self.counters:
+                self.counters[counter] = 0
+            self.lookups = 0
+
+    # 일정 횟수마다 조회 결과를 캐시에 저장
+    def _count_lookup(self):
+        with self.lock:
+            self.lookups += 1
+            if self.lookups < settings.BOARD_LOCAL_CACHE_STATS_FLUSH_EVERY:
+                return
+            self.lookups = 0
+
+        self.flush_stats()
+
+    def flush_stats(self):
+        store_process_stats(LOCAL_CACHE_STATS_KEY_PREFIX, self.stats())
+
+    # 무효화 메시지를 구독하는 스레드 시작
+    def _ensure_listener(self):
+        if not is_redis_cache():
+            return
+
+        with self.lock:
+            if (self.listener is not None) and self.listener.is_alive():
+                return
+
+            self.listener = Thread(target=self._listen, daemon=True)
+            self.listener.start()
+
+    def _listen(self):
+        delay = 0.1
+        while True:
+            client = Redis.from_url(
+                settings.CACHES['default']['LOCATION'],
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT
+            )
+            pubsub = client.pubsub()
+
+            try:
+                pubsub.subscribe(BOARD_INVALIDATION_CHANNEL)
+
+                for message in pubsub.listen():
+                    # 구독이 확인된 이후에 발행된 메시지는 모두 받음
+                    if message['type'] == 'subscribe':
+                        with self.lock:
+                            self.listening = True
+                        delay = 0.1
+                        continue
+                    if message['type'] != 'message':
+                        continue
+
+                    try:
+                        data = json.loads(message['data'])
+                        self.invalidate(data['team'], int(data['version']))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+            except RedisError:
+                pass
+            finally:
+                # 구독이 끊긴 동안의 메시지는 받을 수 없으므로 기억하던 버전을 모두 버림
+                with self.lock:
+                    self.listening = False
+                    self.versions.clear()
+
+                pubsub.close()
+                client.close()
+
+            sleep(delay)
+            delay = min(delay * 2, 5)
+
+
+# 프로세스 안의 모든 요청이 함께 사용하는 L1 캐시
+board_local_cache = BoardLocalCache()
+
+
+# 프로세스별 조회 결과
+# {프로세스(호스트명:pid): 조회 결과}
+def board_local_cache_stats():
+    board_local_cache.flush_stats()
+
+    return load_process_stats(LOCAL_CACHE_STATS_KEY_PREFIX)
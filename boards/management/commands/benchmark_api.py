@@ -0,0 +1,395 @@
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+
+from teams.models import Team
+from users.models import User
+from boards.models import Board, Column, Ticket
+from boards.caches import (
+    board_cache_key,
+    board_fresh_key,
+    board_v2_cache_key,
+    board_version_key,
+    get_board_version,
+    invalidate_board_cache
+)
+from boards.local_cache import board_local_cache
+from boards.ranks import ordering_field, ranks_after, spread_ranks
+from config.memberships import membership_cache_key
+
+from statistics import mean, quantiles
+from time import perf_counter
+from uuid import uuid4
+import django
+import json
+import platform
+import tracemalloc
+
+
+# 합성 팀, 보드를 만들고 보드 API를 실제 요청(URL, 미들웨어, 인증, 뷰)으로 호출해
+# 요청별 쿼리 수, 지연 시간(p50, p95, p99), 메모리 사용량(tracemalloc 최대치) 측정
+# 결과를 JSON으로 저장해두면 --compare로 다음 실행 결과와 비교할 수 있음
+#
+#   python manage.py benchmark_api --teams 5 --columns 8 --tickets 200 --output before.json
+#   (변경 후)
+#   python manage.py benchmark_api --teams 5 --columns 8 --tickets 200 --compare before.json
+#
+# 뷰의 캐시 수정, 이벤트 발행은 커밋된 후에 실행되므로(transaction.on_commit) 롤백하지 않고
+# 실제로 저장한 다음 측정이 끝나면 만들었던 데이터와 캐시 키를 삭제함
+
+SCENARIOS = (
+    'board_list_cold',
+    'board_list_warm',
+    'ticket_create',
+    'ticket_sequence_within',
+    'ticket_sequence_across',
+    'column_delete',
+)
+
+
+class Command(BaseCommand):
+    help = '합성 팀, 보드를 만들어 보드 API의 요청별 쿼리 수, 지연 시간, 메모리 사용량을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--teams',
+            type=int,
+            default=3,
+            help='생성할 팀(보드) 수, 요청은 팀마다 번갈아 보냄'
+        )
+        parser.add_argument(
+            '--columns',
+            type=int,
+            default=5,
+            help='보드 하나에 생성할 컬럼 수(2 이상)'
+        )
+        parser.add_argument(
+            '--tickets',
+            type=int,
+            default=100,
+            help='컬럼 하나에 생성할 티켓 수(1 이상)'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=30,
+            help='시나리오마다 측정할 요청 수(2 이상)'
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=3,
+            help='측정 전에 보내는 요청 수(결과에 포함되지 않음)'
+        )
+        parser.add_argument(
+            '--scenario',
+            choices=SCENARIOS,
+            action='append',
+            help='측정할 시나리오(여러 번 지정 가능), 지정하지 않으면 전체'
+        )
+        parser.add_argument(
+            '--output',
+            help='결과를 저장할 JSON 파일 경로, -이면 표준 출력'
+        )
+        parser.add_argument(
+            '--compare',
+            help='비교할 이전 실행 결과(JSON 파일 경로)'
+        )
+
+    def handle(self, *args, **options):
+        if options['columns'] < 2:
+            raise CommandError('--columns는 2 이상이어야 합니다(컬럼 간 이동 측정).')
+        if options['tickets'] < 1:
+            raise CommandError('--tickets는 1 이상이어야 합니다.')
+        if options['iterations'] < 2:
+            raise CommandError('--iterations는 2 이상이어야 합니다(백분위수 계산).')
+
+        baseline = None
+        if options['compare']:
+            try:
+                with open(options['compare']) as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as error:
+                raise CommandError(f'비교할 결과를 읽지 못했습니다: {error}')
+
+        run = {
+            'meta': {
+                'started_at': timezone.now().isoformat(),
+                'teams': options['teams'],
+                'columns': options['columns'],
+                'tickets': options['tickets'],
+                'iterations': options['iterations'],
+                'warmup': options['warmup'],
+                'cache_backend': settings.CACHE_BACKEND,
+                'board_ordering': settings.BOARD_ORDERING,
+                'database': connection.vendor,
+                'python': platform.python_version(),
+                'django': django.get_version(),
+            },
+            'results': {},
+        }
+
+        teams = [
+            self.create_team(options['columns'], options['tickets'])
+            for _ in range(options['teams'])
+        ]
+        try:
+            self.stdout.write(
+                f'[benchmark_api] 팀 {options["teams"]}개, 컬럼 {options["columns"]}개'
+                f', 컬럼 하나에 티켓 {options["tickets"]}개, 측정 {options["iterations"]}회'
+                f'  cache={settings.CACHE_BACKEND}  ordering={settings.BOARD_ORDERING}'
+            )
+
+            for name in options['scenario'] or SCENARIOS:
+                result = self.run_scenario(
+                    teams,
+                    getattr(self, f'scenario_{name}'),
+                    options['iterations'],
+                    options['warmup']
+                )
+                run['results'][name] = result
+                self.report(name, result, (baseline or {}).get('results', {}).get(name))
+        finally:
+            self.delete_teams(teams)
+
+        if options['output'] == '-':
+            self.stdout.write(json.dumps(run, indent=2))
+        elif options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(run, f, indent=2)
+
+    # 합성 팀 생성
+    # 팀 생성 뷰(TeamCreateView)와 같이 팀 그룹, 팀장 그룹을 할당하고 보드를 만듦
+    def create_team(self, column_count, ticket_count):
+        leader = User.objects.create_user(
+            username=f'bench-{uuid4().hex[:8]}',
+            password=uuid4().hex
+        )
+        group = Group.objects.create(name=leader.username)
+        leader.groups.add(Group.objects.get_or_create(name='leader')[0], group)
+
+        team = Team.objects.create(leader=leader, name=leader.username)
+        board = Board.objects.create(team=team)
+
+        column_ranks = spread_ranks(column_count)
+        Column.objects.bulk_create([
+            Column(board=board, title=f'column{i}', sequence=i + 1, rank=column_ranks[i])
+            for i in range(column_count)
+        ])
+        for column in Column.objects.filter(board=board):
+            self.create_tickets(column, ticket_count, leader)
+
+        client = APIClient()
+        token = TokenObtainPairSerializer.get_token(leader)
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token.access_token}')
+
+        return {'leader': leader, 'group': group, 'board': board, 'client': client}
+
+    def create_tickets(self, column, ticket_count, charge):
+        ticket_ranks = spread_ranks(ticket_count)
+        Ticket.objects.bulk_create([
+            Ticket(
+                column=column,
+                # 담당자는 절반의 티켓에만 지정
+                charge=charge if i % 2 else None,
+                title=f'ticket{i}',
+                tag=Ticket.TAG_CHOICES[i % len(Ticket.TAG_CHOICES)][0],
+                sequence=i + 1,
+                rank=ticket_ranks[i],
+                volume=1.0,
+                ended_at='2099-12-31'
+            ) for i in range(ticket_count)
+        ], batch_size=500)
+
+    # 만들었던 팀, 사용자, 그룹(보드, 컬럼, 티켓은 함께 삭제됨)과 캐시 키 삭제
+    def delete_teams(self, teams):
+        keys = []
+        for team in teams:
+            board = team['board']
+            version = get_board_version(board)
+            keys += [
+                board_version_key(board),
+                board_fresh_key(board),
+                membership_cache_key(team['leader'].id),
+            ]
+            if version is not None:
+                keys += [board_cache_key(board, version), board_v2_cache_key(board, version)]
+
+        Team.objects.filter(id__in=[team['board'].team_id for team in teams]).delete()
+        User.objects.filter(id__in=[team['leader'].id for team in teams]).delete()
+        Group.objects.filter(id__in=[team['group'].id for team in teams]).delete()
+
+        cache.delete_many(keys)
+        board_local_cache.clear()
+
+    def columns(self, board):
+        return list(Column.objects.filter(board=board).order_by(ordering_field(), 'id'))
+
+    # 시나리오는 측정할 요청 하나를 준비하는 함수
+    # 측정하지 않는 준비 작업을 마친 다음 (요청 함수, 기대하는 상태 코드)를 반환함
+
+    # 캐시된 보드 데이터가 없는 조회(버전을 올리고 L1 캐시를 비움)
+    def scenario_board_list_cold(self, team, round):
+        invalidate_board_cache(team['board'])
+        board_local_cache.clear()
+
+        return lambda: team['client'].get(reverse('board_list')), 200
+
+    # 캐시된 보드 데이터가 있는 조회
+    def scenario_board_list_warm(self, team, round):
+        return lambda: team['client'].get(reverse('board_list')), 200
+
+    def scenario_ticket_create(self, team, round):
+        request_data = {
+            'title': f'bench-ticket{round}',
+            'tag': Ticket.TAG_CHOICES[0][0],
+            'volume': 1.0,
+            'ended_at': '2099-12-31',
+            'column': self.columns(team['board'])[0].id,
+        }
+
+        return lambda: team['client'].post(reverse('ticket_create'), request_data), 201
+
+    # 첫 번째 컬럼의 마지막 티켓을 맨 앞으로 옮김
+    def scenario_ticket_sequence_within(self, team, round):
+        ticket = Ticket.objects.filter(
+            column=self.columns(team['board'])[0]
+        ).order_by(ordering_field(), 'id').last()
+        request_data = {'ticket': ticket.id, 'column_sequence': 1, 'ticket_sequence': 1}
+
+        return lambda: team['client'].put(reverse('ticket_sequence_update'), request_data), 200
+
+    # 첫 번째, 두 번째 컬럼을 번갈아가며 맨 앞의 티켓을 다른 컬럼의 맨 앞으로 옮김
+    def scenario_ticket_sequence_across(self, team, round):
+        source = round % 2
+        ticket = Ticket.objects.filter(
+            column=self.columns(team['board'])[source]
+        ).order_by(ordering_field(), 'id').first()
+        request_data = {
+            'ticket': ticket.id,
+            'column_sequence': 2 - source,
+            'ticket_sequence': 1,
+        }
+
+        return lambda: team['client'].put(reverse('ticket_sequence_update'), request_data), 200
+
+    # 다른 컬럼과 같은 수의 티켓이 있는 컬럼을 마지막에 추가한 다음 삭제
+    # 추가한 컬럼이 캐시에도 반영되도록 보드 캐시를 다시 만들어둠
+    def scenario_column_delete(self, team, round):
+        board = team['board']
+        columns = self.columns(board)
+        column = Column.objects.create(
+            board=board,
+            title=f'bench-column{round}',
+            sequence=len(columns) + 1,
+            rank=ranks_after(columns[-1].rank, 1)[0]
+        )
+        self.create_tickets(column, Ticket.objects.filter(column=columns[0]).count(), team['leader'])
+
+        invalidate_board_cache(board)
+        team['client'].get(reverse('board_list'))
+
+        return lambda: team['client'].delete(reverse('column_delete'), {'column': column.id}), 200
+
+    # 요청 하나를 보내면서 쿼리 수, 지연 시간 측정
+    def measure(self, request, expected_status):
+        statements = []
+
+        def count_statement(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_statement):
+            started = perf_counter()
+            response = request()
+            elapsed = perf_counter() - started
+
+        self.check_response(response, expected_status)
+
+        return len(statements), elapsed
+
+    # 요청 하나를 보내면서 요청 처리 중 추가로 할당된 메모리의 최대치(바이트) 측정
+    # 추적하는 동안은 느려지므로 지연 시간 측정과 따로 실행함
+    def measure_memory(self, request, expected_status):
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            response = request()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.check_response(response, expected_status)
+
+        return peak - baseline
+
+    def check_response(self, response, expected_status):
+        if response.status_code != expected_status:
+            raise CommandError(
+                f'{response.request["PATH_INFO"]}: 상태 코드 {response.status_code}'
+                f'(기대값 {expected_status}) {response.content[:200]!r}'
+            )
+
+    def run_scenario(self, teams, scenario, iterations, warmup):
+        # 팀마다 번갈아가며 요청
+        def prepare(i):
+            return scenario(teams[i % len(teams)], i // len(teams))
+
+        for i in range(warmup):
+            self.measure(*prepare(i))
+
+        queries = []
+        latencies = []
+        for i in range(warmup, warmup + iterations):
+            statements, elapsed = self.measure(*prepare(i))
+            queries.append(statements)
+            latencies.append(elapsed * 1000)
+
+        peak = self.measure_memory(*prepare(warmup + iterations))
+
+        # 'inclusive'는 측정값 범위 안에서만 보간하므로 p95, p99가 최대값을 넘지 않음
+        percentiles = quantiles(latencies, n=100, method='inclusive')
+
+        return {
+            'iterations': iterations,
+            'queries': {'mean': mean(queries), 'max': max(queries)},
+            'ms': {
+                'mean': mean(latencies),
+                'p50': percentiles[49],
+                'p95': percentiles[94],
+                'p99': percentiles[98],
+                'max': max(latencies),
+            },
+            'peak_kib': peak / 1024,
+        }
+
+    def report(self, name, result, baseline):
+        self.stdout.write(
+            f'{name:<24} queries={result["queries"]["mean"]:>6.1f}'
+            f'  p50 ms={result["ms"]["p50"]:>8.2f}  p95 ms={result["ms"]["p95"]:>8.2f}'
+            f'  p99 ms={result["ms"]["p99"]:>8.2f}  peak KiB={result["peak_kib"]:>9.1f}'
+        )
+
+        if baseline is None:
+            return
+
+        self.stdout.write(
+            f'{"":<24} vs baseline  queries {change(baseline["queries"]["mean"], result["queries"]["mean"])}'
+            f'  p50 ms {change(baseline["ms"]["p50"], result["ms"]["p50"])}'
+            f'  p95 ms {change(baseline["ms"]["p95"], result["ms"]["p95"])}'
+            f'  peak KiB {change(baseline["peak_kib"], result["peak_kib"])}'
+        )
+
+
+# 이전 실행 결과와의 차이
+def change(before, after):
+    if not before:
+        return f'{before:.2f} -> {after:.2f}'
+
+    return f'{before:.2f} -> {after:.2f} ({(after - before) / before:+.1%})'
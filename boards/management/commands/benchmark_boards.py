@@ -0,0 +1,227 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django_redis import get_redis_connection
+
+from teams.models import Team
+from users.models import User
+from boards.models import Board, Column, Ticket
+from boards.sequences import reorder_ticket, relocate_ticket
+from boards.serializers import BoardSerializer
+from boards.snapshots import decode_board, encode_board
+from config.cache_backends import is_redis_cache
+
+from time import perf_counter
+import pickle
+from uuid import uuid4
+
+
+# 벤치마크가 끝나면 만들었던 데이터를 전부 롤백하기 위한 예외
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = '합성 보드 데이터를 만들어 보드 관련 작업의 쿼리 수와 실행 시간을 측정합니다. 측정 후 데이터는 롤백됩니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tickets',
+            type=int,
+            default=5000,
+            help='컬럼 하나에 생성할 티켓 수'
+        )
+        parser.add_argument(
+            '--moves',
+            type=int,
+            default=10,
+            help='측정할 티켓 이동 횟수'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='보드 캐시 형식의 변환 시간을 측정할 반복 횟수'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.benchmark_sequence(options['tickets'], options['moves'])
+                self.benchmark_snapshot(options['tickets'], options['repeat'])
+
+                raise Rollback
+        except Rollback:
+            pass
+
+    # 합성 팀, 보드, 컬럼, 티켓 생성
+    def create_board(self, column_count, ticket_count):
+        leader = User.objects.create_user(
+            username=f'bench-{uuid4().hex[:8]}',
+            password=uuid4().hex
+        )
+        team = Team.objects.create(leader=leader, name=leader.username)
+        board = Board.objects.create(team=team)
+
+        columns = Column.objects.bulk_create([
+            Column(board=board, title=f'column{i}', sequence=i + 1)
+            for i in range(column_count)
+        ])
+        for column in columns:
+            Ticket.objects.bulk_create([
+                Ticket(
+                    column=column,
+                    # 담당자는 절반의 티켓에만 지정
+                    charge=leader if i % 2 else None,
+                    title=f'ticket{i}',
+                    tag=Ticket.TAG_CHOICES[i % len(Ticket.TAG_CHOICES)][0],
+                    sequence=i + 1,
+                    volume=1.0,
+                    ended_at='2099-12-31'
+                ) for i in range(ticket_count)
+            ], batch_size=500)
+
+        return board, list(Column.objects.filter(board=board).order_by('sequence'))
+
+    # 작업 하나를 실행하면서 쿼리 수와 실행 시간을 측정
+    def measure(self, work):
+        statements = []
+
+        # 실행되는 SQL 문마다 기록
+        def count_statement(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_statement):
+            started = perf_counter()
+            work()
+            elapsed = perf_counter() - started
+
+        return len(statements), elapsed
+
+    def report(self, label, statements, elapsed, moves):
+        self.stdout.write(
+            f'{label:<32} statements/move={statements / moves:>8.1f}'
+            f'  ms/move={elapsed * 1000 / moves:>9.2f}'
+        )
+
+    # 티켓 순서 변경: 기존 방식(행마다 save)과 한 번의 UPDATE 방식 비교
+    def benchmark_sequence(self, ticket_count, moves):
+        board, columns = self.create_board(2, ticket_count)
+        source, destination = columns
+
+        self.stdout.write(
+            f'[sequence] 컬럼 하나에 티켓 {ticket_count}개, 이동 {moves}회'
+        )
+
+        # 컬럼의 마지막 티켓을 맨 앞으로 옮김
+        def move_within(mover):
+            for _ in range(moves):
+                ticket = Ticket.objects.get(column=source, sequence=ticket_count)
+                mover(ticket, 1)
+
+        # 컬럼의 첫 티켓을 다른 컬럼의 맨 앞으로 옮긴 다음 다시 되돌림
+        def move_across(mover):
+            for _ in range(moves):
+                ticket = Ticket.objects.get(column=source, sequence=1)
+                mover(ticket, destination, 1)
+                ticket = Ticket.objects.get(column=destination, sequence=1)
+                mover(ticket, source, 1)
+
+        for label, within, across in (
+            ('before (row by row save)', legacy_reorder_ticket, legacy_relocate_ticket),
+            ('after (set based update)', reorder_ticket, relocate_ticket),
+        ):
+            statements, elapsed = self.measure(lambda: move_within(within))
+            self.report(f'{label} within', statements, elapsed, moves)
+
+            statements, elapsed = self.measure(lambda: move_across(across))
+            self.report(f'{label} across', statements, elapsed, moves * 2)
+
+    # 보드 캐시 형식: 딕셔너리를 그대로 pickle하는 방식과 압축된 바이너리 형식 비교
+    def benchmark_snapshot(self, ticket_count, repeat):
+        board, _ = self.create_board(4, ticket_count)
+        data = BoardSerializer(board).data
+
+        self.stdout.write(
+            f'[snapshot] 컬럼 4개, 컬럼 하나에 티켓 {ticket_count}개, 반복 {repeat}회'
+        )
+
+        for label, encode, decode in (
+            ('before (pickled dict)', lambda: data, lambda value: value),
+            ('after (compact snapshot)', lambda: encode_board(data), decode_board),
+        ):
+            key = f'benchmark:snapshot:{board.team.name}'
+            cache.set(key, encode())
+            # 캐시 서버에서 실제로 차지하는 메모리(Redis에서만 확인 가능)
+            memory = (
+                get_redis_connection().memory_usage(cache.make_key(key))
+                if is_redis_cache() else 'n/a'
+            )
+            cache.delete(key)
+
+            started = perf_counter()
+            for _ in range(repeat):
+                value = pickle.dumps(encode())
+            encode_elapsed = perf_counter() - started
+
+            started = perf_counter()
+            for _ in range(repeat):
+                decode(pickle.loads(value))
+            decode_elapsed = perf_counter() - started
+
+            self.stdout.write(
+                f'{label:<32} bytes={len(value):>10}  redis bytes={memory:>10}'
+                f'  encode ms={encode_elapsed * 1000 / repeat:>8.2f}'
+                f'  decode ms={decode_elapsed * 1000 / repeat:>8.2f}'
+            )
+
+
+# 기존 TicketUpdateSequenceView의 같은 컬럼 내 이동 방식
+def legacy_reorder_ticket(target_ticket, sequence):
+    if target_ticket.sequence > sequence:
+        tickets = Ticket.objects.filter(
+            column=target_ticket.column,
+            sequence__gte=sequence,
+            sequence__lt=target_ticket.sequence
+        ).order_by('sequence')
+
+        for ticket in tickets:
+            ticket.sequence += 1
+            ticket.save()
+    else:
+        tickets = Ticket.objects.filter(
+            column=target_ticket.column,
+            sequence__gt=target_ticket.sequence,
+            sequence__lte=sequence
+        ).order_by('sequence')
+
+        for ticket in tickets:
+            ticket.sequence -= 1
+            ticket.save()
+
+    target_ticket.sequence = sequence
+    target_ticket.save()
+
+
+# 기존 TicketUpdateSequenceView의 다른 컬럼으로 이동 방식
+def legacy_relocate_ticket(target_ticket, column, sequence):
+    destination_tickets = Ticket.objects.filter(
+        column=column,
+        sequence__gte=sequence
+    ).order_by('sequence')
+    past_tickets = Ticket.objects.filter(
+        column=target_ticket.column
+    ).order_by('sequence')
+
+    for ticket in destination_tickets:
+        ticket.sequence += 1
+        ticket.save()
+
+    target_ticket.column = column
+    target_ticket.sequence = sequence
+    target_ticket.save()
+
+    for i in range(len(past_tickets)):
+        past_tickets[i].sequence = i + 1
+        past_tickets[i].save()
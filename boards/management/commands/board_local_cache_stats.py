@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from boards.local_cache import board_local_cache_stats
+
+
+# 서버 프로세스별 보드 L1 캐시(boards.local_cache)의 조회 결과 출력
+# 각 프로세스는 BOARD_LOCAL_CACHE_STATS_FLUSH_EVERY번 조회마다 결과를 캐시에 저장하므로 조금 늦게 반영될 수 있음
+class Command(BaseCommand):
+    help = '서버 프로세스별 보드 L1 캐시의 적중률, 저장된 보드 수와 크기를 출력합니다.'
+
+    def handle(self, *args, **options):
+        stats = board_local_cache_stats()
+
+        total = {'hits': 0, 'misses': 0}
+        for process, result in sorted(stats.items()):
+            total['hits'] += result['hits']
+            total['misses'] += result['misses']
+
+            self.stdout.write(
+                f'{process:<32} hits={result["hits"]:>9}  misses={result["misses"]:>9}'
+                f'  hit ratio={result["hit_ratio"]:>6.1%}'
+                f'  evictions={result["evictions"]:>7}  invalidations={result["invalidations"]:>7}'
+                f'  version hits={result["version_hits"]:>9}  version misses={result["version_misses"]:>9}'
+                f'  entries={result["entries"]:>5}  bytes={result["bytes"]:>10}/{result["max_bytes"]}'
+                f'  listening={result["listening"]}'
+            )
+
+        lookups = total['hits'] + total['misses']
+        self.stdout.write(
+            f'{"total":<32} hits={total["hits"]:>9}  misses={total["misses"]:>9}'
+            f'  hit ratio={(total["hits"] / lookups) if lookups else 0.0:>6.1%}'
+        )
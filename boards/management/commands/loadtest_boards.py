@@ -0,0 +1,155 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from statistics import quantiles
+from time import perf_counter
+from urllib.error import URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+import asyncio
+import json
+
+
+# 같은 보드 조회를 동기 뷰(board/list/)와 비동기 뷰(board/list/async/)로 동시에 여러 번 요청해 처리량, 지연 시간 비교
+# 실행 중인 서버에 요청하므로 같은 장비에서 서버 실행 방식만 바꿔가며 측정함
+# 예)
+#   gunicorn config.wsgi -w 4 --threads 8          (WSGI, 워커 4개)
+#   uvicorn config.asgi:application --workers 4    (ASGI, 워커 4개)
+#   python manage.py loadtest_boards --username teamleader1 --password ... --concurrency 500
+# ASGI 서버에서는 동기 뷰가 스레드 풀에서 실행되므로 두 뷰의 차이를 한 서버에서도 비교할 수 있음
+
+PATHS = {
+    'sync': '/api/v1/boards/board/list/',
+    'async': '/api/v1/boards/board/list/async/',
+}
+
+
+class Command(BaseCommand):
+    help = '실행 중인 서버에 보드 조회를 동시에 요청해 동기 뷰와 비동기 뷰의 처리량, 지연 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            default='http://127.0.0.1:8000',
+            help='서버 주소'
+        )
+        parser.add_argument('--username', required=True, help='로그인할 팀 구성원 계정명')
+        parser.add_argument('--password', required=True, help='로그인할 팀 구성원 비밀번호')
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=2000,
+            help='뷰마다 보낼 요청 수'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=200,
+            help='동시에 보내는 요청 수'
+        )
+        parser.add_argument(
+            '--view',
+            choices=list(PATHS),
+            action='append',
+            help='측정할 뷰(여러 번 지정 가능), 지정하지 않으면 전체'
+        )
+
+    def handle(self, *args, **options):
+        url = urlsplit(options['url'])
+        if url.scheme != 'http':
+            raise CommandError('http 주소만 지원합니다.')
+
+        token = self.login(options['url'], options['username'], options['password'])
+
+        self.stdout.write(
+            f'[loadtest] {options["url"]}  요청 {options["requests"]}회'
+            f'  동시 요청 {options["concurrency"]}개'
+        )
+
+        for view in options['view'] or list(PATHS):
+            results, elapsed = asyncio.run(
+                self.run(
+                    url.hostname,
+                    url.port or 80,
+                    PATHS[view],
+                    token,
+                    options['requests'],
+                    options['concurrency']
+                )
+            )
+            self.report(view, results, elapsed)
+
+    # 액세스 토큰 발급
+    def login(self, base_url, username, password):
+        request = Request(
+            f'{base_url}/api/v1/users/login/',
+            data=json.dumps({'username': username, 'password': password}).encode(),
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urlopen(request) as response:
+                return json.loads(response.read())['access']
+        except (URLError, KeyError) as error:
+            raise CommandError(f'로그인하지 못했습니다: {error}')
+
+    # 요청 하나를 보내고 (상태 코드, 지연 시간) 반환
+    # 측정 대상이 서버이므로 HTTP 클라이언트 라이브러리 없이 최소한으로 요청, 응답을 처리함
+    async def fetch(self, host, port, path, token):
+        started = perf_counter()
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            return None, perf_counter() - started
+
+        try:
+            writer.write(
+                f'GET {path} HTTP/1.1\r\n'
+                f'Host: {host}:{port}\r\n'
+                f'Authorization: Bearer {token}\r\n'
+                'Connection: close\r\n\r\n'.encode()
+            )
+            await writer.drain()
+
+            status_line = await reader.readline()
+            # 응답 본문까지 모두 받아야 요청이 끝난 것
+            while await reader.read(64 * 1024):
+                pass
+        except OSError:
+            return None, perf_counter() - started
+        finally:
+            writer.close()
+
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            status = None
+
+        return status, perf_counter() - started
+
+    async def run(self, host, port, path, token, count, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited():
+            async with semaphore:
+                return await self.fetch(host, port, path, token)
+
+        started = perf_counter()
+        results = await asyncio.gather(*[limited() for _ in range(count)])
+
+        return results, perf_counter() - started
+
+    def report(self, view, results, elapsed):
+        latencies = sorted(latency for status, latency in results if status == 200)
+        errors = len(results) - len(latencies)
+
+        if len(latencies) < 2:
+            self.stdout.write(f'{view:<8} 성공한 요청이 부족합니다(오류 {errors}회).')
+            return
+
+        percentiles = quantiles(latencies, n=100)
+        self.stdout.write(
+            f'{view:<8} req/s={len(latencies) / elapsed:>9.1f}'
+            f'  p50 ms={percentiles[49] * 1000:>8.1f}'
+            f'  p95 ms={percentiles[94] * 1000:>8.1f}'
+            f'  p99 ms={percentiles[98] * 1000:>8.1f}'
+            f'  errors={errors}'
+        )
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from boards.tasks import rebalance_ranks
+
+
+class Command(BaseCommand):
+    help = '컬럼, 티켓의 정렬 키를 현재 정렬 방식의 순서대로 다시 고르게 배분하고 순서값을 1부터 다시 매깁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only-long',
+            action='store_true',
+            help='정렬 키가 BOARD_RANK_MAX_LENGTH보다 긴 보드, 컬럼만 재배치'
+        )
+
+    def handle(self, *args, **options):
+        result = rebalance_ranks(force=not options['only_long'])
+
+        self.stdout.write(
+            f"보드 {result['boards']}개의 컬럼, 컬럼 {result['columns']}개의 티켓을 재배치했습니다."
+        )
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:18
+
+from django.db import migrations, models
+
+from boards.ranks import spread_ranks
+
+
+# 기존 컬럼, 티켓의 순서값 순서대로 정렬 키를 채움
+def fill_ranks(apps, schema_editor):
+    Column = apps.get_model('boards', 'Column')
+    Ticket = apps.get_model('boards', 'Ticket')
+
+    for model, parent in ((Column, 'board_id'), (Ticket, 'column_id')):
+        objects = {}
+        for obj in model.objects.order_by(parent, 'sequence', 'id'):
+            objects.setdefault(getattr(obj, parent), []).append(obj)
+
+        for group in objects.values():
+            for obj, rank in zip(group, spread_ranks(len(group))):
+                obj.rank = rank
+
+            model.objects.bulk_update(group, ['rank'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='column',
+            name='rank',
+            field=models.CharField(default='', max_length=255, verbose_name='정렬 키'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='rank',
+            field=models.CharField(default='', max_length=255, verbose_name='정렬 키'),
+        ),
+        migrations.AddIndex(
+            model_name='column',
+            index=models.Index(fields=['board', 'rank'], name='boards_colu_board_i_769e0f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['column', 'rank'], name='boards_tick_column__b2653e_idx'),
+        ),
+        migrations.RunPython(fill_ranks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0003_rank'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['column', 'tag'], name='boards_tick_column__72d3b9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['column', 'ended_at'], name='boards_tick_column__5ebf4a_idx'),
+        ),
+    ]
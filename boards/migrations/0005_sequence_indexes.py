@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0004_ticket_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='column',
+            index=models.Index(fields=['board', 'sequence'], name='boards_colu_board_i_185873_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['column', 'sequence'], name='boards_tick_column__b0c23b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['charge', 'ended_at'], name='boards_tick_charge__f4e9b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['ended_at'], name='boards_tick_ended_a_942350_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0005_sequence_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='column',
+            name='version',
+            field=models.PositiveIntegerField(default=1, verbose_name='버전'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='version',
+            field=models.PositiveIntegerField(default=1, verbose_name='버전'),
+        ),
+    ]
@@ -20,6 +20,21 @@ class Column(models.Model):
     )
     title = models.TextField(verbose_name='제목')
     sequence = models.PositiveIntegerField(verbose_name='순서')
+    # 정렬 키 방식(BOARD_ORDERING = 'rank')에서 순서를 정하는 값
+    rank = models.CharField(
+        max_length=255,
+        default='',
+        verbose_name='정렬 키'
+    )
+    # 수정될 때마다 1씩 올라가는 값, 동시에 수정하는 요청의 충돌 확인(If-Match)에 사용
+    version = models.PositiveIntegerField(default=1, verbose_name='버전')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'rank']),
+            # 보드 조회 시 정렬, 컬럼 순서 변경 시 순서값 범위 조회
+            models.Index(fields=['board', 'sequence']),
+        ]
 
 
 class Ticket(models.Model):
@@ -51,5 +66,26 @@ class Ticket(models.Model):
         verbose_name='태그'
     )
     sequence = models.PositiveIntegerField(verbose_name='순서')
+    # 정렬 키 방식(BOARD_ORDERING = 'rank')에서 순서를 정하는 값
+    rank = models.CharField(
+        max_length=255,
+        default='',
+        verbose_name='정렬 키'
+    )
+    # 수정될 때마다 1씩 올라가는 값, 동시에 수정하는 요청의 충돌 확인(If-Match)에 사용
+    version = models.PositiveIntegerField(default=1, verbose_name='버전')
     volume = models.FloatField(verbose_name='작업량')
     ended_at = models.DateField(verbose_name='마감일')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['column', 'rank']),
+            # 보드 조회 시 정렬, 티켓 순서 변경 시 순서값 범위 조회
+            models.Index(fields=['column', 'sequence']),
+            # 담당자별, 마감일별 티켓 조회
+            models.Index(fields=['charge', 'ended_at']),
+            models.Index(fields=['ended_at']),
+            # 티켓 목록 API의 태그, 마감일 필터
+            models.Index(fields=['column', 'tag']),
+            models.Index(fields=['column', 'ended_at']),
+        ]
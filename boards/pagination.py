@@ -0,0 +1,57 @@
+from django.db.models import Q
+
+import base64
+import binascii
+import json
+
+
+# 키셋 페이지네이션
+# 마지막으로 받은 항목의 정렬 값들을 커서로 넘겨받아 그 다음 항목부터 조회
+# OFFSET을 사용하지 않으므로 뒤쪽 페이지도 앞쪽 페이지와 같은 비용으로 조회됨
+
+
+# 커서가 올바르지 않을 때 발생
+class InvalidCursor(Exception):
+    pass
+
+
+# 정렬 값들을 URL에 넣을 수 있는 문자열로 변환
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(
+        json.dumps(values, separators=(',', ':')).encode()
+    ).decode().rstrip('=')
+
+
+# 커서 문자열을 정렬 값 목록으로 변환
+# types는 정렬 값마다 기대하는 자료형, 개수나 자료형이 다르면 InvalidCursor 발생
+def decode_cursor(cursor, types):
+    try:
+        values = json.loads(
+            base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor('올바르지 않은 커서입니다.')
+
+    if (not isinstance(values, list)) or (len(values) != len(types)):
+        raise InvalidCursor('올바르지 않은 커서입니다.')
+
+    # bool은 int의 하위 클래스이므로 따로 제외
+    for value, value_type in zip(values, types):
+        if (not isinstance(value, value_type)) or isinstance(value, bool):
+            raise InvalidCursor('올바르지 않은 커서입니다.')
+
+    return values
+
+
+# 정렬 필드 목록 기준으로 values보다 뒤에 있는 항목을 찾는 조건
+# (a, b, c) > (1, 2, 3) → a > 1 or (a = 1 and b > 2) or (a = 1 and b = 2 and c > 3)
+def after(fields, values):
+    condition = Q()
+    for i, field in enumerate(fields):
+        step = Q(**{f'{field}__gt': values[i]})
+        for j in range(i):
+            step &= Q(**{fields[j]: values[j]})
+
+        condition |= step
+
+    return condition
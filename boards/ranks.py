@@ -0,0 +1,112 @@
+from django.conf import settings
+
+from math import ceil, log
+
+
+# 정렬 키에 사용하는 문자
+# DB의 문자열 정렬 순서와 같도록 숫자와 소문자만 사용
+RANK_DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+# 정렬 키 방식을 사용하는지 여부
+# 'sequence'(기본값)이면 정수 순서값, 'rank'이면 정렬 키로 순서를 정함
+def is_rank_ordering():
+    return getattr(settings, 'BOARD_ORDERING', 'sequence') == 'rank'
+
+
+# 현재 정렬 방식에서 순서를 정하는 필드명
+def ordering_field():
+    return 'rank' if is_rank_ordering() else 'sequence'
+
+
+# 두 정렬 키 사이에 들어갈 정렬 키를 만듦
+# before가 None이면 맨 앞, after가 None이면 맨 뒤
+# 만들어지는 키는 '0'으로 끝나지 않으므로 언제나 사이에 새 키를 넣을 수 있음
+def rank_between(before=None, after=None):
+    before = before or ''
+    if (after is not None) and (before >= after):
+        raise ValueError(f'정렬 키의 순서가 올바르지 않습니다: {before!r} >= {after!r}')
+
+    rank = ''
+    i = 0
+    while True:
+        low = RANK_DIGITS.index(before[i]) if i < len(before) else 0
+        high = len(RANK_DIGITS)
+        if (after is not None) and (i < len(after)):
+            high = RANK_DIGITS.index(after[i])
+
+        # 사이에 들어갈 문자가 있으면 가운데 문자를 붙이고 끝냄
+        if high - low > 1:
+            return rank + RANK_DIGITS[(low + high) // 2]
+
+        rank += RANK_DIGITS[low]
+        # 이 자리에서 after보다 작아졌으므로 이후로는 after를 신경쓰지 않아도 됨
+        if low < high:
+            after = None
+        i += 1
+
+
+# count개의 정렬 키를 고르게 간격을 두고 만듦
+def spread_ranks(count):
+    if count == 0:
+        return []
+
+    # 키 사이에 충분한 간격이 생기도록 한 자리 여유를 둠
+    width = ceil(log(count + 1, len(RANK_DIGITS))) + 1
+    step = len(RANK_DIGITS) ** width // (count + 1)
+
+    ranks = []
+    for i in range(1, count + 1):
+        value = i * step
+
+        digits = ''
+        for _ in range(width):
+            value, digit = divmod(value, len(RANK_DIGITS))
+            digits = RANK_DIGITS[digit] + digits
+
+        # 끝의 '0'을 제거해도 키 사이의 순서는 그대로 유지됨
+        ranks.append(digits.rstrip('0'))
+
+    return ranks
+
+
+# before 뒤에 이어 붙일 count개의 정렬 키
+# 하나씩 rank_between으로 만들면 키가 계속 길어지므로 before 뒤에 고르게 간격을 둔 키를 붙임
+def ranks_after(before, count):
+    return [(before or '') + rank for rank in spread_ranks(count)]
+
+
+# queryset의 맨 뒤(마지막 정렬 키 last 뒤)에 이어 붙일 count개의 정렬 키
+# 맨 뒤에 계속 추가하면 정렬 키가 몇 번마다 한 글자씩 길어지므로
+# BOARD_RANK_MAX_LENGTH를 넘으면 재배치 작업(rebalance_ranks)을 기다리지 않고 queryset을 바로 다시 배분함
+# 추가할 행들을 잠근 트랜잭션 안에서 호출하면 재배치도 같은 트랜잭션에서 실행됨
+def append_ranks(queryset, last, count=1):
+    def after_last(last):
+        return [rank_between(last)] if count == 1 else ranks_after(last, count)
+
+    ranks = after_last(last)
+    if ranks and (len(ranks[-1]) > settings.BOARD_RANK_MAX_LENGTH):
+        rebalance(queryset)
+        ranks = after_last(
+            queryset.order_by('-rank').values_list('rank', flat=True).first()
+        )
+
+    return ranks
+
+
+# 정렬된 객체들에 정렬 키를 고르게 다시 배분하고 순서값도 1부터 다시 매김
+# 정렬 방식을 바꾸기 전이나 정렬 키가 너무 길어졌을 때 사용
+def rebalance(queryset):
+    objects = list(
+        queryset.order_by(ordering_field(), 'id').only('id', 'rank', 'sequence')
+    )
+
+    for i, (obj, rank) in enumerate(zip(objects, spread_ranks(len(objects)))):
+        obj.rank = rank
+        obj.sequence = i + 1
+
+    queryset.model.objects.bulk_update(
+        objects, ['rank', 'sequence'], batch_size=500
+    )
+
+    return len(objects)
@@ -0,0 +1,237 @@
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+from django.db.models import F
+
+from .models import Column, Ticket
+from .ranks import is_rank_ordering, rank_between, append_ranks
+
+from random import random
+from time import sleep
+
+
+# 순서 변경은 사이에 있는 행들을 한 번의 UPDATE 문으로 옮김
+# 옮겨지는 행의 수와 관계없이 실행되는 쿼리 수가 일정함
+# 정렬 키 방식에서는 옮겨지는 행 하나의 정렬 키만 수정함
+# 트랜잭션은 호출하는 쪽에서 관리
+
+
+# 정렬 키 방식에서 순서값은 정렬 키 순서상의 위치(1부터)
+def column_position(column):
+    if not is_rank_ordering():
+        return column.sequence
+
+    return Column.objects.filter(
+        board_id=column.board_id,
+        rank__lt=column.rank
+    ).count() + 1
+
+
+def ticket_position(ticket):
+    if not is_rank_ordering():
+        return ticket.sequence
+
+    return Ticket.objects.filter(
+        column_id=ticket.column_id,
+        rank__lt=ticket.rank
+    ).count() + 1
+
+
+# 보드에서 해당 순서값(위치)에 있는 컬럼
+def column_at(board, sequence):
+    if not is_rank_ordering():
+        return Column.objects.get(board=board, sequence=sequence)
+
+    try:
+        return Column.objects.filter(board=board).order_by('rank')[sequence - 1]
+    except (IndexError, ValueError):
+        raise Column.DoesNotExist('Column matching query does not exist.')
+
+
+# 맨 뒤에 추가될 객체의 순서값과 정렬 키
+def _next_position(queryset):
+    if not is_rank_ordering():
+        last = queryset.order_by('-sequence').first()
+
+        return (1 if last is None else last.sequence + 1), ''
+
+    last = queryset.order_by('-rank').first()
+    if last is None:
+        return 1, rank_between()
+
+    return queryset.count() + 1, append_ranks(queryset, last.rank)[0]
+
+
+def next_column_position(board):
+    return _next_position(Column.objects.filter(board=board))
+
+
+def next_ticket_position(column):
+    return _next_position(Ticket.objects.filter(column=column))
+
+
+# 컬럼 행들을 트랜잭션이 끝날 때까지 잠금
+# 같은 컬럼에 동시에 티켓을 추가하는 요청들은 순서대로 마지막 순서값을 읽게 됨
+# 잠그는 것은 해당 컬럼 행뿐이므로 다른 컬럼의 작업은 기다리지 않음
+# 교착 상태를 피하기 위해 항상 id 순서로 잠금
+def lock_columns(column_ids):
+    list(
+        Column.objects.select_for_update().filter(
+            id__in=column_ids
+        ).order_by('id').values_list('id', flat=True)
+    )
+
+
+# work를 트랜잭션 안에서 실행하고 DB가 잠겨있어 실패했다면 잠시 기다렸다가 다시 실행
+# SQLite처럼 행 잠금(select_for_update)을 지원하지 않는 DB는 쓰기마다 DB 전체를 잠그므로
+# 동시에 쓰는 요청 중 일부가 'database is locked' 오류를 받을 수 있음
+# 바깥에 이미 트랜잭션이 있다면 다시 시도해도 소용없으므로 그대로 실행
+def atomic_with_retry(work):
+    if connection.in_atomic_block:
+        with transaction.atomic():
+            return work()
+
+    attempts = settings.BOARD_WRITE_RETRY_ATTEMPTS
+    for attempt in range(attempts):
+        try:
+            with transaction.atomic():
+                return work()
+        except OperationalError as error:
+            if ('locked' not in f'{error}') or (attempt == attempts - 1):
+                raise
+
+        # 동시에 실패한 요청들이 한꺼번에 다시 시도하지 않도록 대기 시간을 무작위로 분산
+        sleep(settings.BOARD_WRITE_RETRY_DELAY * (attempt + 1) * random())
+
+
+# 검증이 끝난 티켓 시리얼라이저를 컬럼의 맨 뒤 순서로 저장
+# 컬럼을 잠근 다음 마지막 순서값을 읽고 저장까지 한 트랜잭션에서 실행하므로
+# 동시에 추가된 티켓들이 같은 순서값을 받지 않음
+def append_ticket(serializer, column):
+    def save():
+        lock_columns([column.id])
+        sequence, rank = next_ticket_position(column)
+
+        return serializer.save(sequence=sequence, rank=rank)
+
+    return atomic_with_retry(save)
+
+
+# 정렬 키 방식에서 위치 sequence에 들어갈 정렬 키와 실제로 들어가게 될 위치
+# 옮겨지는 객체를 뺀 나머지 중 앞, 뒤 객체의 정렬 키 사이 값
+def _rank_at(queryset, obj, sequence):
+    others = queryset.exclude(id=obj.id)
+    # 범위를 벗어난 위치는 맨 앞이나 맨 뒤로 맞춤
+    sequence = min(max(sequence, 1), others.count() + 1)
+
+    ranks = list(
+        others.order_by('rank').values_list(
+            'rank', flat=True
+        )[max(sequence - 2, 0):sequence]
+    )
+
+    if sequence == 1:
+        return rank_between(None, ranks[0] if ranks else None), sequence
+
+    return rank_between(ranks[0], ranks[1] if len(ranks) > 1 else None), sequence
+
+
+# 보드 안에서 컬럼 순서 변경
+def reorder_column(column, sequence):
+    if is_rank_ordering():
+        column.rank, column.sequence = _rank_at(
+            Column.objects.filter(board_id=column.board_id), column, sequence
+        )
+        column.save(update_fields=['rank'])
+
+        return
+
+    # 순서를 변경할 컬럼의 순서가 원래 있던 자리보다 왼쪽으로 갈 때(순서값이 작아질 때)
+    # 사이에 있는 컬럼들의 순서값을 1씩 상승
+    if column.sequence > sequence:
+        Column.objects.filter(
+            board_id=column.board_id,
+            sequence__gte=sequence,
+            sequence__lt=column.sequence
+        ).update(sequence=F('sequence') + 1)
+    # 순서를 변경할 컬럼의 순서가 원래 있던 자리보다 오른쪽으로 갈 때(순서값이 커질 때)
+    # 사이에 있는 컬럼들의 순서값을 1씩 감소
+    else:
+        Column.objects.filter(
+            board_id=column.board_id,
+            sequence__gt=column.sequence,
+            sequence__lte=sequence
+        ).update(sequence=F('sequence') - 1)
+
+    # 순서를 변경할 컬럼의 순서를 변경하고자 했던 순서로 변경
+    column.sequence = sequence
+    column.save(update_fields=['sequence'])
+
+
+# 같은 컬럼 안에서 티켓 순서 변경
+def reorder_ticket(ticket, sequence):
+    if is_rank_ordering():
+        ticket.rank, ticket.sequence = _rank_at(
+            Ticket.objects.filter(column_id=ticket.column_id), ticket, sequence
+        )
+        ticket.save(update_fields=['rank'])
+
+        return
+
+    # 순서를 변경할 티켓의 순서가 원래 있던 자리보다 왼쪽으로 갈 때(순서값이 작아질 때)
+    if ticket.sequence > sequence:
+        Ticket.objects.filter(
+            column_id=ticket.column_id,
+            sequence__gte=sequence,
+            sequence__lt=ticket.sequence
+        ).update(sequence=F('sequence') + 1)
+    # 순서를 변경할 티켓의 순서가 원래 있던 자리보다 오른쪽으로 갈 때(순서값이 커질 때)
+    else:
+        Ticket.objects.filter(
+            column_id=ticket.column_id,
+            sequence__gt=ticket.sequence,
+            sequence__lte=sequence
+        ).update(sequence=F('sequence') - 1)
+
+    ticket.sequence = sequence
+    ticket.save(update_fields=['sequence'])
+
+
+# 다른 컬럼으로 티켓 이동
+def relocate_ticket(ticket, column, sequence):
+    if is_rank_ordering():
+        ticket.rank, ticket.sequence = _rank_at(
+            Ticket.objects.filter(column=column), ticket, sequence
+        )
+        ticket.column = column
+        ticket.save(update_fields=['column', 'rank'])
+
+        return
+
+    past_column_id = ticket.column_id
+    past_sequence = ticket.sequence
+
+    # 도착할 컬럼에서 티켓이 들어갈 자리 이상의 티켓들의 순서값을 전부 +1
+    Ticket.objects.filter(
+        column=column,
+        sequence__gte=sequence
+    ).update(sequence=F('sequence') + 1)
+
+    # 순서를 수정할 티켓의 컬럼값과 순서값을 수정
+    ticket.column = column
+    ticket.sequence = sequence
+    ticket.save(update_fields=['column', 'sequence'])
+
+    # 원래 있던 컬럼에서 티켓이 빠진 자리를 메움
+    close_ticket_gap(past_column_id, past_sequence)
+
+
+# 티켓이 빠진 자리 뒤의 티켓들의 순서값을 전부 -1
+# 정렬 키 방식에서는 위치가 자동으로 당겨지므로 수정할 필요 없음
+def close_ticket_gap(column_id, sequence):
+    if is_rank_ordering():
+        return
+
+    Ticket.objects.filter(
+        column_id=column_id,
+        sequence__gt=sequence
+    ).update(sequence=F('sequence') - 1)
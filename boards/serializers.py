@@ -1,18 +1,35 @@
 from rest_framework import serializers
 
+from config.metrics import measure_serialization
+
 from .models import Board, Column, Ticket
+from .ranks import is_rank_ordering, ordering_field
 
 
 class ColumnSerializer(serializers.ModelSerializer):
     class Meta:
         model = Column
         fields = '__all__'
+        # 정렬 키는 순서 변경 API에서만 수정되고 버전은 수정될 때마다 자동으로 올라감
+        read_only_fields = ['rank', 'version']
 
 
 class TicketSerializer(serializers.ModelSerializer):
     class Meta:
         model = Ticket
         fields = '__all__'
+        # 순서값, 정렬 키는 티켓을 추가할 때 배정되고 순서 변경 API에서만 수정됨
+        # 버전은 수정될 때마다 자동으로 올라감
+        read_only_fields = ['sequence', 'rank', 'version']
+
+    # 요청에 들어온 필드만 저장
+    # 다른 요청이 바꾼 컬럼, 순서값 등을 읽어둔 값으로 덮어쓰지 않음
+    def update(self, instance, validated_data):
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=list(validated_data))
+
+        return instance
 
 
 class BoardSerializer(serializers.ModelSerializer):
@@ -49,6 +66,12 @@ class BoardSerializer(serializers.ModelSerializer):
         #     }
         # }
 
+    # 직렬화 시간을 요청별 측정 결과에 기록(config.metrics)
+    @property
+    def data(self):
+        with measure_serialization():
+            return super().data
+
     # team 필드에 어떤 값을 반환할지 결정하는 메서드
     def get_team(self, obj):
         # 시리얼라이저에 들어온 보드 객체에서 팀명을 가져옴
@@ -57,40 +80,167 @@ class BoardSerializer(serializers.ModelSerializer):
     # column 필드에 어떤 값을 반환할지 결정하는 메서드
     def get_column(self, obj):
         # 시리얼라이저에 들어온 보드 객체에 소속된 모든 컬럼을 오름차순으로 정렬
-        columns = Column.objects.filter(board=obj).order_by('sequence')
-
-        column_data = {}
-        for column in columns:
-            column_data[column.title] = {
-                'id': column.id,
-                'sequence': column.sequence
-            }
-
-            ticket_data = {}
-            # 현재 컬럼에 해당하는 모든 티켓을 오름차순으로 정렬
-            tickets = Ticket.objects.filter(column=column).order_by('sequence')
-            for ticket in tickets:
-                ticket_data[ticket.title] = {}
-
-                try:
-                    ticket_data[ticket.title] = {
-                        'id': ticket.id,
-                        'tag': ticket.get_tag_display(),
-                        'charge': ticket.charge.username,
-                        'volume': ticket.volume,
-                        'ended_at': ticket.ended_at,
-                        'sequence': ticket.sequence
-                    }
-                except AttributeError:
-                    ticket_data[ticket.title] = {
-                        'id': ticket.id,
-                        'tag': ticket.get_tag_display(),
-                        'charge': None,
-                        'volume': ticket.volume,
-                        'ended_at': ticket.ended_at,
-                        'sequence': ticket.sequence
-                    }
-
-                column_data[column.title]['ticket'] = ticket_data
-
-        return column_data
+        columns = list(Column.objects.filter(board=obj).order_by(ordering_field(), 'id'))
+        # 보드에 소속된 모든 티켓을 담당자 정보와 함께 한 번에 가져옴
+        # 컬럼마다 티켓을 따로 조회하지 않으므로 컬럼, 티켓 수와 관계없이 쿼리 수가 일정함
+        # (컬럼, 순서) 인덱스 순서대로 정렬해서 정렬용 임시 테이블을 만들지 않음
+        tickets = Ticket.objects.filter(
+            column_id__in=[column.id for column in columns]
+        ).select_related('charge').order_by('column_id', ordering_field(), 'id')
+
+        return build_column_data(columns, tickets)
+
+
+# 티켓 객체 하나를 보드 데이터에 들어갈 딕셔너리 형태로 변환
+def build_ticket_data(ticket):
+    return {
+        'id': ticket.id,
+        'tag': ticket.get_tag_display(),
+        # 담당자가 없는 티켓은 None
+        'charge': ticket.charge.username if ticket.charge is not None else None,
+        'volume': ticket.volume,
+        'ended_at': ticket.ended_at,
+        'sequence': ticket.sequence
+    }
+
+
+# 정렬된 컬럼, 티켓 목록을 한 번 순회하며 보드의 column 데이터로 묶음
+# 티켓은 순서(sequence, 정렬 키 방식에서는 rank) 오름차순으로 정렬된 상태로 들어와야 함
+def build_column_data(columns, tickets):
+    # 정렬 키 방식에서는 정렬된 위치(1부터)를 순서값으로 내보냄
+    rank_ordering = is_rank_ordering()
+    positions = {}
+
+    # 컬럼 id별로 티켓 데이터를 모아둠
+    # 티켓 목록이 순서대로 들어오므로 컬럼 내부의 순서도 유지됨
+    column_tickets = {}
+    for ticket in tickets:
+        if rank_ordering:
+            positions[ticket.column_id] = positions.get(ticket.column_id, 0) + 1
+            ticket.sequence = positions[ticket.column_id]
+
+        column_tickets.setdefault(ticket.column_id, {})[ticket.title] = build_ticket_data(ticket)
+
+    column_data = {}
+    for i, column in enumerate(columns):
+        if rank_ordering:
+            column.sequence = i + 1
+
+        column_data[column.title] = {
+            'id': column.id,
+            'sequence': column.sequence
+        }
+
+        # 티켓이 없는 컬럼에는 ticket 키를 만들지 않음
+        if column.id in column_tickets:
+            column_data[column.title]['ticket'] = column_tickets[column.id]
+
+    return column_data
+
+
+# 여러 보드를 한꺼번에 직렬화
+# 보드 수와 관계없이 컬럼, 티켓을 한 번씩만 조회하며 BoardSerializer와 같은 형태의 데이터를 만듦
+# boards는 팀 정보를 함께 가져온(select_related('team')) 보드 목록
+@measure_serialization()
+def build_boards_data(boards):
+    boards = list(boards)
+    board_ids = [board.id for board in boards]
+
+    board_columns = {}
+    column_ids = []
+    for column in Column.objects.filter(board_id__in=board_ids).order_by(ordering_field(), 'id'):
+        board_columns.setdefault(column.board_id, []).append(column)
+        column_ids.append(column.id)
+
+    # (컬럼, 순서) 인덱스 순서대로 정렬해서 정렬용 임시 테이블을 만들지 않음
+    column_tickets = {}
+    tickets = Ticket.objects.filter(
+        column_id__in=column_ids
+    ).select_related('charge').order_by('column_id', ordering_field(), 'id')
+    for ticket in tickets:
+        column_tickets.setdefault(ticket.column_id, []).append(ticket)
+
+    boards_data = {}
+    for board in boards:
+        columns = board_columns.get(board.id, [])
+
+        boards_data[board.id] = {
+            'team': board.team.name,
+            'column': build_column_data(
+                columns,
+                [ticket for column in columns for ticket in column_tickets.get(column.id, [])]
+            )
+        }
+
+    return boards_data
+
+
+# v2 보드 데이터(/api/v1/boards/board/list/v2/)
+# 컬럼, 티켓을 제목이 아닌 id로 구분하므로 제목이 같은 컬럼, 티켓도 모두 포함됨
+# {
+#    'team': '팀명',
+#    'column': [
+#        {
+#            'id': 컬럼 id,
+#            'title': '컬럼명',
+#            'version': 컬럼 버전,
+#            'ticket': [티켓 id, ...]
+#        },
+#        ...
+#    ],
+#    'ticket': {
+#        티켓 id: {
+#            'title': '티켓명',
+#            'tag': 태그,
+#            'charge': 담당자명,
+#            'volume': 작업량,
+#            'ended_at': 마감일,
+#            'version': 티켓 버전
+#        },
+#        ...
+#    }
+# }
+# 컬럼, 티켓의 순서값은 배열 안의 위치(1부터)이므로 따로 저장하지 않음
+
+
+# 티켓 객체 하나를 v2 보드 데이터의 티켓 항목으로 변환
+def build_ticket_v2_data(ticket):
+    return {
+        'title': ticket.title,
+        'tag': ticket.get_tag_display(),
+        # 담당자가 없는 티켓은 None
+        'charge': ticket.charge.username if ticket.charge is not None else None,
+        'volume': ticket.volume,
+        'ended_at': ticket.ended_at,
+        'version': ticket.version
+    }
+
+
+# 보드 하나를 v2 보드 데이터로 직렬화
+# 컬럼, 티켓을 한 번씩만 조회함
+@measure_serialization()
+def build_board_v2_data(board):
+    columns = []
+    column_tickets = {}
+    for column in Column.objects.filter(board=board).order_by(ordering_field(), 'id'):
+        column_tickets[column.id] = []
+        columns.append({
+            'id': column.id,
+            'title': column.title,
+            'version': column.version,
+            'ticket': column_tickets[column.id]
+        })
+
+    ticket_data = {}
+    tickets = Ticket.objects.filter(
+        column_id__in=list(column_tickets)
+    ).select_related('charge').order_by('column_id', ordering_field(), 'id')
+    for ticket in tickets:
+        column_tickets[ticket.column_id].append(ticket.id)
+        ticket_data[ticket.id] = build_ticket_v2_data(ticket)
+
+    return {
+        'team': board.team.name,
+        'column': columns,
+        'ticket': ticket_data
+    }
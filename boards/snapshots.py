@@ -0,0 +1,210 @@
+from django.conf import settings
+
+from config.metrics import measure_serialization
+
+from array import array
+from datetime import date
+import struct
+import sys
+import zlib
+
+
+# 보드 데이터를 캐시에 저장하기 위한 압축된 바이너리 형식
+# 딕셔너리를 그대로 pickle하면 티켓마다 키 이름('id', 'tag', ...)과 태그 표시명, 담당자명이 반복해서 저장됨
+# 여기서는 문자열을 한 번씩만 저장하고 값들은 필드별 배열(array)로 묶어서 저장함
+# 데이터가 BOARD_SNAPSHOT_COMPRESS_MIN_SIZE 바이트 이상이면 zlib으로 한 번 더 압축함
+#
+# 형식
+# 헤더: 'BS', 형식 버전(1바이트), 플래그(1바이트, 1이면 zlib 압축)
+# 본문: 문자열 수, 컬럼 수, 티켓 수, 팀명(문자열 번호)
+#       문자열 길이 배열, UTF-8 문자열들
+#       컬럼별 배열(id, 순서값, 제목, 티켓 수)
+#       티켓별 배열(id, 제목, 태그, 담당자, 작업량, 마감일, 순서값)
+# 숫자는 모두 리틀 엔디언으로 저장
+
+
+SNAPSHOT_MAGIC = b'BS'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_COMPRESSED = 1
+
+_HEADER = struct.Struct('<2sBB')
+_COUNTS = struct.Struct('<IIII')
+
+# 담당자가 없는 티켓의 담당자 문자열 번호
+_NO_CHARGE = 0xFFFFFFFF
+
+# (필드, array 타입 코드)
+_COLUMN_FIELDS = (
+    ('id', 'q'),
+    ('sequence', 'q'),
+    ('title', 'I'),
+    ('tickets', 'I'),
+)
+_TICKET_FIELDS = (
+    ('id', 'q'),
+    ('title', 'I'),
+    ('tag', 'I'),
+    ('charge', 'I'),
+    ('volume', 'd'),
+    ('ended_at', 'I'),
+    ('sequence', 'q'),
+)
+
+
+# 압축된 형식이 아닌 보드 데이터를 읽으려 할 때 발생
+class SnapshotError(ValueError):
+    pass
+
+
+# 배열을 리틀 엔디언 바이트로 변환
+def _array_bytes(values):
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values.tobytes()
+
+
+# 바이트를 읽어 배열로 변환하고 다음 위치를 반환
+def _read_array(typecode, body, offset, count):
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    values.frombytes(body[offset:end])
+
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values, end
+
+
+# 마감일을 서수(0001-01-01이 1)로 변환
+def _date_ordinal(value):
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+
+    return value.toordinal()
+
+
+# 보드 데이터(BoardSerializer의 결과)를 바이트로 변환
+@measure_serialization()
+def encode_board(data):
+    strings = {}
+
+    # 같은 문자열은 같은 번호를 사용
+    def intern(value):
+        return strings.setdefault(value, len(strings))
+
+    team = intern(data['team'])
+
+    columns = {field: array(typecode) for field, typecode in _COLUMN_FIELDS}
+    tickets = {field: array(typecode) for field, typecode in _TICKET_FIELDS}
+
+    for title, column in data['column'].items():
+        column_tickets = column.get('ticket', {})
+
+        columns['id'].append(column['id'])
+        columns['sequence'].append(column['sequence'])
+        columns['title'].append(intern(title))
+        columns['tickets'].append(len(column_tickets))
+
+        for ticket_title, ticket in column_tickets.items():
+            tickets['id'].append(ticket['id'])
+            tickets['title'].append(intern(ticket_title))
+            tickets['tag'].append(intern(ticket['tag']))
+            tickets['charge'].append(
+                _NO_CHARGE if ticket['charge'] is None else intern(ticket['charge'])
+            )
+            tickets['volume'].append(ticket['volume'])
+            tickets['ended_at'].append(_date_ordinal(ticket['ended_at']))
+            tickets['sequence'].append(ticket['sequence'])
+
+    encoded = [value.encode() for value in strings]
+
+    body = b''.join([
+        _COUNTS.pack(len(encoded), len(columns['id']), len(tickets['id']), team),
+        _array_bytes(array('I', [len(value) for value in encoded])),
+        *encoded,
+        *[_array_bytes(columns[field]) for field, _ in _COLUMN_FIELDS],
+        *[_array_bytes(tickets[field]) for field, _ in _TICKET_FIELDS],
+    ])
+
+    flags = 0
+    if len(body) >= settings.BOARD_SNAPSHOT_COMPRESS_MIN_SIZE:
+        body = zlib.compress(body, settings.BOARD_SNAPSHOT_COMPRESS_LEVEL)
+        flags |= SNAPSHOT_COMPRESSED
+
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags) + body
+
+
+# encode_board로 만든 바이트를 보드 데이터로 변환
+# 키의 순서까지 BoardSerializer의 결과와 같음
+@measure_serialization()
+def decode_board(value):
+    if len(value) < _HEADER.size:
+        raise SnapshotError('보드 데이터의 형식이 올바르지 않습니다.')
+
+    magic, version, flags = _HEADER.unpack_from(value)
+    if (magic != SNAPSHOT_MAGIC) or (version != SNAPSHOT_VERSION):
+        raise SnapshotError('보드 데이터의 형식이 올바르지 않습니다.')
+
+    body = value[_HEADER.size:]
+    if flags & SNAPSHOT_COMPRESSED:
+        body = zlib.decompress(body)
+
+    string_count, column_count, ticket_count, team = _COUNTS.unpack_from(body)
+    offset = _COUNTS.size
+
+    lengths, offset = _read_array('I', body, offset, string_count)
+    strings = []
+    for length in lengths:
+        strings.append(body[offset:offset + length].decode())
+        offset += length
+
+    columns = {}
+    for field, typecode in _COLUMN_FIELDS:
+        columns[field], offset = _read_array(typecode, body, offset, column_count)
+
+    tickets = {}
+    for field, typecode in _TICKET_FIELDS:
+        tickets[field], offset = _read_array(typecode, body, offset, ticket_count)
+
+    column_data = {}
+    start = 0
+    for i in range(column_count):
+        entry = {
+            'id': columns['id'][i],
+            'sequence': columns['sequence'][i]
+        }
+
+        # 티켓이 없는 컬럼에는 ticket 키를 만들지 않음
+        end = start + columns['tickets'][i]
+        if end > start:
+            entry['ticket'] = {
+                strings[tickets['title'][j]]: {
+                    'id': tickets['id'][j],
+                    'tag': strings[tickets['tag'][j]],
+                    'charge': (
+                        None if tickets['charge'][j] == _NO_CHARGE
+                        else strings[tickets['charge'][j]]
+                    ),
+                    'volume': tickets['volume'][j],
+                    'ended_at': date.fromordinal(tickets['ended_at'][j]),
+                    'sequence': tickets['sequence'][j]
+                } for j in range(start, end)
+            }
+        start = end
+
+        column_data[strings[columns['title'][i]]] = entry
+
+    return {
+        'team': strings[team],
+        'column': column_data
+    }
+
+
+# 캐시에서 읽은 값을 보드 데이터로 변환
+# 이전 형식(딕셔너리 그대로 pickle)으로 캐싱된 값도 그대로 읽을 수 있음
+def load_board(value):
+    if (value is None) or isinstance(value, dict):
+        return value
+
+    return decode_board(value)
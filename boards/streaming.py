@@ -0,0 +1,90 @@
+from rest_framework.utils.encoders import JSONEncoder
+
+from django.conf import settings
+
+from .models import Column, Ticket
+from .ranks import is_rank_ordering, ordering_field
+from .serializers import build_ticket_data
+
+import json
+
+
+# 매우 큰 보드를 스트리밍으로 응답하기 위한 JSON 생성기
+# 보드 전체를 딕셔너리로 만들지 않고 티켓을 서버 측 커서로 조금씩 읽으면서 바로 JSON 문자열로 내보냄
+# 보드 크기와 관계없이 메모리 사용량이 일정함
+# 결과는 BoardListView의 일반 응답({'data': 보드 데이터})과 같은 형태
+#
+# 일반 응답에서는 제목이 같은 컬럼, 티켓이 딕셔너리에서 하나로 합쳐지지만 여기서는 같은 키가 여러 번 나옴
+# JSON을 읽을 때 같은 키는 첫 위치에 마지막 값으로 합쳐지므로 읽은 결과는 같음
+
+
+# DRF의 JSONRenderer와 같은 방식으로 값을 JSON 문자열로 변환
+def _dumps(value):
+    return json.dumps(
+        value,
+        cls=JSONEncoder,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(',', ':')
+    )
+
+
+# 보드 데이터를 JSON 문자열 조각으로 나눠 반환
+def _board_json_parts(board, chunk_size):
+    rank_ordering = is_rank_ordering()
+
+    # 컬럼은 수가 적으므로 한 번에 가져옴
+    columns = list(Column.objects.filter(board=board).order_by(ordering_field(), 'id'))
+
+    yield '{"data":{"team":' + _dumps(board.team.name) + ',"column":{'
+
+    for i, column in enumerate(columns):
+        if i:
+            yield ','
+
+        sequence = i + 1 if rank_ordering else column.sequence
+        yield _dumps(column.title) + ':{"id":' + _dumps(column.id) + ',"sequence":' + _dumps(sequence)
+
+        # 티켓은 컬럼별로 (컬럼, 순서) 인덱스 순서대로 조금씩 읽음
+        tickets = Ticket.objects.filter(
+            column_id=column.id
+        ).select_related('charge').order_by(
+            ordering_field(), 'id'
+        ).iterator(chunk_size=chunk_size)
+
+        position = 0
+        for ticket in tickets:
+            position += 1
+            # 정렬 키 방식에서는 정렬된 위치(1부터)를 순서값으로 내보냄
+            if rank_ordering:
+                ticket.sequence = position
+
+            # 티켓이 없는 컬럼에는 ticket 키를 만들지 않음
+            yield ',"ticket":{' if position == 1 else ','
+            yield _dumps(ticket.title) + ':' + _dumps(build_ticket_data(ticket))
+
+        if position:
+            yield '}'
+
+        yield '}'
+
+    yield '}}}'
+
+
+# 작은 조각들을 BOARD_STREAM_BUFFER_SIZE 정도의 크기로 묶어서 내보냄
+def stream_board_json(board, chunk_size=None):
+    chunk_size = chunk_size or settings.BOARD_STREAM_CHUNK_SIZE
+
+    buffer = []
+    size = 0
+    for part in _board_json_parts(board, chunk_size):
+        buffer.append(part)
+        size += len(part)
+
+        if size >= settings.BOARD_STREAM_BUFFER_SIZE:
+            yield ''.join(buffer).encode()
+            buffer = []
+            size = 0
+
+    if buffer:
+        yield ''.join(buffer).encode()
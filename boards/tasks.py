@@ -1,20 +1,142 @@
-from celery import shared_task
+from celery import chord, shared_task
 
-from django.core.cache import cache
+from django.conf import settings
+from django.db.models.functions import Length
 
-from teams.models import Team
-from .models import Board
-from .serializers import BoardSerializer
+from .models import Board, Column, Ticket
+from .caches import store_boards_data, invalidate_board_cache
+from .serializers import build_boards_data
+from .ranks import rebalance
+from .sequences import atomic_with_retry, lock_columns
+from .activity import select_preload_boards
 
+from math import ceil
+from time import time
 
-# 매일 오전 08시 50분에 자동적으로 보드를 올려놓을 수 있도록 설정
+
+# 평일 오전 09시에 자동적으로 보드를 올려놓을 수 있도록 설정
+# 사용 기록을 바탕으로 BOARD_PRELOAD_POLICY에 따라 캐싱할 보드를 고른 다음
+# BOARD_PRELOAD_CONCURRENCY개의 묶음으로 나눠 하위 작업들이 동시에 캐싱하고
+# 모든 하위 작업이 끝나면 summarize_preload에서 결과를 모음
 @shared_task
 def preload_boards():
-    # 전체 팀을 가져옴
-    teams = Team.objects.all()
-    # 팀을 순회하면서 각 팀의 보드를 직렬화해 캐싱
-    # 컬럼이나 티켓 데이터는 보드 시리얼라이저에서 처리됨
-    for team in teams:
-        serializer = BoardSerializer(Board.objects.get(team=team))
-
-        cache.set(f'{team.name}', serializer.data)
+    started_at = time()
+    all_board_ids = list(Board.objects.order_by('id').values_list('id', flat=True))
+    board_ids = select_preload_boards(all_board_ids)
+    if not board_ids:
+        return summarize_preload([], started_at)
+
+    # 보드 id를 연속된 구간으로 나눔
+    batch_count = min(settings.BOARD_PRELOAD_CONCURRENCY, len(board_ids))
+    size = ceil(len(board_ids) / batch_count)
+    batches = [board_ids[i:i + size] for i in range(0, len(board_ids), size)]
+
+    result = chord(
+        preload_board_batch.s(batch) for batch in batches
+    )(summarize_preload.s(started_at))
+
+    return {
+        'boards': len(board_ids),
+        'skipped': len(all_board_ids) - len(board_ids),
+        'batches': len(batches),
+        'result': result.id
+    }
+
+
+# 보드 묶음 하나를 캐싱
+# BOARD_PRELOAD_BATCH_SIZE개씩 한꺼번에 조회, 직렬화하고 set_many로 저장
+@shared_task
+def preload_board_batch(board_ids):
+    started_at = time()
+    team_count = 0
+
+    batch_size = settings.BOARD_PRELOAD_BATCH_SIZE
+    for i in range(0, len(board_ids), batch_size):
+        boards = Board.objects.filter(
+            id__in=board_ids[i:i + batch_size]
+        ).select_related('team')
+        boards_data = build_boards_data(boards)
+
+        store_boards_data(
+            {board: boards_data[board.id] for board in boards},
+            settings.BOARD_PRELOAD_TIMEOUT
+        )
+        team_count += len({board.team_id for board in boards})
+
+    return {
+        'boards': len(board_ids),
+        'teams': team_count,
+        'elapsed': time() - started_at
+    }
+
+
+# 하위 작업들의 결과를 모아 실행 시간과 캐싱한 팀, 보드 수를 반환
+@shared_task
+def summarize_preload(results, started_at):
+    return {
+        'teams': sum(result['teams'] for result in results),
+        'boards': sum(result['boards'] for result in results),
+        'batches': len(results),
+        'slowest_batch': max((result['elapsed'] for result in results), default=0),
+        'elapsed': time() - started_at
+    }
+
+
+# 정렬 키가 너무 길어진 보드의 컬럼, 컬럼의 티켓 정렬 키를 다시 고르게 배분
+# force가 True이면 전체 보드를 재배치(정렬 방식을 바꾸기 전에 사용)
+@shared_task
+def rebalance_ranks(force=False):
+    max_length = settings.BOARD_RANK_MAX_LENGTH
+
+    columns = Column.objects.all()
+    tickets = Ticket.objects.all()
+    if not force:
+        columns = columns.annotate(
+            rank_length=Length('rank')
+        ).filter(rank_length__gt=max_length)
+        tickets = tickets.annotate(
+            rank_length=Length('rank')
+        ).filter(rank_length__gt=max_length)
+
+    board_ids = set(columns.values_list('board_id', flat=True).distinct())
+    column_ids = set(tickets.values_list('column_id', flat=True).distinct())
+    if force:
+        column_ids.update(Column.objects.values_list('id', flat=True))
+
+    # 보드, 컬럼마다 짧은 트랜잭션으로 나눠 재배치
+    # 전체를 한 트랜잭션으로 처리하면 그동안 다른 수정 요청이 모두 기다리게 됨
+    for board_id in board_ids:
+        _rebalance_board_columns(board_id)
+    for column_id in column_ids:
+        _rebalance_column_tickets(column_id)
+
+    # 순서값이 다시 매겨졌으므로 캐싱된 보드 데이터를 무효화
+    boards = Board.objects.filter(
+        id__in=board_ids | set(
+            Column.objects.filter(id__in=column_ids).values_list('board_id', flat=True)
+        )
+    ).select_related('team')
+    for board in boards:
+        invalidate_board_cache(board)
+
+    return {'boards': len(board_ids), 'columns': len(column_ids)}
+
+
+# 보드의 컬럼들을 잠그고 컬럼 정렬 키를 재배치
+# 재배치하는 동안 다른 요청이 컬럼 순서를 바꾸지 못하도록 함
+def _rebalance_board_columns(board_id):
+    def work():
+        lock_columns(list(Column.objects.filter(board_id=board_id).values_list('id', flat=True)))
+        rebalance(Column.objects.filter(board_id=board_id))
+
+    atomic_with_retry(work)
+
+
+# 컬럼을 잠그고 컬럼 안의 티켓 정렬 키를 재배치
+# 티켓 추가(append_ticket)와 같은 잠금을 사용하므로 재배치 중에 새 티켓이 같은 순서를 받지 않음
+def _rebalance_column_tickets(column_id):
+    def work():
+        lock_columns([column_id])
+        rebalance(Ticket.objects.filter(column_id=column_id))
+
+    atomic_with_retry(work)
@@ -1,7 +1,91 @@
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-
+from rest_framework.utils.encoders import JSONEncoder
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core import signing
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+
+from asgiref.sync import sync_to_async
+from django_redis import get_redis_connection
+from django_redis.exceptions import ConnectionInterrupted
+from redis.connection import Connection
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from config.memberships import (
+    membership_cache_key,
+    query_membership,
+    load_membership,
+    aload_membership,
+    warm_membership_cache,
+    membership_cache_stats,
+    reset_membership_cache_stats
+)
+from config.authentication import issue_events_ticket
+from config.cache_backends import MmapFileCache, is_redis_cache
+from config.cache_pipeline import CachePipeline, SequentialCachePipeline, cache_pipeline
+from config.circuit_breaker import CircuitBreaker, CircuitOpen, cache_circuit
+from config.metrics import RequestMetricsMiddleware, collect_metrics, metrics_registry, render_metrics
+from teams.models import Team
+from users.models import User
+from config.celery import app as celery_app
+from .models import Board, Column, Ticket
+from .serializers import BoardSerializer, TicketSerializer, build_boards_data, build_board_v2_data
+from .caches import (
+    board_cache_key,
+    board_v2_cache_key,
+    board_version_key,
+    board_etag,
+    get_board_version,
+    board_fresh_key,
+    diff_board_cache,
+    get_board_data,
+    patch_board_cache,
+    refresh_board_cache,
+    move_ticket,
+    update_ticket
+)
+from .ranks import rank_between, spread_ranks, rebalance
+from .activity import board_activity_key, select_preload_boards
+from .pagination import encode_cursor
+from .snapshots import SnapshotError, decode_board, encode_board, load_board
+from .streaming import stream_board_json
+from .versions import claim_version
+from .sequences import append_ticket, atomic_with_retry, lock_columns, next_ticket_position, reorder_ticket, ticket_position
+from .bulk import assign_ticket_positions
+from .events import board_events, board_events_channel
+from .local_cache import (
+    BOARD_INVALIDATION_CHANNEL,
+    BoardLocalCache,
+    board_invalidation_message,
+    board_local_cache,
+    board_local_cache_stats
+)
+from .tasks import rebalance_ranks, preload_boards, preload_board_batch, summarize_preload
+
+from threading import Barrier, Thread
+from io import StringIO
+from datetime import datetime, timedelta
+from time import monotonic, sleep
+from unittest import mock, skipUnless
+import asyncio
+import contextvars
+
+import json
+import re
+import pickle
+import os
+import socket
+import shutil
+import tempfile
 
 
 # 컬럼 생성 테스트
@@ -1506,6 +1590,28 @@ class TicketUpdateTestCase(APITestCase):
             response.status_code, status.HTTP_404_NOT_FOUND, response.data
         )
 
+    # 티켓을 조회한 뒤에 다른 요청이 티켓을 다른 컬럼으로 옮긴 케이스
+    # 수정 요청에 들어온 필드만 저장되므로 옮겨진 컬럼, 순서값이 되돌아가지 않음
+    def test_concurrent_move(self):
+        access_token = self.client.post(
+            reverse('login'),
+            {'username': 'teamleader1', 'password': 'qwerty123!@#'}
+        ).data.get('access')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        def move_then_claim(ticket, version):
+            Ticket.objects.filter(id=ticket.id).update(column_id=2, sequence=5)
+            return claim_version(ticket, version)
+
+        with mock.patch('boards.views.claim_version', side_effect=move_then_claim):
+            response = self.client.put(self.url, {'ticket': 1, 'title': 'update'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            Ticket.objects.filter(id=1).values_list('title', 'column_id', 'sequence').get(),
+            ('update', 2, 5)
+        )
+
     # 티켓 순서 변경을 시도하는 케이스
     def test_sequence_update(self):
         # 기존 DB의 사용자 중 팀장 사용자로 로그인 시도
@@ -2024,6 +2130,55 @@ class TicketSequenceUpdateTestCase(APITestCase):
             response.status_code, status.HTTP_400_BAD_REQUEST, response.data
         )
 
+    # 다른 컬럼으로 옮길 때 도착할 컬럼의 범위(1 ~ 티켓 수 + 1)를 벗어난 티켓 변경값을 받은 케이스
+    def test_other_column_ticket_sequence_out_of_range(self):
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인 시도
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        # 해당 데이터로 로그인 후 액세스 토큰 획득
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        # APIClient 객체에 인증 진행
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        # 두번째 컬럼에는 티켓이 하나 있으므로 1, 2만 유효함
+        for ticket_sequence in (0, 3, 999):
+            request_data = {
+                'ticket': 1,
+                'column_sequence': 2,
+                'ticket_sequence': ticket_sequence
+            }
+
+            response = self.client.put(self.url, request_data)
+
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+            )
+
+        self.assertEqual(
+            list(Ticket.objects.order_by('id').values_list('column_id', 'sequence')),
+            [(1, 1), (1, 2), (2, 1)]
+        )
+
+        # 맨 뒤에 추가하는 값은 허용
+        request_data = {
+            'ticket': 1,
+            'column_sequence': 2,
+            'ticket_sequence': 2
+        }
+
+        response = self.client.put(self.url, request_data)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_200_OK, response.data
+        )
+
     # 입력값이 없는 케이스
     def test_no_data(self):
         # 기존 DB의 사용자 중 팀장 사용자로 로그인 시도
@@ -2376,3 +2531,3333 @@ class BoardListTestCase(APITestCase):
         self.assertEqual(
             response.status_code, status.HTTP_401_UNAUTHORIZED, response.data
         )
+
+
+# 보드 직렬화 쿼리 수 테스트
+class BoardSerializerQueryTestCase(TestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+
+    # 컬럼, 티켓을 추가로 생성
+    def add_columns(self, column_count, ticket_count):
+        charge = User.objects.get(username='normaluser1')
+        last_sequence = Column.objects.filter(board=self.board).count()
+
+        for i in range(column_count):
+            column = Column.objects.create(
+                board=self.board,
+                title=f'컬럼{i}',
+                sequence=last_sequence + i + 1
+            )
+            Ticket.objects.bulk_create([
+                Ticket(
+                    column=column,
+                    # 절반은 담당자가 있는 티켓
+                    charge=charge if j % 2 == 0 else None,
+                    title=f'티켓{j}',
+                    tag='BE',
+                    sequence=j + 1,
+                    volume=1.5,
+                    ended_at='2023-12-31'
+                ) for j in range(ticket_count)
+            ])
+
+    # 직렬화에 사용된 쿼리 수
+    def count_queries(self):
+        board = Board.objects.get(id=self.board.id)
+
+        with CaptureQueriesContext(connection) as context:
+            BoardSerializer(board).data
+
+        return len(context.captured_queries)
+
+    # 기존 방식(컬럼마다 티켓 조회)으로 만든 column 데이터
+    def legacy_column_data(self):
+        column_data = {}
+        for column in Column.objects.filter(board=self.board).order_by('sequence'):
+            column_data[column.title] = {
+                'id': column.id,
+                'sequence': column.sequence
+            }
+
+            ticket_data = {}
+            for ticket in Ticket.objects.filter(column=column).order_by('sequence'):
+                ticket_data[ticket.title] = {
+                    'id': ticket.id,
+                    'tag': ticket.get_tag_display(),
+                    'charge': ticket.charge.username if ticket.charge else None,
+                    'volume': ticket.volume,
+                    'ended_at': ticket.ended_at,
+                    'sequence': ticket.sequence
+                }
+
+                column_data[column.title]['ticket'] = ticket_data
+
+        return column_data
+
+    # 컬럼, 티켓 수가 늘어나도 쿼리 수가 변하지 않는 케이스
+    def test_query_count_constant(self):
+        default_count = self.count_queries()
+
+        self.add_columns(10, 30)
+
+        self.assertEqual(self.count_queries(), default_count)
+
+    # 기존 방식과 결과가 같은 케이스
+    def test_same_as_legacy(self):
+        self.add_columns(3, 5)
+
+        # 컬럼 제목, 티켓 제목이 중복되는 경우도 기존과 같은 결과가 나와야 함
+        Column.objects.create(board=self.board, title='컬럼0', sequence=10)
+        Ticket.objects.create(
+            column=Column.objects.get(board=self.board, sequence=1),
+            title='첫번째티켓',
+            tag='QA',
+            sequence=3,
+            volume=2.0,
+            ended_at='2023-12-31'
+        )
+
+        data = BoardSerializer(Board.objects.get(id=self.board.id)).data
+
+        # 딕셔너리의 순서까지 같아야 하므로 문자열로 비교
+        self.assertEqual(repr(data['column']), repr(self.legacy_column_data()))
+
+
+# 보드 캐시 부분 수정 테스트
+# 각 API 호출 후 캐시된 데이터가 새로 직렬화한 데이터와 같은지 확인
+class BoardCachePatchTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+
+        # 다른 테스트에서 캐싱된 데이터가 남아있지 않도록 삭제
+        cache.delete(board_cache_key(self.board))
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        # 보드 목록을 조회해 캐시를 채워둠
+        self.client.get(reverse('board_list'))
+
+    # 요청이 성공한 다음 캐시된 데이터와 새로 직렬화한 데이터가 같은지 확인
+    def assertCacheConsistent(self, response):
+        self.assertIn(
+            response.status_code,
+            (status.HTTP_200_OK, status.HTTP_201_CREATED),
+            response.data
+        )
+        self.assertEqual(diff_board_cache(self.board), [])
+
+    # 컬럼 생성, 수정, 삭제 케이스
+    def test_column(self):
+        self.assertCacheConsistent(
+            self.client.post(reverse('column_create'), {'title': 'Done'})
+        )
+
+        self.assertCacheConsistent(
+            self.client.put(
+                reverse('column_update'), {'column': 2, 'title': 'Doing'}
+            )
+        )
+
+        self.assertCacheConsistent(
+            self.client.delete(reverse('column_delete'), {'column': 3})
+        )
+
+    # 다른 요청이 이미 옮겨진 상태로 다시 직렬화한 캐시에 같은 이동을 한 번 더 적용하지 않는 케이스
+    def test_stale_ticket_move(self):
+        column = Column.objects.get(id=1)
+        sequence, rank = next_ticket_position(column)
+        ticket = Ticket.objects.create(
+            column=column, title='마지막티켓', tag='BE', sequence=sequence,
+            rank=rank, volume=1.0, ended_at='2099-12-31'
+        )
+
+        # 마지막 티켓을 맨 앞으로 옮긴 다음 수정 전에 보드가 다시 직렬화됨
+        old_sequence = ticket_position(ticket)
+        reorder_ticket(ticket, 1)
+        refresh_board_cache(self.board)
+
+        patch_board_cache(self.board, move_ticket, ticket, old_sequence)
+
+        self.assertEqual(diff_board_cache(self.board), [])
+
+    # 컬럼 순서 변경 케이스
+    def test_column_sequence(self):
+        response = self.client.put(
+            reverse('column_sequence_update'), {'column': 3, 'sequence': 1}
+        )
+        self.assertCacheConsistent(response)
+        # 응답으로 제공되는 보드도 변경된 순서를 따름
+        self.assertEqual(
+            list(response.data['data']['column']),
+            ['Review', 'Backlog', 'In Progress']
+        )
+
+        self.assertCacheConsistent(
+            self.client.put(
+                reverse('column_sequence_update'), {'column': 3, 'sequence': 3}
+            )
+        )
+
+    # 티켓 생성, 수정, 삭제 케이스
+    def test_ticket(self):
+        self.assertCacheConsistent(
+            self.client.post(
+                reverse('ticket_create'),
+                {
+                    'column': 2,
+                    'title': '네번째티켓',
+                    'tag': 'QA',
+                    'charge': 'normaluser1',
+                    'volume': 2.5,
+                    'ended_at': '2099-12-31'
+                }
+            )
+        )
+
+        self.assertCacheConsistent(
+            self.client.put(
+                reverse('ticket_update'),
+                {'ticket': 1, 'title': '수정된티켓', 'charge': 'normaluser1'}
+            )
+        )
+
+        self.assertCacheConsistent(
+            self.client.delete(reverse('ticket_delete'), {'ticket': 2})
+        )
+
+    # 티켓 순서 변경 케이스
+    def test_ticket_sequence(self):
+        # 같은 컬럼 안에서 이동
+        self.assertCacheConsistent(
+            self.client.put(
+                reverse('ticket_sequence_update'),
+                {'ticket': 2, 'column_sequence': 1, 'ticket_sequence': 1}
+            )
+        )
+
+        # 다른 컬럼으로 이동
+        self.assertCacheConsistent(
+            self.client.put(
+                reverse('ticket_sequence_update'),
+                {'ticket': 2, 'column_sequence': 2, 'ticket_sequence': 1}
+            )
+        )
+
+        # 티켓이 없는 컬럼으로 이동
+        self.assertCacheConsistent(
+            self.client.put(
+                reverse('ticket_sequence_update'),
+                {'ticket': 1, 'column_sequence': 3, 'ticket_sequence': 1}
+            )
+        )
+
+    # 제목이 중복되어 전체를 다시 직렬화하는 케이스
+    def test_duplicate_title(self):
+        self.assertCacheConsistent(
+            self.client.post(reverse('column_create'), {'title': 'Backlog'})
+        )
+
+        self.assertCacheConsistent(
+            self.client.put(
+                reverse('ticket_update'), {'ticket': 3, 'title': '같은티켓'}
+            )
+        )
+
+        self.assertCacheConsistent(
+            self.client.post(
+                reverse('ticket_create'),
+                {
+                    'column': 2,
+                    'title': '같은티켓',
+                    'tag': 'FE',
+                    'volume': 1,
+                    'ended_at': '2099-12-31'
+                }
+            )
+        )
+
+        self.assertCacheConsistent(
+            self.client.delete(reverse('ticket_delete'), {'ticket': 3})
+        )
+
+
+# 순서 변경 쿼리 수 테스트
+class SequenceUpdateQueryTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # 첫번째 컬럼에 티켓을 추가해 전체 티켓 수를 맞춤
+    def fill_column(self, ticket_count):
+        column = Column.objects.get(id=1)
+        last_sequence = Ticket.objects.filter(column=column).count()
+
+        Ticket.objects.bulk_create([
+            Ticket(
+                column=column,
+                title=f'추가티켓{ticket_count}-{i}',
+                tag='FE',
+                sequence=last_sequence + i + 1,
+                volume=1.0,
+                ended_at='2099-12-31'
+            ) for i in range(ticket_count - last_sequence)
+        ])
+
+    # 마지막 티켓을 맨 앞으로 옮기는 데 사용된 쿼리 수
+    def count_move_queries(self, request_data):
+        # 캐시가 채워진 같은 조건에서 비교
+        # ORM으로 추가한 티켓이 반영되도록 캐시를 새로 채움
+        cache.delete(board_cache_key(Board.objects.get(id=1)))
+        self.client.get(reverse('board_list'))
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.put(
+                reverse('ticket_sequence_update'), request_data
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        return len(context.captured_queries)
+
+    # 컬럼 안의 티켓 수와 관계없이 쿼리 수가 일정한 케이스
+    def test_within_column(self):
+        self.fill_column(5)
+        last_ticket = Ticket.objects.get(column_id=1, sequence=5)
+        small_count = self.count_move_queries(
+            {'ticket': last_ticket.id, 'column_sequence': 1, 'ticket_sequence': 1}
+        )
+
+        self.fill_column(50)
+        last_ticket = Ticket.objects.get(column_id=1, sequence=50)
+        large_count = self.count_move_queries(
+            {'ticket': last_ticket.id, 'column_sequence': 1, 'ticket_sequence': 1}
+        )
+
+        self.assertEqual(small_count, large_count)
+        # 순서값은 빈틈 없이 유지됨
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=1).order_by('sequence').values_list('sequence', flat=True)),
+            list(range(1, 51))
+        )
+
+    # 다른 컬럼으로 옮길 때도 쿼리 수가 일정한 케이스
+    def test_across_column(self):
+        self.fill_column(5)
+        small_count = self.count_move_queries(
+            {'ticket': 1, 'column_sequence': 2, 'ticket_sequence': 1}
+        )
+
+        self.fill_column(50)
+        large_count = self.count_move_queries(
+            {'ticket': 2, 'column_sequence': 2, 'ticket_sequence': 1}
+        )
+
+        self.assertEqual(small_count, large_count)
+        # 원래 있던 컬럼의 빈자리는 메워짐
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=1).order_by('sequence').values_list('sequence', flat=True)),
+            list(range(1, 50))
+        )
+
+
+# 정렬 키 생성 테스트
+class RankTestCase(TestCase):
+    # 두 정렬 키 사이의 키는 항상 두 키 사이에 정렬됨
+    def test_rank_between(self):
+        ranks = [rank_between()]
+        # 맨 앞, 맨 뒤, 사이에 반복해서 추가
+        for i in range(200):
+            if i % 3 == 0:
+                ranks.insert(0, rank_between(None, ranks[0]))
+            elif i % 3 == 1:
+                ranks.append(rank_between(ranks[-1]))
+            else:
+                ranks.insert(1, rank_between(ranks[0], ranks[1]))
+
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(set(ranks)), len(ranks))
+        self.assertTrue(all(not rank.endswith('0') for rank in ranks))
+
+    # 순서가 잘못된 정렬 키가 주어지는 케이스
+    def test_invalid_rank(self):
+        with self.assertRaises(ValueError):
+            rank_between('n', 'a')
+
+    # 고르게 배분된 정렬 키는 짧고 순서대로 정렬됨
+    def test_spread_ranks(self):
+        for count in (0, 1, 35, 36, 1000):
+            ranks = spread_ranks(count)
+
+            self.assertEqual(len(ranks), count)
+            self.assertEqual(ranks, sorted(ranks))
+            self.assertEqual(len(set(ranks)), count)
+            self.assertTrue(all(len(rank) <= 3 for rank in ranks))
+
+
+# 정렬 키 방식에서 캐시 수정 테스트
+# 캐시 수정 테스트를 정렬 키 방식으로 다시 실행
+@override_settings(BOARD_ORDERING='rank')
+class RankBoardCachePatchTestCase(BoardCachePatchTestCase):
+    def setUp(self):
+        # 정렬 방식을 바꾸기 전처럼 정렬 키를 채워둠
+        rebalance_ranks(force=True)
+
+        super().setUp()
+
+    # 앞에 있는 컬럼이 삭제되어 뒤의 컬럼들의 위치가 당겨지는 케이스
+    def test_first_column_delete(self):
+        response = self.client.delete(reverse('column_delete'), {'column': 1})
+        self.assertCacheConsistent(response)
+
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(
+            [column['sequence'] for column in response.data['data']['column'].values()],
+            [1, 2]
+        )
+
+
+# 정렬 키 방식 순서 변경 테스트
+@override_settings(BOARD_ORDERING='rank')
+class RankSequenceUpdateTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 정렬 방식을 바꾸기 전처럼 정렬 키를 채워둠
+        rebalance_ranks(force=True)
+        cache.delete(board_cache_key(Board.objects.get(id=1)))
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # 옮겨지는 티켓 하나만 수정되는 케이스
+    def test_single_update(self):
+        column = Column.objects.get(id=1)
+        # 마지막 티켓 뒤에 정렬되도록 정렬 키 뒤에 숫자를 붙임
+        rank = Ticket.objects.get(id=2).rank
+        Ticket.objects.bulk_create([
+            Ticket(
+                column=column,
+                title=f'정렬키티켓{i}',
+                tag='BE',
+                sequence=i + 3,
+                rank=f'{rank}{i + 1}',
+                volume=1.0,
+                ended_at='2099-12-31'
+            ) for i in range(5)
+        ])
+        last_ticket = Ticket.objects.filter(column=column).order_by('rank').last()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.put(
+                reverse('ticket_sequence_update'),
+                {'ticket': last_ticket.id, 'column_sequence': 1, 'ticket_sequence': 1}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "boards_ticket"')
+        ]
+        # 옮겨지는 티켓의 버전, 정렬 키만 수정되고 다른 티켓은 수정되지 않음
+        self.assertEqual(len(updates), 2)
+        for sql in updates:
+            self.assertRegex(sql, rf'WHERE \(?"boards_ticket"\."id" = {last_ticket.id}\b')
+
+        # 응답의 순서값은 정렬 키 순서상의 위치
+        tickets = response.data['data']['column']['Backlog']['ticket']
+        self.assertEqual(list(tickets)[0], last_ticket.title)
+        self.assertEqual(
+            [ticket['sequence'] for ticket in tickets.values()],
+            list(range(1, len(tickets) + 1))
+        )
+
+    # 다른 컬럼의 중간으로 옮기는 케이스
+    def test_across_column(self):
+        response = self.client.put(
+            reverse('ticket_sequence_update'),
+            {'ticket': 1, 'column_sequence': 2, 'ticket_sequence': 1}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        response = self.client.put(
+            reverse('ticket_sequence_update'),
+            {'ticket': 2, 'column_sequence': 2, 'ticket_sequence': 2}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=2).order_by('rank').values_list('id', flat=True)),
+            [1, 2, 3]
+        )
+        self.assertNotIn('ticket', response.data['data']['column']['Backlog'])
+
+    # 동시에 옮겨져 정렬 키가 같아진 티켓들은 v1, v2 모두 id 순서로 정렬됨
+    def test_rank_tie(self):
+        board = Board.objects.get(id=1)
+        Ticket.objects.filter(column_id=1).update(rank='i')
+
+        tickets = BoardSerializer(board).data['column']['Backlog']['ticket']
+        self.assertEqual([ticket['id'] for ticket in tickets.values()], [1, 2])
+        self.assertEqual([ticket['sequence'] for ticket in tickets.values()], [1, 2])
+        self.assertEqual(
+            build_boards_data(Board.objects.filter(id=1).select_related('team'))[1]['column'],
+            BoardSerializer(board).data['column']
+        )
+        self.assertEqual(build_board_v2_data(board)['column'][0]['ticket'], [1, 2])
+
+
+# 정렬 키 재배치 테스트
+class RebalanceRanksTestCase(TestCase):
+    fixtures = ['db.json']
+
+    # 길어진 정렬 키만 순서를 유지한 채로 다시 배분되는 케이스
+    @override_settings(BOARD_ORDERING='rank', BOARD_RANK_MAX_LENGTH=8)
+    def test_long_ranks(self):
+        rebalance_ranks(force=True)
+
+        # 두 번째 티켓을 첫번째티켓 바로 뒤로 계속 옮겨 정렬 키를 길게 만듦
+        first, second = Ticket.objects.filter(column_id=1).order_by('rank')
+        for _ in range(60):
+            second.rank = rank_between(first.rank, second.rank)
+            second.save(update_fields=['rank'])
+        self.assertGreater(len(second.rank), 8)
+
+        result = rebalance_ranks()
+
+        self.assertEqual(result, {'boards': 0, 'columns': 1})
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=1).order_by('rank').values_list('id', 'sequence')),
+            [(1, 1), (2, 2)]
+        )
+        self.assertTrue(
+            all(len(rank) <= 8 for rank in Ticket.objects.values_list('rank', flat=True))
+        )
+
+    # 맨 뒤에 계속 추가해도 정렬 키가 최대 길이를 넘으면 바로 다시 배분되는 케이스
+    @override_settings(BOARD_ORDERING='rank', BOARD_RANK_MAX_LENGTH=8)
+    def test_append_rebalance(self):
+        rebalance_ranks(force=True)
+        column = Column.objects.get(id=1)
+
+        for i in range(100):
+            sequence, rank = next_ticket_position(column)
+            Ticket.objects.create(
+                column=column, title=f'추가티켓{i}', tag='BE', sequence=sequence,
+                rank=rank, volume=1.0, ended_at='2099-12-31'
+            )
+
+        # 일괄 추가도 같은 방식으로 다시 배분됨
+        for i in range(10):
+            tickets = [
+                Ticket(column=column, title=f'일괄티켓{i}-{j}', tag='BE', volume=1.0, ended_at='2099-12-31')
+                for j in range(5)
+            ]
+            assign_ticket_positions(tickets)
+            Ticket.objects.bulk_create(tickets)
+
+        tickets = Ticket.objects.filter(column=column)
+        self.assertTrue(all(len(rank) <= 8 for rank in tickets.values_list('rank', flat=True)))
+        # 정렬 키 순서는 추가된 순서(id 순서)와 같음
+        self.assertEqual(
+            list(tickets.order_by('rank').values_list('id', flat=True)),
+            list(tickets.order_by('id').values_list('id', flat=True))
+        )
+
+    # 보드의 컬럼, 컬럼의 티켓을 재배치하기 전에 해당 컬럼들을 잠그는 케이스
+    # 컬럼마다 따로 잠그므로 다른 컬럼의 수정 요청은 기다리지 않음
+    @override_settings(BOARD_ORDERING='rank')
+    def test_locked_columns(self):
+        with mock.patch('boards.tasks.lock_columns', wraps=lock_columns) as lock:
+            result = rebalance_ranks(force=True)
+
+        board_ids = set(Column.objects.values_list('board_id', flat=True))
+        column_ids = list(Column.objects.values_list('id', flat=True))
+        self.assertEqual(lock.call_count, len(board_ids) + len(column_ids))
+        for column_id in column_ids:
+            lock.assert_any_call([column_id])
+        for board_id in board_ids:
+            lock.assert_any_call(
+                list(Column.objects.filter(board_id=board_id).values_list('id', flat=True))
+            )
+        self.assertEqual(result, {'boards': len(board_ids), 'columns': len(column_ids)})
+
+    # 순서값 방식에서 재배치하면 순서값의 빈틈도 메워지는 케이스
+    def test_sequence_gap(self):
+        Ticket.objects.filter(id=2).update(sequence=5)
+
+        rebalance(Ticket.objects.filter(column_id=1))
+
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=1).order_by('rank').values_list('id', 'sequence')),
+            [(1, 1), (2, 2)]
+        )
+
+
+# 사용자의 팀 정보 조회, 캐싱 테스트
+class TeamMembershipQueryTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        self.login('teamleader1')
+
+        # 다른 테스트에서 캐싱된 팀 정보가 남아있지 않도록 삭제
+        cache.delete(membership_cache_key(self.user.id))
+
+    def login(self, username):
+        self.user = User.objects.get(username=username)
+
+        login_data = {
+            'username': username,
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # 사용자의 그룹으로 팀, 보드, 팀장 여부를 찾는 쿼리 수
+    def count_membership_queries(self, method, url, data=None):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, data)
+
+        self.assertIn(
+            response.status_code,
+            (status.HTTP_200_OK, status.HTTP_201_CREATED),
+            response.data
+        )
+
+        # 로그인한 사용자의 그룹을 조회하는 쿼리만 셈
+        return len([
+            query for query in context.captured_queries
+            if ('users_user_groups' in query['sql'])
+            and re.search(rf'"user_id" = {self.user.id}\b', query['sql'])
+        ])
+
+    # 권한 확인과 뷰에서 팀 정보를 함께 사용하는 케이스
+    def test_ticket_update(self):
+        self.assertEqual(
+            self.count_membership_queries(
+                'put',
+                reverse('ticket_update'),
+                {'ticket': 1, 'title': '수정된티켓', 'charge': 'normaluser1'}
+            ),
+            1
+        )
+
+    # 팀장 권한이 필요한 케이스
+    def test_column_create(self):
+        self.assertEqual(
+            self.count_membership_queries(
+                'post', reverse('column_create'), {'title': 'Done'}
+            ),
+            1
+        )
+
+    # 두 번째 요청부터는 캐시에서 팀 정보를 가져오는 케이스
+    def test_cached(self):
+        reset_membership_cache_stats()
+
+        self.assertEqual(
+            self.count_membership_queries('get', reverse('board_list')), 1
+        )
+        self.assertEqual(
+            self.count_membership_queries(
+                'post', reverse('column_create'), {'title': 'Done'}
+            ),
+            0
+        )
+
+        stats = membership_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+    # 그룹이 바뀌면 캐싱된 팀 정보가 삭제되는 케이스
+    def test_invalidated(self):
+        # 팀에 소속되지 않은 사용자
+        self.login('normaluser4')
+        cache.delete(membership_cache_key(self.user.id))
+
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(
+            response.status_code, status.HTTP_403_FORBIDDEN, response.data
+        )
+        self.assertEqual(cache.get(membership_cache_key(self.user.id)), {})
+
+        # 팀 그룹에 추가되면 캐시가 삭제되어 바로 권한이 생김
+        self.user.groups.add(Group.objects.get(name='첫번째팀'))
+        self.assertIsNone(cache.get(membership_cache_key(self.user.id)))
+
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(
+            response.status_code, status.HTTP_200_OK, response.data
+        )
+
+        # 그룹 쪽에서 사용자를 빼는 경우도 캐시가 삭제됨
+        Group.objects.get(name='첫번째팀').user_set.remove(self.user)
+
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(
+            response.status_code, status.HTTP_403_FORBIDDEN, response.data
+        )
+
+    # 전체 사용자의 팀 정보를 미리 캐싱하는 케이스
+    def test_warm(self):
+        cache.delete_many([membership_cache_key(user.id) for user in User.objects.all()])
+
+        warmed = warm_membership_cache(batch_size=3)
+
+        self.assertEqual(warmed, User.objects.count())
+        # 캐싱된 값은 DB에서 가져온 값과 같음
+        for user in User.objects.all():
+            membership = query_membership(user)
+            cached = load_membership(user)
+
+            self.assertEqual(
+                (cached.team and cached.team.id, cached.board and cached.board.id, cached.is_leader),
+                (membership.team and membership.team.id, membership.board and membership.board.id, membership.is_leader)
+            )
+
+
+# 캐시가 비어있는 보드에 동시에 요청이 몰리는 경우 테스트
+# 여러 스레드가 같은 DB를 봐야 하므로 TransactionTestCase 사용
+# 픽스쳐의 contenttype 데이터가 TransactionTestCase의 초기화와 충돌하므로 데이터를 직접 생성
+class BoardCacheStampedeTestCase(TransactionTestCase):
+    def setUp(self):
+        leader = User.objects.create_user(username='stampede', password='qwerty123!@#')
+        team = Team.objects.create(leader=leader, name='동시요청팀')
+        self.board = Board.objects.create(team=team)
+
+        for i in range(3):
+            column = Column.objects.create(
+                board=self.board, title=f'컬럼{i}', sequence=i + 1
+            )
+            Ticket.objects.create(
+                column=column,
+                title=f'티켓{i}',
+                tag='BE',
+                sequence=1,
+                volume=1.0,
+                ended_at='2099-12-31'
+            )
+
+        cache.delete_many([
+            board_cache_key(self.board), board_fresh_key(self.board)
+        ])
+        board_local_cache.clear()
+
+    # 직렬화에 걸리는 시간을 늘리고 직렬화 횟수를 셈
+    def slow_serializer(self):
+        calls = []
+
+        def serialize(board):
+            calls.append(board.id)
+            sleep(0.2)
+
+            return BoardSerializer(board)
+
+        return calls, mock.patch('boards.caches.BoardSerializer', side_effect=serialize)
+
+    # 여러 스레드에서 동시에 보드 데이터를 요청
+    def request_concurrently(self, thread_count):
+        barrier = Barrier(thread_count)
+        results = []
+
+        def request():
+            try:
+                barrier.wait()
+                results.append(get_board_data(Board.objects.get(id=self.board.id)))
+            finally:
+                connection.close()
+
+        threads = [Thread(target=request) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    # 캐시가 비어있을 때 직렬화는 한 번만 실행되는 케이스
+    def test_single_flight(self):
+        calls, patch = self.slow_serializer()
+
+        with patch:
+            results = self.request_concurrently(20)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 20)
+        expected = BoardSerializer(self.board).data
+        for result in results:
+            self.assertEqual(result, expected)
+
+    # 만료된 데이터를 바로 제공하고 백그라운드에서 다시 캐싱하는 케이스
+    def test_stale_while_revalidate(self):
+        stale = {'team': self.board.team.name, 'column': {}}
+        cache.set(board_cache_key(self.board), stale)
+
+        calls, patch = self.slow_serializer()
+
+        with patch:
+            results = self.request_concurrently(10)
+
+            # 모든 요청이 직렬화를 기다리지 않고 이전 데이터를 받음
+            self.assertEqual(results, [stale] * 10)
+
+            # 백그라운드 갱신이 끝날 때까지 기다림
+            deadline = monotonic() + 5
+            while (cache.get(board_fresh_key(self.board)) is None) and (monotonic() < deadline):
+                sleep(0.05)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(
+            get_board_data(self.board), BoardSerializer(self.board).data
+        )
+
+    # 만료된 데이터를 사용하지 않는 설정에서는 다시 직렬화될 때까지 기다리는 케이스
+    @override_settings(BOARD_CACHE_STALE_TIMEOUT=0)
+    def test_no_stale(self):
+        calls, patch = self.slow_serializer()
+
+        with patch:
+            results = self.request_concurrently(10)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [BoardSerializer(self.board).data] * 10)
+
+
+# 보드 버전과 ETag를 이용한 조건부 조회 테스트
+class BoardConditionalGetTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        self.board = Board.objects.get(id=1)
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # 같은 버전의 데이터를 가진 클라이언트는 본문 없이 304를 받는 케이스
+    def test_not_modified(self):
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        etag = response.headers['ETag']
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                reverse('board_list'), HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+        # 보드를 직렬화하지 않음
+        self.assertFalse([
+            query for query in context.captured_queries
+            if 'boards_column' in query['sql']
+        ])
+
+    # 컬럼, 티켓이 바뀌면 버전이 올라가 전체 데이터를 다시 받는 케이스
+    def test_modified(self):
+        etag = self.client.get(reverse('board_list')).headers['ETag']
+        version = get_board_version(self.board)
+
+        response = self.client.put(
+            reverse('ticket_update'), {'ticket': 1, 'title': '수정된티켓'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(get_board_version(self.board), version + 1)
+
+        response = self.client.get(
+            reverse('board_list'), HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertIn('수정된티켓', response.data['data']['column']['Backlog']['ticket'])
+
+    # 버전이 캐시에서 사라져도 이전 버전보다 큰 값으로 다시 시작하는 케이스
+    def test_version_reset(self):
+        version = get_board_version(self.board)
+
+        cache.delete(board_version_key(self.board))
+
+        self.assertGreater(get_board_version(self.board), version)
+
+
+# 보드 미리 캐싱 테스트
+class BoardPreloadTestCase(TestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        self.boards = list(Board.objects.select_related('team').order_by('id'))
+
+        # 다른 테스트에서 캐싱된 데이터가 남아있지 않도록 삭제
+        cache.delete_many([board_cache_key(board) for board in self.boards])
+
+    # 여러 보드를 한꺼번에 직렬화해도 보드 시리얼라이저와 같은 데이터가 나오는 케이스
+    def test_build_boards_data(self):
+        with CaptureQueriesContext(connection) as context:
+            boards_data = build_boards_data(self.boards)
+
+        # 보드 수와 관계없이 컬럼, 티켓 조회 두 번
+        self.assertEqual(len(context.captured_queries), 2)
+        for board in self.boards:
+            self.assertEqual(boards_data[board.id], BoardSerializer(board).data)
+
+    # 하위 작업 하나가 맡은 보드들을 캐싱하는 케이스
+    @override_settings(BOARD_PRELOAD_BATCH_SIZE=3)
+    def test_batch(self):
+        result = preload_board_batch([board.id for board in self.boards])
+
+        self.assertEqual(result['boards'], 4)
+        self.assertEqual(result['teams'], 4)
+        for board in self.boards:
+            self.assertEqual(diff_board_cache(board), [])
+
+        summary = summarize_preload([result, result], 0)
+        self.assertEqual((summary['teams'], summary['boards'], summary['batches']), (8, 8, 2))
+
+    # 전체 보드를 묶음으로 나눠 캐싱하는 케이스
+    @override_settings(BOARD_PRELOAD_CONCURRENCY=3, BOARD_PRELOAD_POLICY='all')
+    def test_preload(self):
+        # 워커 없이 현재 프로세스에서 바로 실행
+        celery_app.conf.task_always_eager = True
+        try:
+            result = preload_boards.apply().get()
+        finally:
+            celery_app.conf.task_always_eager = False
+
+        self.assertEqual((result['boards'], result['batches']), (4, 2))
+        for board in self.boards:
+            self.assertEqual(diff_board_cache(board), [])
+
+
+# 보드 사용 기록에 따라 미리 캐싱할 보드를 고르는 테스트
+@override_settings(BOARD_PRELOAD_TOP_N=2, BOARD_PRELOAD_ACTIVE_DAYS=14)
+class BoardActivityTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        self.board_ids = list(Board.objects.order_by('id').values_list('id', flat=True))
+
+        # 다른 테스트에서 남은 사용 기록 삭제
+        cache.delete_many([
+            board_activity_key(board_id, weekday)
+            for board_id in self.board_ids
+            for weekday in [None, *range(7)]
+        ])
+
+    # 특정 시각에 보드를 사용한 기록을 남김
+    def record_at(self, board_id, moment):
+        cache.set_many({
+            board_activity_key(board_id): moment.timestamp(),
+            board_activity_key(board_id, moment.weekday()): moment.timestamp(),
+        })
+
+    # 보드 목록 조회가 사용 기록으로 남는 케이스
+    def test_board_list(self):
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        self.assertEqual(select_preload_boards(self.board_ids, 'recent'), [])
+
+        self.client.get(reverse('board_list'))
+
+        self.assertEqual(select_preload_boards(self.board_ids, 'recent'), [1])
+
+    # 최근에 사용된 보드부터 BOARD_PRELOAD_TOP_N개를 고르는 케이스
+    def test_recent(self):
+        now = datetime(2024, 1, 15, 9, tzinfo=timezone.get_current_timezone())
+        self.record_at(1, now - timedelta(days=3))
+        self.record_at(2, now - timedelta(hours=1))
+        self.record_at(3, now - timedelta(days=1))
+        # BOARD_PRELOAD_ACTIVE_DAYS보다 오래전에 사용된 보드
+        self.record_at(4, now - timedelta(days=30))
+
+        self.assertEqual(select_preload_boards(self.board_ids, 'recent', now), [2, 3])
+        self.assertEqual(select_preload_boards(self.board_ids, 'all', now), self.board_ids)
+
+    # 오늘과 같은 요일에 사용된 보드만 고르는 케이스
+    def test_weekday(self):
+        # 2024-01-15는 월요일
+        now = datetime(2024, 1, 15, 9, tzinfo=timezone.get_current_timezone())
+        self.record_at(1, now - timedelta(days=7))
+        self.record_at(2, now - timedelta(days=1))
+
+        self.assertEqual(select_preload_boards(self.board_ids, 'weekday', now), [1])
+
+    # 알 수 없는 정책을 설정한 케이스
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            select_preload_boards(self.board_ids, 'unknown')
+
+
+# 보드 스트리밍 응답 테스트
+class BoardStreamTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        # 티켓이 없는 컬럼이 중간에 오도록 컬럼, 티켓 추가
+        board = Board.objects.get(id=1)
+        Column.objects.create(board=board, title='Done', sequence=4)
+        Ticket.objects.bulk_create([
+            Ticket(
+                column_id=3,
+                title=f'스트리밍티켓{i}',
+                tag='BE',
+                sequence=i + 1,
+                volume=1.5,
+                ended_at='2099-12-31'
+            ) for i in range(30)
+        ])
+
+        cache.delete(board_cache_key(board))
+
+    # 스트리밍 응답의 본문을 모두 읽음
+    def get_streamed(self):
+        response = self.client.get(reverse('board_list'), {'stream': 'true'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn('ETag', response.headers)
+
+        chunks = list(response.streaming_content)
+
+        return chunks, b''.join(chunks)
+
+    # 일반 응답과 같은 JSON을 내보내는 케이스
+    def test_same_json(self):
+        _, content = self.get_streamed()
+
+        response = self.client.get(reverse('board_list'))
+
+        self.assertEqual(content, response.content)
+
+    # 정렬 키 방식에서도 같은 JSON을 내보내는 케이스
+    @override_settings(BOARD_ORDERING='rank')
+    def test_rank_ordering(self):
+        rebalance_ranks(force=True)
+
+        _, content = self.get_streamed()
+
+        response = self.client.get(reverse('board_list'))
+
+        self.assertEqual(json.loads(content), json.loads(response.content))
+
+    # 본문을 여러 조각으로 나눠서 내보내는 케이스
+    @override_settings(BOARD_STREAM_BUFFER_SIZE=256, BOARD_STREAM_CHUNK_SIZE=7)
+    def test_chunks(self):
+        chunks, content = self.get_streamed()
+
+        self.assertGreater(len(chunks), 5)
+        self.assertEqual(
+            len(json.loads(content)['data']['column']['Review']['ticket']), 30
+        )
+
+
+# 티켓 목록(페이지네이션, 필터) 테스트
+class TicketListTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # /api/v1/boards/ticket/list/
+        self.url = reverse('ticket_list')
+
+        # 기존 DB의 사용자 중 팀원 사용자로 로그인
+        login_data = {
+            'username': 'normaluser1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # 세 번째 컬럼에 티켓 추가
+    def fill_column(self, ticket_count):
+        Ticket.objects.bulk_create([
+            Ticket(
+                column_id=3,
+                title=f'목록티켓{i}',
+                tag='QA',
+                sequence=i + 1,
+                volume=1.0,
+                ended_at='2099-12-31'
+            ) for i in range(ticket_count)
+        ])
+
+    # 다음 페이지가 없을 때까지 전체 페이지를 읽음
+    def read_pages(self, params):
+        tickets = []
+        pages = 0
+        cursor = None
+        while True:
+            response = self.client.get(
+                self.url, {**params, **({'cursor': cursor} if cursor else {})}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+            tickets += response.data['data']['ticket']
+            pages += 1
+            cursor = response.data['data']['next']
+            if cursor is None:
+                return tickets, pages
+
+    # 컬럼 순서, 티켓 순서대로 제공되는 케이스
+    def test_default(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            [(ticket['id'], ticket['column'], ticket['sequence']) for ticket in response.data['data']['ticket']],
+            [(1, 1, 1), (2, 1, 2), (3, 2, 1)]
+        )
+        self.assertEqual(response.data['data']['ticket'][1]['charge'], 'normaluser1')
+        self.assertIsNone(response.data['data']['next'])
+
+    # 커서로 빠짐없이, 중복 없이 전체 티켓을 읽는 케이스
+    def test_pagination(self):
+        self.fill_column(25)
+
+        tickets, pages = self.read_pages({'limit': 10})
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(
+            [ticket['id'] for ticket in tickets],
+            [1, 2, 3] + list(
+                Ticket.objects.filter(column_id=3).order_by('sequence').values_list('id', flat=True)
+            )
+        )
+
+    # 정렬 키 방식에서도 커서로 전체 티켓을 읽는 케이스
+    @override_settings(BOARD_ORDERING='rank')
+    def test_rank_ordering(self):
+        self.fill_column(12)
+        rebalance_ranks(force=True)
+
+        tickets, pages = self.read_pages({'limit': 5, 'column': 3})
+
+        self.assertEqual(pages, 3)
+        # 순서값은 컬럼 안에서 정렬된 위치
+        self.assertEqual(
+            [ticket['sequence'] for ticket in tickets], list(range(1, 13))
+        )
+
+    # 태그, 담당자, 마감일, 컬럼 필터 케이스
+    def test_filters(self):
+        self.fill_column(3)
+
+        def ids(params):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+            return [ticket['id'] for ticket in response.data['data']['ticket']]
+
+        self.assertEqual(ids({'tag': 'FE,D'}), [1, 3])
+        self.assertEqual(ids({'charge': 'normaluser1'}), [2])
+        self.assertEqual(ids({'ended_from': '2023-12-01', 'ended_to': '2023-12-02'}), [2, 3])
+        self.assertEqual(ids({'column': 1, 'tag': 'BE'}), [2])
+        self.assertEqual(len(ids({'column': 3})), 3)
+
+    # 잘못된 값이 입력된 케이스
+    def test_invalid_params(self):
+        for params in (
+            {'tag': 'XX'},
+            {'ended_from': '2023/12/01'},
+            {'limit': 0},
+            {'limit': 'many'},
+            {'cursor': '!!!'},
+            {'cursor': encode_cursor([1, 2])},
+            {'cursor': encode_cursor(['x', 1, 1, 1])},
+            {'cursor': encode_cursor([1, 1, {'sequence': 1}, 1])},
+            {'cursor': encode_cursor([1, 1, 1, True])},
+        ):
+            response = self.client.get(self.url, params)
+
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST, (params, response.data)
+            )
+
+    # 다른 팀 보드의 컬럼을 지정한 케이스
+    def test_other_board_column(self):
+        response = self.client.get(self.url, {'column': 4})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_404_NOT_FOUND, response.data
+        )
+
+
+# 자주 실행되는 보드 쿼리의 실행 계획 테스트
+@skipUnless(connection.vendor == 'sqlite', 'SQLite의 실행 계획 형식을 기준으로 확인')
+class BoardQueryPlanTestCase(TestCase):
+    fixtures = ['db.json']
+
+    # 모델에서 해당 필드들로 만든 인덱스의 이름
+    def index_name(self, model, fields):
+        return next(
+            index.name for index in model._meta.indexes if index.fields == fields
+        )
+
+    # 테이블 전체를 읽지 않고 해당 인덱스로 검색하는지 확인
+    def assertUsesIndex(self, queryset, model, fields):
+        plan = queryset.explain()
+
+        self.assertNotIn(f'SCAN {model._meta.db_table}', plan)
+        self.assertIn(f'USING INDEX {self.index_name(model, fields)}', plan)
+        # 정렬을 위해 임시 B-트리를 만들지 않음
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    # 실행된 쿼리 중 티켓 테이블을 읽는 쿼리의 실행 계획
+    def ticket_plans(self, queries):
+        plans = []
+        with connection.cursor() as cursor:
+            for query in queries:
+                sql = query['sql']
+                if (not sql.startswith('SELECT')) or ('FROM "boards_ticket"' not in sql):
+                    continue
+
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                plans.append('\n'.join(row[-1] for row in cursor.fetchall()))
+
+        self.assertTrue(plans)
+        return plans
+
+    # 보드를 읽는 경로에서 실제로 실행되는 티켓 쿼리가 (컬럼, 순서) 인덱스를 쓰는지 확인
+    def assertBoardLoadUsesIndex(self, fields):
+        board = Board.objects.select_related('team').get(id=1)
+
+        client = APIClient()
+        access_token = client.post(
+            reverse('login'),
+            {'username': 'normaluser1', 'password': 'qwerty123!@#'}
+        ).data.get('access')
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        with CaptureQueriesContext(connection) as queries:
+            BoardSerializer(board).data
+            build_boards_data([board])
+            build_board_v2_data(board)
+            list(stream_board_json(board))
+
+            response = client.get(reverse('ticket_list'), {'limit': 1})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            client.get(reverse('ticket_list'), {'cursor': response.data['data']['next']})
+
+        for plan in self.ticket_plans(queries.captured_queries):
+            self.assertNotIn('SCAN boards_ticket', plan)
+            self.assertIn(f'USING INDEX {self.index_name(Ticket, fields)}', plan)
+            # 정렬을 위해 임시 B-트리를 만들지 않음
+            self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_board_load(self):
+        self.assertUsesIndex(
+            Column.objects.filter(board_id=1).order_by('sequence'),
+            Column, ['board', 'sequence']
+        )
+        self.assertBoardLoadUsesIndex(['column', 'sequence'])
+
+    @override_settings(BOARD_ORDERING='rank')
+    def test_rank_board_load(self):
+        self.assertUsesIndex(
+            Column.objects.filter(board_id=1).order_by('rank'),
+            Column, ['board', 'rank']
+        )
+        self.assertBoardLoadUsesIndex(['column', 'rank'])
+
+    # 순서 변경 시 사이에 있는 행들을 옮기는 범위 조회
+    def test_sequence_range(self):
+        self.assertUsesIndex(
+            Column.objects.filter(board_id=1, sequence__gte=1, sequence__lt=3),
+            Column, ['board', 'sequence']
+        )
+        self.assertUsesIndex(
+            Ticket.objects.filter(column_id=1, sequence__gt=1, sequence__lte=3),
+            Ticket, ['column', 'sequence']
+        )
+
+    def test_charge_and_ended_at(self):
+        self.assertUsesIndex(
+            Ticket.objects.filter(charge_id=6).order_by('ended_at'),
+            Ticket, ['charge', 'ended_at']
+        )
+        self.assertUsesIndex(
+            Ticket.objects.filter(ended_at__lte='2023-12-01'),
+            Ticket, ['ended_at']
+        )
+
+
+# 보드 캐시의 바이너리 형식 테스트
+class BoardSnapshotTestCase(TestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        self.board = Board.objects.get(id=1)
+
+        cache.delete(board_cache_key(self.board))
+        board_local_cache.clear()
+
+    # 키의 순서까지 같은지 JSON 문자열로 비교
+    def assertSameBoard(self, decoded, data):
+        self.assertEqual(
+            json.dumps(decoded, cls=JSONEncoder, ensure_ascii=False),
+            json.dumps(data, cls=JSONEncoder, ensure_ascii=False)
+        )
+
+    # 담당자가 없는 티켓, 티켓이 없는 컬럼이 있는 보드
+    def test_round_trip(self):
+        data = BoardSerializer(self.board).data
+
+        self.assertSameBoard(decode_board(encode_board(data)), data)
+
+    @override_settings(BOARD_SNAPSHOT_COMPRESS_MIN_SIZE=0)
+    def test_compressed_round_trip(self):
+        data = BoardSerializer(self.board).data
+        encoded = encode_board(data)
+
+        self.assertEqual(encoded[3], 1)
+        self.assertSameBoard(decode_board(encoded), data)
+
+    # 티켓이 많은 보드는 pickle한 딕셔너리보다 작게 저장됨
+    def test_size(self):
+        Ticket.objects.bulk_create([
+            Ticket(
+                column_id=1 + i % 3,
+                charge_id=[None, 1, 6][i % 3],
+                title=f'크기티켓{i}',
+                tag=Ticket.TAG_CHOICES[i % len(Ticket.TAG_CHOICES)][0],
+                sequence=i + 3,
+                volume=i / 4,
+                ended_at='2099-12-31'
+            ) for i in range(300)
+        ])
+        data = BoardSerializer(self.board).data
+
+        encoded = encode_board(data)
+
+        self.assertSameBoard(decode_board(encoded), data)
+        self.assertLess(len(encoded) * 3, len(pickle.dumps(data)))
+
+    # 캐시에는 바이트로 저장되고 읽을 때는 보드 데이터로 변환됨
+    def test_cache(self):
+        data = get_board_data(self.board)
+
+        self.assertIsInstance(cache.get(board_cache_key(self.board)), bytes)
+        self.assertSameBoard(get_board_data(self.board), data)
+
+    # 이전 형식으로 캐싱된 딕셔너리도 그대로 읽음
+    def test_legacy_value(self):
+        data = dict(BoardSerializer(self.board).data)
+
+        self.assertIsNone(load_board(None))
+        self.assertEqual(load_board(data), data)
+
+    def test_invalid_value(self):
+        for value in (b'', b'XX\x01\x00', b'BS\x09\x00'):
+            with self.assertRaises(SnapshotError):
+                decode_board(value)
+
+
+# id로 구분되는 v2 보드 데이터 테스트
+class BoardListV2TestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+
+        # 다른 테스트에서 캐싱된 데이터가 남아있지 않도록 삭제
+        cache.delete(board_v2_cache_key(self.board))
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        # 보드 목록을 조회해 캐시를 채워둠
+        self.client.get(reverse('board_list_v2'))
+
+    # 요청이 성공한 다음 v2 캐시가 다시 직렬화되지 않고 수정되었는지 확인
+    def assertCachePatched(self, response):
+        self.assertIn(
+            response.status_code,
+            (status.HTTP_200_OK, status.HTTP_201_CREATED),
+            response.data
+        )
+        self.assertEqual(
+            cache.get(board_v2_cache_key(self.board)),
+            build_board_v2_data(self.board)
+        )
+
+    def test_list(self):
+        response = self.client.get(reverse('board_list_v2'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(column['title'], column['ticket']) for column in response.data['data']['column']],
+            [('Backlog', [1, 2]), ('In Progress', [3]), ('Review', [])]
+        )
+        self.assertEqual(
+            response.data['data']['ticket'][2],
+            {
+                'title': '두번째 티켓',
+                'tag': 'Backend',
+                'charge': 'normaluser1',
+                'volume': Ticket.objects.get(id=2).volume,
+                'ended_at': Ticket.objects.get(id=2).ended_at,
+                'version': 1
+            }
+        )
+        # v1과 같은 버전이지만 ETag는 다름
+        self.assertNotEqual(
+            response['ETag'], self.client.get(reverse('board_list'))['ETag']
+        )
+
+        response = self.client.get(
+            reverse('board_list_v2'), HTTP_IF_NONE_MATCH=response['ETag']
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    # 제목이 같은 컬럼, 티켓도 모두 포함되는 케이스
+    def test_duplicate_title(self):
+        self.assertCachePatched(
+            self.client.post(reverse('column_create'), {'title': 'Backlog'})
+        )
+        self.assertCachePatched(
+            self.client.put(
+                reverse('ticket_update'), {'ticket': 2, 'title': '첫번째티켓'}
+            )
+        )
+
+        data = self.client.get(reverse('board_list_v2')).data['data']
+
+        self.assertEqual(
+            [column['title'] for column in data['column']],
+            ['Backlog', 'In Progress', 'Review', 'Backlog']
+        )
+        self.assertEqual(
+            [data['ticket'][ticket_id]['title'] for ticket_id in data['column'][0]['ticket']],
+            ['첫번째티켓', '첫번째티켓']
+        )
+
+    # 컬럼 생성, 수정, 순서 변경, 삭제 케이스
+    def test_column(self):
+        self.assertCachePatched(
+            self.client.post(reverse('column_create'), {'title': 'Done'})
+        )
+        self.assertCachePatched(
+            self.client.put(
+                reverse('column_update'), {'column': 2, 'title': 'Doing'}
+            )
+        )
+        self.assertCachePatched(
+            self.client.put(
+                reverse('column_sequence_update'), {'column': 3, 'sequence': 1}
+            )
+        )
+        self.assertCachePatched(
+            self.client.delete(reverse('column_delete'), {'column': 1})
+        )
+
+    # 티켓 생성, 수정, 순서 변경, 삭제 케이스
+    def test_ticket(self):
+        self.assertCachePatched(
+            self.client.post(
+                reverse('ticket_create'),
+                {
+                    'column': 1,
+                    'title': '첫번째티켓',
+                    'tag': 'QA',
+                    'charge': 'normaluser1',
+                    'volume': 2.5,
+                    'ended_at': '2099-12-31'
+                }
+            )
+        )
+        self.assertCachePatched(
+            self.client.put(
+                reverse('ticket_update'),
+                {'ticket': 1, 'title': '수정된티켓', 'charge': 'normaluser1'}
+            )
+        )
+        # 같은 컬럼 안에서 이동
+        self.assertCachePatched(
+            self.client.put(
+                reverse('ticket_sequence_update'),
+                {'ticket': 2, 'column_sequence': 1, 'ticket_sequence': 1}
+            )
+        )
+        # 티켓이 없는 컬럼으로 이동
+        self.assertCachePatched(
+            self.client.put(
+                reverse('ticket_sequence_update'),
+                {'ticket': 1, 'column_sequence': 3, 'ticket_sequence': 1}
+            )
+        )
+        self.assertCachePatched(
+            self.client.delete(reverse('ticket_delete'), {'ticket': 2})
+        )
+
+
+# 티켓 일괄 생성, 수정, 삭제 테스트
+class TicketBulkTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # 생성할 티켓 데이터
+    def ticket_data(self, count, column=1):
+        return [
+            {
+                'column': column,
+                'title': f'일괄티켓{i}',
+                'tag': ['FE', 'Backend', 'QA'][i % 3],
+                'charge': 'normaluser1' if i % 2 else None,
+                'volume': 1.5,
+                'ended_at': '2099-12-31'
+            } for i in range(count)
+        ]
+
+    def bulk_create(self, tickets):
+        return self.client.post(
+            reverse('ticket_bulk_create'), {'ticket': tickets}, format='json'
+        )
+
+    # 컬럼마다 입력된 순서대로 맨 뒤에 추가되고 캐시도 다시 채워지는 케이스
+    def test_create(self):
+        response = self.bulk_create(
+            self.ticket_data(3) + self.ticket_data(2, column=3)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(len(response.data['data']), 5)
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=1).order_by('sequence').values_list('title', 'sequence')),
+            [('첫번째티켓', 1), ('두번째 티켓', 2), ('일괄티켓0', 3), ('일괄티켓1', 4), ('일괄티켓2', 5)]
+        )
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=3).order_by('sequence').values_list('title', 'sequence')),
+            [('일괄티켓0', 1), ('일괄티켓1', 2)]
+        )
+        self.assertEqual(Ticket.objects.get(column_id=3, sequence=2).charge_id, 6)
+        self.assertEqual(diff_board_cache(self.board), [])
+
+    # 티켓 수와 관계없이 쿼리 수가 일정한 케이스
+    def test_create_queries(self):
+        # 사용자 팀 정보가 캐싱되도록 먼저 한 번 요청
+        self.bulk_create(self.ticket_data(1))
+
+        # SQLite는 한 번에 바인딩할 수 있는 값의 수가 제한되어 INSERT 문이 나뉘므로 한 번에 들어가는 범위에서 비교
+        counts = []
+        for count in (10, 100):
+            with CaptureQueriesContext(connection) as context:
+                response = self.bulk_create(self.ticket_data(count))
+
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+            counts.append(len(context.captured_queries))
+
+        self.assertEqual(counts[0], counts[1])
+
+    # 정렬 키 방식에서 정렬 키가 입력된 순서대로 배정되는 케이스
+    @override_settings(BOARD_ORDERING='rank')
+    def test_create_rank(self):
+        rebalance_ranks(force=True)
+
+        response = self.bulk_create(self.ticket_data(100))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        ranks = list(
+            Ticket.objects.filter(column_id=1).order_by('rank').values_list('title', 'rank')
+        )
+        self.assertEqual(
+            [title for title, _ in ranks],
+            ['첫번째티켓', '두번째 티켓'] + [f'일괄티켓{i}' for i in range(100)]
+        )
+        self.assertLessEqual(max(len(rank) for _, rank in ranks), 4)
+
+    # 하나라도 잘못된 티켓이 있으면 아무것도 생성하지 않는 케이스
+    def test_create_invalid(self):
+        tickets = self.ticket_data(4)
+        tickets[1]['tag'] = 'XX'
+        tickets[2]['column'] = 4
+        # 팀 구성원이 아닌 담당자
+        tickets[3]['charge'] = 'normaluser4'
+
+        response = self.bulk_create(tickets)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [sorted(errors) for errors in response.data['data']],
+            [[], ['tag'], ['column'], ['charge']]
+        )
+        self.assertFalse(Ticket.objects.filter(title__startswith='일괄티켓').exists())
+
+    @override_settings(BOARD_BULK_MAX_TICKETS=2)
+    def test_too_many(self):
+        for tickets in (self.ticket_data(3), [], 'ticket'):
+            response = self.bulk_create(tickets)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_update(self):
+        response = self.client.put(
+            reverse('ticket_bulk_update'),
+            {
+                'ticket': [
+                    {'ticket': 1, 'title': '수정된티켓', 'charge': 'normaluser1'},
+                    {'ticket': 3, 'tag': 'Quality Assurance', 'volume': 3}
+                ]
+            },
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            Ticket.objects.filter(id=1).values_list('title', 'charge_id').get(),
+            ('수정된티켓', 6)
+        )
+        self.assertEqual(
+            Ticket.objects.filter(id=3).values_list('tag', 'volume').get(),
+            ('QA', 3.0)
+        )
+        self.assertEqual(diff_board_cache(self.board), [])
+
+    def test_update_invalid(self):
+        other_ticket = Ticket.objects.create(
+            column_id=4, title='다른팀티켓', tag='FE', sequence=1, volume=1, ended_at='2099-12-31'
+        )
+
+        response = self.client.put(
+            reverse('ticket_bulk_update'),
+            {
+                'ticket': [
+                    {'ticket': 1, 'title': '수정된티켓'},
+                    {'ticket': other_ticket.id, 'title': '수정된티켓'},
+                    {'ticket': 1, 'title': '다시수정된티켓'},
+                    {'ticket': 2, 'sequence': 1},
+                    {'ticket': 3, 'ended_at': '2000-01-01'}
+                ]
+            },
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [sorted(errors) for errors in response.data['data']],
+            [[], ['ticket'], ['ticket'], ['ticket'], ['ended_at']]
+        )
+        self.assertEqual(Ticket.objects.get(id=1).title, '첫번째티켓')
+
+    # 수정된 티켓마다 버전이 오르고, 입력된 버전이 다르다면 아무것도 수정되지 않는 케이스
+    def test_update_version(self):
+        response = self.client.put(
+            reverse('ticket_bulk_update'),
+            {
+                'ticket': [
+                    {'ticket': 1, 'title': '수정된티켓', 'version': 1},
+                    {'ticket': 3, 'volume': 3}
+                ]
+            },
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual([ticket['version'] for ticket in response.data['data']], [2, 2])
+
+        response = self.client.put(
+            reverse('ticket_bulk_update'),
+            {
+                'ticket': [
+                    {'ticket': 3, 'title': '다시수정된티켓', 'version': 2},
+                    {'ticket': 1, 'title': '다시수정된티켓', 'version': 1}
+                ]
+            },
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT, response.data)
+        self.assertEqual(response.data['data'][0], {})
+        self.assertEqual(response.data['data'][1]['current_version'], 2)
+        self.assertEqual(
+            list(Ticket.objects.filter(id__in=[1, 3]).order_by('id').values_list('version', flat=True)),
+            [2, 2]
+        )
+        self.assertFalse(Ticket.objects.filter(title='다시수정된티켓').exists())
+        self.assertEqual(diff_board_cache(self.board), [])
+
+        response = self.client.put(
+            reverse('ticket_bulk_update'),
+            {'ticket': [{'ticket': 1, 'version': 0}]},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(sorted(response.data['data'][0]), ['version'])
+
+    # 삭제 후 남은 티켓의 순서값이 다시 매겨지는 케이스
+    def test_delete(self):
+        self.bulk_create(self.ticket_data(3))
+
+        response = self.client.delete(
+            reverse('ticket_bulk_delete'),
+            {'ticket': [1, Ticket.objects.get(title='일괄티켓1').id, 3]},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=1).order_by('sequence').values_list('title', 'sequence')),
+            [('두번째 티켓', 1), ('일괄티켓0', 2), ('일괄티켓2', 3)]
+        )
+        self.assertNotIn('ticket', response.data['data']['column']['In Progress'])
+        self.assertEqual(diff_board_cache(self.board), [])
+
+    def test_delete_invalid(self):
+        other_ticket = Ticket.objects.create(
+            column_id=4, title='다른팀티켓', tag='FE', sequence=1, volume=1, ended_at='2099-12-31'
+        )
+
+        response = self.client.delete(
+            reverse('ticket_bulk_delete'),
+            {'ticket': [1, other_ticket.id, 'x']},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [sorted(errors) for errors in response.data['data']],
+            [[], ['ticket'], ['ticket']]
+        )
+        self.assertTrue(Ticket.objects.filter(id__in=[1, other_ticket.id]).exists())
+
+
+# 같은 컬럼에 동시에 티켓을 추가하는 테스트
+class TicketAppendConcurrencyTestCase(TransactionTestCase):
+    def setUp(self):
+        leader = User.objects.create_user(username='appender', password='qwerty123!@#')
+        team = Team.objects.create(leader=leader, name='동시추가팀')
+        board = Board.objects.create(team=team)
+
+        self.columns = [
+            Column.objects.create(board=board, title=f'컬럼{i}', sequence=i + 1)
+            for i in range(2)
+        ]
+
+    # 여러 스레드에서 동시에 work를 실행
+    # works는 스레드별로 실행할 함수 목록
+    def run_concurrently(self, works):
+        barrier = Barrier(len(works))
+        errors = []
+
+        def run(thread_works):
+            try:
+                barrier.wait()
+                for work in thread_works:
+                    work()
+            except Exception as error:
+                errors.append(error)
+            finally:
+                # 스레드에서 연 DB 연결은 직접 닫아야 함
+                connection.close()
+
+        threads = [Thread(target=run, args=(thread_works,)) for thread_works in works]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    # 검증이 끝난 시리얼라이저를 저장하는 함수
+    # 테스트용 메모리 DB는 다른 연결이 쓰는 동안 읽기도 실패할 수 있으므로 검증은 미리 해둠
+    def single(self, column, title):
+        serializer = TicketSerializer(data=self.ticket_data(column, title))
+        serializer.is_valid(raise_exception=True)
+
+        return lambda: append_ticket(serializer, column)
+
+    # 티켓 여러 개를 한 번에 저장하는 함수
+    def bulk(self, column, titles):
+        tickets = [
+            Ticket(column=column, title=title, tag='BE', volume=1.0, ended_at='2099-12-31')
+            for title in titles
+        ]
+
+        def create():
+            lock_columns([column.id])
+            assign_ticket_positions(tickets)
+            Ticket.objects.bulk_create(tickets)
+
+        return lambda: atomic_with_retry(create)
+
+    def ticket_data(self, column, title):
+        return {
+            'column': column.id,
+            'title': title,
+            'tag': 'BE',
+            'volume': 1.0,
+            'ended_at': '2099-12-31'
+        }
+
+    # 각 컬럼의 순서값이 중복, 빈자리 없이 1부터 매겨졌는지 확인
+    def assertSequential(self, column, count):
+        self.assertEqual(
+            sorted(Ticket.objects.filter(column=column).values_list('sequence', flat=True)),
+            list(range(1, count + 1))
+        )
+
+    def test_append_ticket(self):
+        # 스레드마다 두 컬럼 중 하나에 추가하되 대부분은 첫번째 컬럼에 추가
+        self.run_concurrently([
+            [
+                self.single(self.columns[number % 4 == 3], f'티켓{number}-{i}')
+                for i in range(5)
+            ] for number in range(16)
+        ])
+
+        self.assertSequential(self.columns[0], 60)
+        self.assertSequential(self.columns[1], 20)
+
+    # 하나씩 추가하는 요청과 일괄 추가하는 요청이 섞인 케이스
+    def test_bulk_and_single(self):
+        column = self.columns[0]
+
+        self.run_concurrently([
+            [
+                self.bulk(column, [f'일괄티켓{number}-{i}-{j}' for j in range(3)]) if number % 2
+                else self.single(column, f'티켓{number}-{i}')
+                for i in range(5)
+            ] for number in range(8)
+        ])
+
+        self.assertSequential(column, 4 * 5 + 4 * 5 * 3)
+
+
+# 컬럼, 티켓 수정의 버전 확인(낙관적 동시성 제어) 테스트
+class OptimisticConcurrencyTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        self.board = Board.objects.get(id=1)
+
+        # 다른 테스트에서 캐싱된 데이터가 남아있지 않도록 삭제
+        cache.delete_many([board_cache_key(self.board), board_v2_cache_key(self.board)])
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # 같은 버전으로 두 번 수정하면 두 번째 요청은 충돌
+    def test_ticket_update(self):
+        response = self.client.put(
+            reverse('ticket_update'), {'ticket': 1, 'title': '먼저수정'}, HTTP_IF_MATCH='"1"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response['ETag'], '"2"')
+        self.assertEqual(response.data['data']['version'], 2)
+
+        response = self.client.put(
+            reverse('ticket_update'), {'ticket': 1, 'title': '나중수정'}, HTTP_IF_MATCH='"1"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT, response.data)
+        # 현재 버전을 알려줌
+        self.assertEqual(response['ETag'], '"2"')
+        self.assertEqual(Ticket.objects.get(id=1).title, '먼저수정')
+
+        # 본문의 version 값으로도 버전을 보낼 수 있음
+        response = self.client.put(
+            reverse('ticket_update'), {'ticket': 1, 'title': '나중수정', 'version': 2}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(Ticket.objects.get(id=1).version, 3)
+
+    # 버전을 보내지 않은 요청은 이전처럼 수정되고 버전만 올라감
+    def test_without_version(self):
+        for title in ('첫번째수정', '두번째수정'):
+            response = self.client.put(
+                reverse('ticket_update'), {'ticket': 1, 'title': title}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        self.assertEqual(
+            Ticket.objects.filter(id=1).values_list('title', 'version').get(),
+            ('두번째수정', 3)
+        )
+
+    # 순서 변경도 버전이 다르면 충돌하며 아무것도 옮기지 않음
+    def test_ticket_sequence(self):
+        self.client.put(reverse('ticket_update'), {'ticket': 2, 'volume': 2})
+
+        response = self.client.put(
+            reverse('ticket_sequence_update'),
+            {'ticket': 2, 'column_sequence': 2, 'ticket_sequence': 1},
+            HTTP_IF_MATCH='"1"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT, response.data)
+        self.assertEqual(
+            Ticket.objects.filter(id=2).values_list('column_id', 'sequence').get(), (1, 2)
+        )
+        self.assertEqual(Ticket.objects.get(id=3).sequence, 1)
+
+        response = self.client.put(
+            reverse('ticket_sequence_update'),
+            {'ticket': 2, 'column_sequence': 2, 'ticket_sequence': 1},
+            HTTP_IF_MATCH=response['ETag']
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response['ETag'], '"3"')
+        self.assertEqual(diff_board_cache(self.board), [])
+
+    # 다른 티켓이 순서를 옮겨도 수정하는 티켓의 순서값은 유지됨
+    def test_update_keeps_sequence(self):
+        ticket = Ticket.objects.get(id=2)
+        self.client.put(
+            reverse('ticket_sequence_update'),
+            {'ticket': 1, 'column_sequence': 1, 'ticket_sequence': 2}
+        )
+
+        with mock.patch.object(Ticket.objects, 'get', return_value=ticket):
+            response = self.client.put(
+                reverse('ticket_update'), {'ticket': 2, 'title': '수정된티켓'}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            list(Ticket.objects.filter(column_id=1).order_by('sequence').values_list('id', flat=True)),
+            [2, 1]
+        )
+
+    def test_column(self):
+        response = self.client.put(
+            reverse('column_update'), {'column': 2, 'title': 'Doing'}, HTTP_IF_MATCH='"1"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        for url, data in (
+            ('column_update', {'column': 2, 'title': 'Done'}),
+            ('column_sequence_update', {'column': 2, 'sequence': 1}),
+        ):
+            response = self.client.put(reverse(url), data, HTTP_IF_MATCH='"1"')
+
+            self.assertEqual(response.status_code, status.HTTP_409_CONFLICT, response.data)
+
+        self.assertEqual(
+            Column.objects.filter(id=2).values_list('title', 'sequence', 'version').get(),
+            ('Doing', 2, 2)
+        )
+
+    # v2 보드 데이터에도 수정된 버전이 반영됨
+    def test_board_v2_version(self):
+        self.client.get(reverse('board_list_v2'))
+
+        self.client.put(reverse('ticket_update'), {'ticket': 1, 'title': '수정된티켓'})
+        self.client.put(
+            reverse('ticket_sequence_update'),
+            {'ticket': 3, 'column_sequence': 1, 'ticket_sequence': 1}
+        )
+        self.client.put(reverse('column_update'), {'column': 3, 'title': 'Done'})
+
+        data = self.client.get(reverse('board_list_v2')).data['data']
+
+        self.assertEqual(data, build_board_v2_data(self.board))
+        self.assertEqual(
+            [data['ticket'][ticket_id]['version'] for ticket_id in (1, 2, 3)], [2, 1, 2]
+        )
+        self.assertEqual([column['version'] for column in data['column']], [1, 1, 2])
+
+    def test_invalid_version(self):
+        for headers in (
+            {'HTTP_IF_MATCH': '"abc"'},
+            {'HTTP_IF_MATCH': '"1", "2"'},
+            {'HTTP_IF_MATCH': '"0"'},
+        ):
+            response = self.client.put(
+                reverse('ticket_update'), {'ticket': 1, 'title': '수정'}, **headers
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.data)
+
+
+@override_settings(
+    BOARD_EVENTS_BACKEND='boards.events.InMemoryBoardEvents',
+    BOARD_EVENTS_HEARTBEAT=0.1
+)
+class BoardEventsTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        self.access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+
+        # 브라우저의 EventSource가 URL로 보낼 이벤트 티켓
+        self.events_ticket = self.client.post(
+            reverse('board_events_ticket')
+        ).data['data']['ticket']
+
+    # 트랜잭션이 커밋된 것처럼 이벤트를 발행하면서 API 요청
+    def request(self, method, name, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = getattr(self.client, method)(reverse(name), data)
+
+        self.assertIn(
+            response.status_code,
+            (status.HTTP_200_OK, status.HTTP_201_CREATED),
+            response.data
+        )
+
+        return response
+
+    # 이벤트 API에 연결해 SSE 스트림을 반환
+    async def connect(self, **kwargs):
+        response = await self.async_client.get(reverse('board_events'), **kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        return response.streaming_content
+
+    # 스트림에서 다음 이벤트(하트비트 제외)
+    async def next_event(self, stream):
+        while True:
+            chunk = (await asyncio.wait_for(anext(stream), 5)).decode()
+            if chunk.startswith(':'):
+                continue
+
+            lines = dict(line.split(': ', 1) for line in chunk.strip().split('\n'))
+            event = json.loads(lines['data'])
+            self.assertEqual(lines['id'], f'{event["version"]}')
+
+            return event
+
+    async def test_ticket_events(self):
+        stream = await self.connect(
+            headers={'Authorization': f'Bearer {self.access_token}'}
+        )
+
+        hello = await self.next_event(stream)
+        self.assertEqual(hello['type'], 'board.hello')
+
+        await sync_to_async(self.request)(
+            'put', 'ticket_update', {'ticket': 1, 'title': '수정된티켓'}
+        )
+        event = await self.next_event(stream)
+        self.assertEqual(event['type'], 'ticket.update')
+        self.assertEqual(event['version'], hello['version'] + 1)
+        self.assertEqual(event['ticket']['id'], 1)
+        self.assertEqual(event['ticket']['title'], '수정된티켓')
+        self.assertEqual(event['ticket']['version'], 2)
+
+        await sync_to_async(self.request)(
+            'put',
+            'ticket_sequence_update',
+            {'ticket': 3, 'column_sequence': 1, 'ticket_sequence': 1}
+        )
+        event = await self.next_event(stream)
+        self.assertEqual(event['type'], 'ticket.move')
+        self.assertEqual(
+            [event['ticket']['id'], event['column'], event['past_column'], event['sequence']],
+            [3, 1, 2, 1]
+        )
+        self.assertEqual(event['version'], hello['version'] + 2)
+
+        await sync_to_async(self.request)('delete', 'ticket_delete', {'ticket': 2})
+        event = await self.next_event(stream)
+        self.assertEqual(event, {
+            'type': 'ticket.delete',
+            'ticket': 2,
+            'column': 1,
+            'version': hello['version'] + 3
+        })
+
+        await stream.aclose()
+
+    # 브라우저의 EventSource처럼 ticket 파라미터로 연결하고 컬럼 이벤트를 받음
+    async def test_column_events(self):
+        stream = await self.connect(data={'ticket': self.events_ticket})
+        await self.next_event(stream)
+
+        await sync_to_async(self.request)(
+            'post', 'column_create', {'title': '새컬럼'}
+        )
+        event = await self.next_event(stream)
+        self.assertEqual(event['type'], 'column.create')
+        self.assertEqual(event['column']['title'], '새컬럼')
+        self.assertEqual(event['sequence'], 4)
+
+        await sync_to_async(self.request)(
+            'put', 'column_update', {'column': 3, 'title': 'Done'}
+        )
+        event = await self.next_event(stream)
+        self.assertEqual(event['type'], 'column.update')
+        self.assertEqual(event['column'], {'id': 3, 'title': 'Done', 'version': 2})
+
+        await stream.aclose()
+
+    # 일괄 처리처럼 변경 사항을 하나씩 보낼 수 없을 때는 보드를 다시 조회하도록 알림
+    async def test_board_reload(self):
+        stream = await self.connect(data={'ticket': self.events_ticket})
+        hello = await self.next_event(stream)
+
+        await sync_to_async(self.request)(
+            'put',
+            'ticket_bulk_update',
+            {'ticket': [{'ticket': 1, 'title': '일괄수정'}]}
+        )
+        event = await self.next_event(stream)
+        self.assertEqual(event, {'type': 'board.reload', 'version': hello['version'] + 1})
+
+        await stream.aclose()
+
+    # 다른 팀의 보드 이벤트는 전달되지 않음
+    async def test_other_board(self):
+        subscription = await board_events().subscribe(board_events_channel(2))
+
+        await sync_to_async(self.request)(
+            'put', 'ticket_update', {'ticket': 1, 'title': '수정된티켓'}
+        )
+        self.assertIsNone(await subscription.get(0.1))
+
+        await subscription.close()
+
+    # 최대 유지 시간이 지나면 응답이 끝나고 구독이 해제됨
+    async def test_max_age(self):
+        with self.settings(BOARD_EVENTS_MAX_AGE=0.3):
+            stream = await self.connect(data={'ticket': self.events_ticket})
+            await self.next_event(stream)
+
+            chunks = [chunk async for chunk in stream]
+
+        self.assertTrue(chunks)
+        self.assertTrue(all(chunk == b': heartbeat\n\n' for chunk in chunks))
+        self.assertNotIn(
+            board_events_channel(self.board.id), board_events().subscribers
+        )
+
+    # 커밋되지 않은 변경 사항은 발행되지 않음
+    async def test_rollback(self):
+        subscription = await board_events().subscribe(board_events_channel(self.board.id))
+
+        def update():
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                self.client.put(reverse('ticket_update'), {'ticket': 1, 'title': '수정된티켓'})
+
+            return callbacks
+
+        callbacks = await sync_to_async(update)()
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsNone(await subscription.get(0.1))
+
+        await subscription.close()
+
+    async def test_unauthorized(self):
+        response = await self.async_client.get(reverse('board_events'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = await self.async_client.get(
+            reverse('board_events'), {'ticket': 'invalid'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        # 액세스 토큰은 URL로 받지 않음
+        for params in ({'token': self.access_token}, {'ticket': self.access_token}):
+            response = await self.async_client.get(reverse('board_events'), params)
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        # 다른 용도로 서명된 값은 이벤트 티켓으로 사용할 수 없음
+        response = await self.async_client.get(
+            reverse('board_events'), {'ticket': signing.dumps({'user': 1})}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # 만료된 이벤트 티켓
+    @override_settings(BOARD_EVENTS_TICKET_TIMEOUT=-1)
+    async def test_expired_ticket(self):
+        response = await self.async_client.get(
+            reverse('board_events'), {'ticket': self.events_ticket}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # 팀에 소속되지 않은 사용자
+    def test_not_team_member(self):
+        access_token = self.client.post(
+            reverse('login'),
+            {'username': 'normaluser4', 'password': 'qwerty123!@#'}
+        ).data.get('access')
+
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = client.post(reverse('board_events_ticket'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(
+            reverse('board_events'),
+            {'ticket': issue_events_ticket(User.objects.get(username='normaluser4'))}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class BoardListAsyncTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+
+        # 다른 테스트에서 캐싱된 데이터가 남아있지 않도록 삭제
+        cache.delete_many([
+            board_cache_key(self.board),
+            membership_cache_key(1),
+            membership_cache_key(6)
+        ])
+        board_local_cache.clear()
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        self.access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+
+    # 동기 뷰와 같은 응답
+    def test_same_as_sync(self):
+        response = self.client.get(reverse('board_list_async'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        sync_response = self.client.get(reverse('board_list'))
+
+        self.assertEqual(response.content, sync_response.content)
+        self.assertEqual(response['ETag'], sync_response['ETag'])
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+
+    # 캐시가 없으면 직렬화해 캐싱
+    def test_cache_miss(self):
+        response = self.client.get(reverse('board_list_async'))
+
+        self.assertEqual(
+            json.loads(response.content)['data'],
+            json.loads(json.dumps(BoardSerializer(self.board).data, cls=JSONEncoder))
+        )
+        self.assertIsNotNone(cache.get(board_cache_key(self.board)))
+
+    # 캐싱된 보드는 DB 조회 없이 제공(사용자 조회 한 번)
+    def test_cache_hit(self):
+        self.client.get(reverse('board_list_async'))
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('board_list_async'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_not_modified(self):
+        etag = self.client.get(reverse('board_list_async'))['ETag']
+
+        response = self.client.get(reverse('board_list_async'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+        # 보드가 바뀌면 새 데이터를 받음
+        self.client.put(reverse('ticket_update'), {'ticket': 1, 'title': '수정된티켓'})
+
+        response = self.client.get(reverse('board_list_async'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('수정된티켓', response.content.decode())
+
+    # 비동기 클라이언트로 여러 요청을 동시에 보내도 모두 같은 데이터를 받음
+    async def test_concurrent_reads(self):
+        headers = {'Authorization': f'Bearer {self.access_token}'}
+
+        responses = await asyncio.gather(*[
+            self.async_client.get(reverse('board_list_async'), headers=headers)
+            for _ in range(20)
+        ])
+
+        self.assertEqual({response.status_code for response in responses}, {status.HTTP_200_OK})
+        self.assertEqual(len({response.content for response in responses}), 1)
+
+    # 비동기 버전의 팀 정보는 동기 버전과 같음
+    async def test_membership(self):
+        for user_id in (1, 6):
+            user = await User.objects.aget(id=user_id)
+
+            # 캐시가 없을 때(DB)와 있을 때(캐시)
+            for _ in range(2):
+                membership = await aload_membership(user)
+                expected = await sync_to_async(query_membership)(user)
+
+                self.assertEqual(membership.board.id, expected.board.id)
+                self.assertEqual(membership.is_team_leader, expected.is_team_leader)
+
+    def test_unauthorized(self):
+        self.client.credentials()
+        response = self.client.get(reverse('board_list_async'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer invalid')
+        response = self.client.get(reverse('board_list_async'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # 팀에 소속되지 않은 사용자
+    def test_not_team_member(self):
+        access_token = self.client.post(
+            reverse('login'),
+            {'username': 'normaluser4', 'password': 'qwerty123!@#'}
+        ).data.get('access')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        response = self.client.get(reverse('board_list_async'))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class CacheResilienceTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+
+        # 다른 테스트에서 캐싱된 데이터가 남아있지 않도록 삭제
+        cache.delete_many([
+            board_cache_key(self.board),
+            board_v2_cache_key(self.board),
+            'test:pipeline:a',
+            'test:pipeline:b',
+            'test:pipeline:counter'
+        ])
+        board_local_cache.clear()
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    def tearDown(self):
+        # 차단기는 프로세스 전체에서 공유되므로 다음 테스트에 영향이 없도록 닫음
+        cache_circuit.reset()
+
+    # Redis와의 왕복 횟수를 세는 컨텍스트
+    def count_round_trips(self):
+        calls = []
+        send = Connection.send_packed_command
+
+        def counted(connection, command, *args, **kwargs):
+            calls.append(command)
+            return send(connection, command, *args, **kwargs)
+
+        return calls, mock.patch.object(Connection, 'send_packed_command', counted)
+
+    # 차단기를 연 상태로 만듦
+    def open_circuit(self):
+        for _ in range(settings.CACHE_CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(ConnectionInterrupted):
+                with cache_circuit:
+                    raise ConnectionInterrupted(connection=None)
+
+    # 파이프라인으로 저장한 값은 cache로, cache로 저장한 값은 파이프라인으로 읽을 수 있음
+    @skipUnless(is_redis_cache(), 'Redis의 파이프라인, pub/sub, 연결을 확인')
+    def test_pipeline_compatible(self):
+        cache.set('test:pipeline:a', {'title': '티켓'}, 60)
+
+        pipeline = CachePipeline()
+        pipeline.get('test:pipeline:a')
+        pipeline.get('test:pipeline:missing', 'default')
+        pipeline.set('test:pipeline:b', [1, 2, 3], 60)
+        pipeline.add('test:pipeline:b', 'ignored', 60)
+        pipeline.add('test:pipeline:counter', 10, None)
+        pipeline.incr('test:pipeline:counter')
+        pipeline.get_many(['test:pipeline:a', 'test:pipeline:b', 'test:pipeline:missing'])
+
+        calls, patch = self.count_round_trips()
+        with patch:
+            results = pipeline.execute()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [
+            {'title': '티켓'},
+            'default',
+            True,
+            False,
+            True,
+            11,
+            {'test:pipeline:a': {'title': '티켓'}, 'test:pipeline:b': [1, 2, 3]}
+        ])
+        self.assertEqual(cache.get('test:pipeline:b'), [1, 2, 3])
+        self.assertEqual(cache.get('test:pipeline:counter'), 11)
+        self.assertEqual(cache.incr('test:pipeline:counter'), 12)
+
+        pipeline.set_many({'test:pipeline:a': 1, 'test:pipeline:b': 2}, 60)
+        pipeline.delete_many(['test:pipeline:a', 'test:pipeline:missing'])
+        self.assertEqual(pipeline.execute(), [[], 1])
+        self.assertEqual(
+            cache.get_many(['test:pipeline:a', 'test:pipeline:b']), {'test:pipeline:b': 2}
+        )
+
+    # 수정 요청의 보드 캐시 작업은 세 번의 왕복으로 끝남
+    @skipUnless(is_redis_cache(), 'Redis의 파이프라인, pub/sub, 연결을 확인')
+    def test_patch_round_trips(self):
+        self.client.get(reverse('board_list'))
+        self.client.get(reverse('board_list_v2'))
+
+        ticket = Ticket.objects.get(id=1)
+        old_title = ticket.title
+        ticket.title = '수정된티켓'
+        ticket.save()
+
+        calls, patch = self.count_round_trips()
+        with patch:
+            patch_board_cache(self.board, update_ticket, ticket, old_title, ticket.column_id)
+
+        self.assertEqual(len(calls), 3)
+
+        # v1, v2 캐시 모두 새 버전으로 수정되어 있음
+        self.assertEqual(diff_board_cache(self.board), [])
+        self.assertEqual(
+            cache.get(board_v2_cache_key(self.board)), build_board_v2_data(self.board)
+        )
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker('test')
+
+        # 캐시와 관계없는 예외는 실패로 보지 않음
+        for _ in range(settings.CACHE_CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(KeyError):
+                with breaker:
+                    raise KeyError
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        for _ in range(settings.CACHE_CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(ConnectionInterrupted):
+                with breaker:
+                    raise ConnectionInterrupted(connection=None)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        with self.assertRaises(CircuitOpen):
+            with breaker:
+                pass
+
+        with self.settings(CACHE_CIRCUIT_RESET_TIMEOUT=0):
+            # 반열림 상태에서 실패하면 바로 다시 열림
+            with self.assertRaises(ConnectionInterrupted):
+                with breaker:
+                    raise ConnectionInterrupted(connection=None)
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+            # 반열림 상태에서는 요청 하나만 시도
+            with breaker:
+                with self.assertRaises(CircuitOpen):
+                    with breaker:
+                        pass
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.failures, 0)
+
+    # 반열림 시도 중에 다른 요청(컨텍스트)의 블록이 끝나도 두 번째 시도는 들어오지 않음
+    def test_circuit_breaker_probe(self):
+        breaker = CircuitBreaker('test')
+        regular, probe = contextvars.copy_context(), contextvars.copy_context()
+
+        # 차단기가 닫혀있을 때 시작된 요청
+        regular.run(breaker.__enter__)
+
+        for _ in range(settings.CACHE_CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(ConnectionInterrupted):
+                with breaker:
+                    raise ConnectionInterrupted(connection=None)
+
+        with self.settings(CACHE_CIRCUIT_RESET_TIMEOUT=0):
+            probe.run(breaker.__enter__)
+            self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+
+            # 먼저 시작된 요청이 캐시와 관계없는 예외로 끝남
+            regular.run(breaker.__exit__, KeyError, KeyError(), None)
+            self.assertTrue(breaker.probing)
+
+            with self.assertRaises(CircuitOpen):
+                with breaker:
+                    pass
+
+            probe.run(breaker.__exit__, None, None, None)
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertFalse(breaker.probing)
+
+    # 차단기가 열려있으면 캐시 없이 DB에서 직렬화해 응답
+    def test_board_list_without_cache(self):
+        expected = json.loads(json.dumps(BoardSerializer(self.board).data, cls=JSONEncoder))
+        self.open_circuit()
+
+        with mock.patch('boards.views.get_board_data') as get_board_data:
+            for name in ('board_list', 'board_list_async'):
+                response = self.client.get(reverse(name))
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertNotIn('ETag', response)
+                self.assertEqual(response['Cache-Control'], 'no-store')
+                self.assertEqual(json.loads(response.content)['data'], expected)
+
+            response = self.client.get(reverse('board_list_v2'))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['data'], build_board_v2_data(self.board))
+
+        get_board_data.assert_not_called()
+
+    # 차단기가 열려있어도 DB 수정은 커밋되고 수정 요청은 성공함
+    # 이 프로세스의 L1 캐시에 남은 이전 데이터는 제공하지 않음
+    def test_write_without_cache(self):
+        board_local_cache.set(self.board.team.name, 1, BoardSerializer(self.board).data, 1)
+        board_local_cache.set_version(self.board.team.name, 1)
+        self.open_circuit()
+
+        # Redis가 응답하지 않는 상태
+        unavailable = mock.patch(
+            'boards.caches.cache_pipeline', side_effect=ConnectionInterrupted(connection=None)
+        )
+        with unavailable, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(
+                reverse('ticket_update'), {'ticket': 1, 'title': '수정된티켓'}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(Ticket.objects.get(id=1).title, '수정된티켓')
+            self.assertIsNone(board_local_cache.get(self.board.team.name, 1))
+
+            response = self.client.put(
+                reverse('ticket_sequence_update'),
+                {'ticket': 2, 'column_sequence': 1, 'ticket_sequence': 1}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(Ticket.objects.get(id=2).sequence, 1)
+
+            response = self.client.delete(reverse('ticket_delete'), {'ticket': 1})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertFalse(Ticket.objects.filter(id=1).exists())
+
+    # Redis가 응답하지 않아도 DB에서 직렬화해 응답하고, 계속 실패하면 차단기가 열려 Redis에 요청하지 않음
+    @skipUnless(is_redis_cache(), 'Redis의 파이프라인, pub/sub, 연결을 확인')
+    def test_cache_timeout(self):
+        expected = json.loads(json.dumps(BoardSerializer(self.board).data, cls=JSONEncoder))
+        calls = []
+
+        def timeout(connection, command, *args, **kwargs):
+            calls.append(command)
+            raise RedisTimeoutError('Timeout reading from socket')
+
+        with mock.patch.object(Connection, 'send_packed_command', timeout):
+            for _ in range(settings.CACHE_CIRCUIT_FAILURE_THRESHOLD):
+                response = self.client.get(reverse('board_list'))
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(json.loads(response.content)['data'], expected)
+
+            self.assertEqual(cache_circuit.state, CircuitBreaker.OPEN)
+
+            calls.clear()
+            response = self.client.get(reverse('board_list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(calls, [])
+
+
+# 프로세스 안의 보드 캐시(L1) 테스트
+class BoardLocalCacheTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+        self.team_name = self.board.team.name
+
+        # 다른 테스트에서 캐싱된 데이터가 남아있지 않도록 삭제
+        cache.delete_many([board_cache_key(self.board), board_v2_cache_key(self.board)])
+        board_local_cache.clear()
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # 무효화 메시지 구독이 시작될 때까지 대기
+    def wait_listening(self):
+        board_local_cache.get_version(self.team_name)
+
+        deadline = monotonic() + 5
+        while (not board_local_cache.listening) and (monotonic() < deadline):
+            sleep(0.01)
+
+        self.assertTrue(board_local_cache.listening)
+
+    # 기억하고 있는 버전이 바뀔 때까지 대기
+    def wait_version(self, version):
+        deadline = monotonic() + 5
+        while monotonic() < deadline:
+            cached = board_local_cache.versions.get(self.team_name)
+            if (cached is not None) and (cached[0] == version):
+                return
+            sleep(0.01)
+
+        self.fail(f'버전 {version}이 반영되지 않았습니다.')
+
+    # L1 캐시에 있는 보드 데이터는 Redis에 요청하지 않고 반환
+    def test_hit(self):
+        version = get_board_version(self.board)
+        data = get_board_data(self.board, version)
+
+        calls = []
+        send = Connection.send_packed_command
+
+        def counted(connection, command, *args, **kwargs):
+            calls.append(command)
+            return send(connection, command, *args, **kwargs)
+
+        with mock.patch.object(Connection, 'send_packed_command', counted):
+            self.assertIs(get_board_data(self.board, version), data)
+
+        self.assertEqual(calls, [])
+        self.assertEqual(board_local_cache.stats()['hits'], 1)
+
+    # 같은 프로세스에서 보드가 수정되면 다음 조회에 바로 반영
+    def test_local_write(self):
+        response = self.client.get(reverse('board_list'))
+        etag = response['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(
+                reverse('ticket_update'),
+                {'ticket': 1, 'title': '수정된티켓'}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('board_list'))
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(
+            json.loads(response.content)['data'],
+            json.loads(json.dumps(BoardSerializer(self.board).data, cls=JSONEncoder))
+        )
+
+    # 다른 프로세스에서 보드가 수정되면 무효화 메시지를 받아 반영
+    @override_settings(BOARD_LOCAL_VERSION_TTL=60)
+    # 다른 프로세스에서 보드가 수정되면 무효화 메시지를 받아 반영
+    @override_settings(BOARD_LOCAL_VERSION_TTL=60)
+    @skipUnless(is_redis_cache(), 'Redis의 파이프라인, pub/sub, 연결을 확인')
+    def test_remote_invalidation(self):
+        self.wait_listening()
+
+        response = self.client.get(reverse('board_list'))
+        version = get_board_version(self.board)
+        self.assertEqual(response['ETag'], board_etag(self.board, version))
+
+        # 다른 프로세스에서 버전을 올림, 메시지를 받기 전에는 기억하고 있는 버전으로 응답
+        cache.incr(board_version_key(self.board))
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(response['ETag'], board_etag(self.board, version))
+
+        get_redis_connection().publish(
+            BOARD_INVALIDATION_CHANNEL, board_invalidation_message(self.team_name, version + 1)
+        )
+        self.wait_version(version + 1)
+
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(response['ETag'], board_etag(self.board, version + 1))
+        self.assertGreaterEqual(board_local_cache.stats()['invalidations'], 1)
+
+    # 수정 요청은 새 버전을 무효화 채널에 발행
+    @skipUnless(is_redis_cache(), 'Redis의 파이프라인, pub/sub, 연결을 확인')
+    def test_write_publishes(self):
+        pubsub = get_redis_connection().pubsub()
+        pubsub.subscribe(BOARD_INVALIDATION_CHANNEL)
+        pubsub.get_message(timeout=1)
+
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.put(
+                    reverse('ticket_update'),
+                    {'ticket': 1, 'title': '수정된티켓'}
+                )
+
+            message = pubsub.get_message(timeout=1)
+        finally:
+            pubsub.close()
+
+        self.assertEqual(json.loads(message['data']), {
+            'team': self.team_name,
+            'version': get_board_version(self.board)
+        })
+
+    # 최대 크기를 넘으면 가장 오래 사용되지 않은 보드부터 삭제
+    @override_settings(BOARD_LOCAL_CACHE_MAX_BYTES=100)
+    def test_eviction(self):
+        local_cache = BoardLocalCache()
+        local_cache.set('a', 1, {'a': 1}, 60)
+        local_cache.set('b', 1, {'b': 1}, 30)
+        local_cache.get('a', 1)
+        local_cache.set('c', 1, {'c': 1}, 30)
+
+        self.assertIsNone(local_cache.get('b', 1))
+        self.assertEqual(local_cache.get('a', 1), {'a': 1})
+        self.assertEqual(local_cache.get('c', 1), {'c': 1})
+
+        # 최대 크기보다 큰 보드는 저장하지 않음
+        local_cache.set('d', 1, {'d': 1}, 101)
+        self.assertIsNone(local_cache.get('d', 1))
+
+        stats = local_cache.stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['bytes'], 90)
+        self.assertEqual(stats['hits'], 3)
+        self.assertEqual(stats['misses'], 2)
+
+    # 유지 시간이 지난 보드는 삭제
+    def test_ttl(self):
+        local_cache = BoardLocalCache()
+
+        with self.settings(BOARD_LOCAL_CACHE_TTL=0):
+            local_cache.set('a', 1, {'a': 1}, 10)
+        self.assertIsNone(local_cache.get('a', 1))
+        self.assertEqual(local_cache.stats()['bytes'], 0)
+
+        local_cache.set('a', 1, {'a': 1}, 10)
+        self.assertEqual(local_cache.get('a', 1), {'a': 1})
+
+    # 새 버전을 받으면 이전 버전의 보드는 삭제
+    def test_invalidate(self):
+        local_cache = BoardLocalCache()
+        local_cache.set('a', 1, {'a': 1}, 10)
+        local_cache.set('a', 2, {'a': 2}, 10)
+        local_cache.set('b', 1, {'b': 1}, 10)
+
+        local_cache.invalidate('a', 2)
+
+        self.assertIsNone(local_cache.get('a', 1))
+        self.assertEqual(local_cache.get('a', 2), {'a': 2})
+        self.assertEqual(local_cache.get('b', 1), {'b': 1})
+        self.assertEqual(local_cache.versions['a'][0], 2)
+
+    # 최대 크기가 0이면 사용하지 않음
+    @override_settings(BOARD_LOCAL_CACHE_MAX_BYTES=0)
+    def test_disabled(self):
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('board_list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(board_local_cache.stats()['entries'], 0)
+        self.assertEqual(board_local_cache.stats()['hits'], 0)
+
+    # 조회 결과는 프로세스별로 캐시에 저장되어 확인할 수 있음
+    def test_stats(self):
+        version = get_board_version(self.board)
+        get_board_data(self.board, version)
+        get_board_data(self.board, version)
+
+        stats = board_local_cache_stats()
+
+        self.assertIn(f'{socket.gethostname()}:{os.getpid()}', stats)
+        result = stats[f'{socket.gethostname()}:{os.getpid()}']
+        self.assertEqual(result['hits'], 1)
+        self.assertEqual(result['misses'], 1)
+        self.assertEqual(result['hit_ratio'], 0.5)
+        self.assertEqual(result['entries'], 1)
+
+
+# 캐시 구현(redis, locmem, file) 테스트
+# 같은 만료, 삭제 규칙을 따르고 보드 캐시가 Redis 없이도 동작하는지 확인
+class CacheBackendTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+        board_local_cache.clear()
+
+    # 설정된 구현들을 별칭으로 사용할 수 있는 CACHES 설정
+    # Redis는 기본 캐시가 Redis일 때만 포함
+    def backend_settings(self, max_entries=300, cull_frequency=3):
+        backends = {}
+        for name in ('locmem', 'file'):
+            backends[name] = {
+                **settings.CACHE_BACKENDS[name],
+                'OPTIONS': {'MAX_ENTRIES': max_entries, 'CULL_FREQUENCY': cull_frequency},
+            }
+        backends['locmem']['LOCATION'] = f'test-{self.directory}'
+        backends['file']['LOCATION'] = self.directory
+
+        if is_redis_cache():
+            backends['redis'] = settings.CACHES['default']
+
+        return {'default': settings.CACHES['default'], **backends}
+
+    def backends(self):
+        return [name for name in ('redis', 'locmem', 'file') if name in settings.CACHES]
+
+    # 만료 시간이 지난 키는 사라지고 None이면 만료되지 않음
+    def test_ttl(self):
+        with self.settings(CACHES=self.backend_settings()):
+            for name in self.backends():
+                caches[name].delete_many(['test:backend:ttl', 'test:backend:forever'])
+                caches[name].set('test:backend:ttl', 1, 1)
+                caches[name].set('test:backend:forever', 2, None)
+                self.assertEqual(caches[name].get('test:backend:ttl'), 1, name)
+
+            sleep(1.1)
+
+            for name in self.backends():
+                self.assertIsNone(caches[name].get('test:backend:ttl'), name)
+                self.assertEqual(caches[name].get('test:backend:forever'), 2, name)
+                caches[name].delete('test:backend:forever')
+
+    # incr은 만료 시간을 유지하고 add는 키가 없을 때만 저장
+    def test_incr_add(self):
+        with self.settings(CACHES=self.backend_settings()):
+            for name in self.backends():
+                backend = caches[name]
+                backend.delete_many(['test:backend:counter', 'test:backend:missing'])
+
+                self.assertTrue(backend.add('test:backend:counter', 10, 1))
+                self.assertFalse(backend.add('test:backend:counter', 0, 1))
+                self.assertEqual(backend.incr('test:backend:counter'), 11, name)
+                self.assertEqual(backend.incr('test:backend:counter', 5), 16, name)
+                with self.assertRaises(ValueError):
+                    backend.incr('test:backend:missing')
+
+            sleep(1.1)
+
+            for name in self.backends():
+                self.assertIsNone(caches[name].get('test:backend:counter'), name)
+
+    # 가득 차면 가장 오래 사용되지 않은 키부터 삭제
+    # Redis는 서버의 maxmemory-policy 설정을 따르므로 제외
+    def test_lru_eviction(self):
+        with self.settings(CACHES=self.backend_settings(max_entries=3, cull_frequency=3)):
+            for name in ('locmem', 'file'):
+                backend = caches[name]
+                for i in range(3):
+                    backend.set(f'test:backend:{i}', i, None)
+                    sleep(0.01)
+
+                # 0을 사용하면 가장 오래 사용되지 않은 키는 1
+                self.assertEqual(backend.get('test:backend:0'), 0)
+                sleep(0.01)
+                backend.set('test:backend:3', 3, None)
+
+                self.assertIsNone(backend.get('test:backend:1'), name)
+                for i in (0, 2, 3):
+                    self.assertEqual(backend.get(f'test:backend:{i}'), i, name)
+
+    # 여러 스레드(프로세스)가 동시에 올려도 값을 잃지 않음
+    def test_file_incr_concurrent(self):
+        backend = MmapFileCache(self.directory, {})
+        backend.set('test:backend:counter', 0, None)
+
+        def incr():
+            for _ in range(50):
+                backend.incr('test:backend:counter')
+
+        threads = [Thread(target=incr) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(backend.get('test:backend:counter'), 200)
+
+    # 파일 캐시의 호출도 요청별 측정 결과에 기록됨
+    # add 안에서 호출되는 set, get_many 안에서 호출되는 get은 중복으로 기록되지 않음
+    @override_settings(REQUEST_METRICS_SERVER_TIMING=True)
+    def test_file_metrics(self):
+        backend = MmapFileCache(self.directory, {})
+
+        def view(request):
+            backend.set('test:backend:metrics', 1, None)
+            backend.get('test:backend:metrics')
+            backend.get('test:backend:missing')
+            backend.add('test:backend:metrics', 2)
+            backend.incr('test:backend:metrics')
+            backend.has_key('test:backend:metrics')
+            backend.get_many(['test:backend:metrics', 'test:backend:missing'])
+
+            return HttpResponse()
+
+        response = RequestMetricsMiddleware(view)(RequestFactory().get('/'))
+
+        self.assertIn('desc="7 calls 2 hits 2 misses"', response['Server-Timing'])
+
+    # Redis가 아닌 캐시의 파이프라인도 CachePipeline과 같은 결과를 반환
+    def test_pipeline(self):
+        backend = self.backend_settings()['locmem']
+
+        with self.settings(CACHES={'default': backend}):
+            self.assertIsInstance(cache_pipeline(), SequentialCachePipeline)
+
+            cache.set('test:pipeline:a', {'title': '티켓'}, 60)
+
+            pipeline = cache_pipeline()
+            pipeline.get('test:pipeline:a')
+            pipeline.get('test:pipeline:missing', 'default')
+            pipeline.set('test:pipeline:b', [1, 2, 3], 60)
+            pipeline.add('test:pipeline:b', 'ignored', 60)
+            pipeline.incr('test:pipeline:counter')
+            pipeline.get_many(['test:pipeline:a', 'test:pipeline:b', 'test:pipeline:missing'])
+            pipeline.publish(BOARD_INVALIDATION_CHANNEL, 'message')
+
+            self.assertEqual(pipeline.execute(), [
+                {'title': '티켓'},
+                'default',
+                True,
+                False,
+                1,
+                {'test:pipeline:a': {'title': '티켓'}, 'test:pipeline:b': [1, 2, 3]},
+                0
+            ])
+
+            pipeline.set_many({'test:pipeline:a': 1, 'test:pipeline:b': 2}, 60)
+            pipeline.delete_many(['test:pipeline:a', 'test:pipeline:missing'])
+            self.assertEqual(pipeline.execute(), [[], 1])
+            self.assertEqual(
+                cache.get_many(['test:pipeline:a', 'test:pipeline:b']), {'test:pipeline:b': 2}
+            )
+
+    # Redis 없이도 로그인, 보드 캐시, 조건부 요청, 수정 후 캐시 갱신이 동작
+    def test_board_cache(self):
+        client = APIClient()
+        board = Board.objects.get(id=1)
+        backends = self.backend_settings()
+
+        for name in ('locmem', 'file'):
+            with self.settings(
+                CACHES={'default': backends[name]},
+                BOARD_EVENTS_BACKEND='boards.events.InMemoryBoardEvents'
+            ):
+                board_local_cache.clear()
+
+                access_token = client.post(
+                    reverse('login'),
+                    {'username': 'teamleader1', 'password': 'qwerty123!@#'}
+                ).data.get('access')
+                client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+                self.assertIsNotNone(cache.get(access_token), name)
+
+                response = client.get(reverse('board_list'))
+                self.assertEqual(response.status_code, status.HTTP_200_OK, name)
+
+                response = client.get(
+                    reverse('board_list'), HTTP_IF_NONE_MATCH=response['ETag']
+                )
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED, name)
+
+                with self.captureOnCommitCallbacks(execute=True):
+                    client.put(reverse('ticket_update'), {'ticket': 1, 'title': name})
+
+                self.assertEqual(diff_board_cache(board), [], name)
+                response = client.get(reverse('board_list'))
+                self.assertEqual(
+                    json.loads(response.content)['data'],
+                    json.loads(json.dumps(BoardSerializer(board).data, cls=JSONEncoder))
+                )
+
+                # 로그아웃하면 캐시에 저장된 리프레시 토큰이 삭제됨
+                client.post(reverse('logout'))
+                self.assertIsNone(cache.get(access_token), name)
+
+
+# 요청별 SQL, 캐시, 직렬화 측정 테스트
+@override_settings(BOARD_LOCAL_CACHE_MAX_BYTES=0)
+class RequestMetricsTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        # APIClient 객체 생성
+        self.client = APIClient()
+
+        # 첫번째팀의 보드
+        self.board = Board.objects.get(id=1)
+
+        # 다른 테스트에서 캐싱된 데이터가 남아있지 않도록 삭제
+        cache.delete_many([
+            board_cache_key(self.board),
+            board_fresh_key(self.board),
+            membership_cache_key(1)
+        ])
+
+        # 기존 DB의 사용자 중 팀장 사용자로 로그인
+        login_data = {
+            'username': 'teamleader1',
+            'password': 'qwerty123!@#'
+        }
+
+        access_token = self.client.post(
+            reverse('login'),
+            login_data
+        ).data.get('access')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+        metrics_registry.clear()
+
+    # Server-Timing 헤더의 {이름: (시간(ms), 설명)}
+    def server_timing(self, response):
+        timing = {}
+        for metric in response['Server-Timing'].split(', '):
+            name, *params = metric.split(';')
+            params = dict(param.split('=', 1) for param in params)
+            timing[name] = (float(params['dur']), params.get('desc', '').strip('"'))
+
+        return timing
+
+    # 실행된 SQL 쿼리 수와 캐시 적중, 실패가 Server-Timing 헤더에 기록됨
+    def test_server_timing(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('board_list'))
+
+        timing = self.server_timing(response)
+        self.assertEqual(timing['db'][1], f'{len(queries)} queries')
+        self.assertGreater(timing['db'][0], 0)
+        self.assertGreater(timing['serialize'][0], 0)
+        self.assertGreaterEqual(timing['total'][0], timing['db'][0])
+        self.assertRegex(timing['cache'][1], r'^\d+ calls \d+ hits [1-9]\d* misses$')
+
+        # 캐싱된 다음에는 보드를 조회하지 않고(사용자 조회만) 캐시 조회는 모두 적중
+        cold = len(queries)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('board_list'))
+
+        timing = self.server_timing(response)
+        self.assertEqual(timing['db'][1], f'{len(queries)} queries')
+        self.assertLess(len(queries), cold)
+        self.assertRegex(timing['cache'][1], r'^\d+ calls [1-9]\d* hits 0 misses$')
+
+    # 비동기 뷰에서 sync_to_async로 실행된 쿼리도 기록됨
+    def test_async_view(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('board_list_async'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.server_timing(response)['db'][1], f'{len(queries)} queries')
+
+    # URL 이름, 메소드별로 모아 Prometheus 형식으로 제공
+    def test_metrics(self):
+        self.client.get(reverse('board_list'))
+        self.client.get(reverse('board_list'))
+        with CaptureQueriesContext(connection) as queries:
+            self.client.put(reverse('ticket_update'), {'ticket': 1, 'title': '수정된티켓'})
+
+        stats = metrics_registry.snapshot()
+        self.assertEqual(stats[('board_list', 'GET')]['count'], 2)
+        self.assertEqual(stats[('board_list', 'GET')]['statuses'], {200: 2})
+        self.assertEqual(stats[('ticket_update', 'PUT')]['queries'], len(queries))
+
+        text = render_metrics(stats)
+        self.assertIn(
+            'pms_http_requests_total{view="board_list",method="GET",status="200"} 2', text
+        )
+        self.assertIn(
+            'pms_db_queries_per_request_bucket{view="board_list",method="GET",le="+Inf"} 2', text
+        )
+        self.assertIn(
+            f'pms_db_queries_total{{view="ticket_update",method="PUT"}} {len(queries)}', text
+        )
+        self.assertIn('# TYPE pms_cache_hits_total counter', text)
+
+        # 여러 프로세스의 결과를 더해서 응답
+        self.assertGreaterEqual(collect_metrics()[('board_list', 'GET')]['count'], 2)
+
+        with self.settings(METRICS_TOKEN='', METRICS_ALLOW_ANONYMOUS=True):
+            response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn('pms_http_request_duration_seconds_bucket{view="board_list"', response.content.decode())
+
+    # 토큰이 설정되어 있다면 토큰이 있어야 조회 가능
+    @override_settings(METRICS_TOKEN='metrics-token')
+    def test_metrics_token(self):
+        client = APIClient()
+
+        self.assertEqual(client.get(reverse('metrics')).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer metrics-token')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    # 토큰이 설정되지 않았다면 METRICS_ALLOW_ANONYMOUS일 때만 조회 가능
+    # DEBUG만으로는 조회할 수 없음
+    @override_settings(METRICS_TOKEN='')
+    def test_metrics_without_token(self):
+        client = APIClient()
+
+        with self.settings(DEBUG=True, METRICS_ALLOW_ANONYMOUS=False):
+            self.assertEqual(client.get(reverse('metrics')).status_code, status.HTTP_403_FORBIDDEN)
+
+        with self.settings(METRICS_ALLOW_ANONYMOUS=True):
+            self.assertEqual(client.get(reverse('metrics')).status_code, status.HTTP_200_OK)
+
+    @override_settings(REQUEST_METRICS_SERVER_TIMING=False)
+    def test_server_timing_disabled(self):
+        response = self.client.get(reverse('board_list'))
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(metrics_registry.snapshot()[('board_list', 'GET')]['count'], 1)
+
+
+# 보드 API 벤치마크 명령(benchmark_api)
+class BenchmarkApiTestCase(APITestCase):
+    fixtures = ['db.json']
+
+    def setUp(self):
+        board_local_cache.clear()
+
+    def test_benchmark(self):
+        output = StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'result.json')
+            call_command(
+                'benchmark_api',
+                teams=2,
+                columns=2,
+                tickets=3,
+                iterations=2,
+                warmup=1,
+                output=path,
+                stdout=output
+            )
+            with open(path) as f:
+                result = json.load(f)
+
+            # 이전 결과와 비교
+            call_command(
+                'benchmark_api',
+                teams=1,
+                columns=2,
+                tickets=3,
+                iterations=2,
+                warmup=0,
+                scenario=['board_list_warm'],
+                compare=path,
+                stdout=output
+            )
+
+        self.assertEqual(result['meta']['teams'], 2)
+        self.assertEqual(
+            list(result['results']),
+            [
+                'board_list_cold',
+                'board_list_warm',
+                'ticket_create',
+                'ticket_sequence_within',
+                'ticket_sequence_across',
+                'column_delete',
+            ]
+        )
+        for scenario in result['results'].values():
+            self.assertEqual(scenario['iterations'], 2)
+            self.assertGreater(scenario['queries']['mean'], 0)
+            ms = scenario['ms']
+            self.assertTrue(ms['p50'] <= ms['p95'] <= ms['p99'] <= ms['max'], ms)
+            self.assertGreater(scenario['peak_kib'], 0)
+        # 캐시된 보드 조회는 캐시가 없는 조회보다 쿼리가 적음
+        self.assertLess(
+            result['results']['board_list_warm']['queries']['mean'],
+            result['results']['board_list_cold']['queries']['mean']
+        )
+        self.assertIn('vs baseline', output.getvalue())
+
+        # 합성 데이터는 모두 삭제됨
+        self.assertFalse(User.objects.filter(username__startswith='bench-').exists())
+        self.assertFalse(Team.objects.filter(name__startswith='bench-').exists())
+        self.assertFalse(Group.objects.filter(name__startswith='bench-').exists())
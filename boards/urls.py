@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views import (
     BoardListView,
+    BoardListV2View,
     ColumnCreateView,
     ColumnUpdateView,
     ColumnUpdateSequenceView,
@@ -9,12 +10,27 @@ from .views import (
     TicketCreateView,
     TicketUpdateView,
     TicketUpdateSequenceView,
-    TicketDeleteView
+    TicketDeleteView,
+    TicketBulkCreateView,
+    TicketBulkUpdateView,
+    TicketBulkDeleteView,
+    TicketListView,
+    BoardEventsTicketView,
+    board_list_async_view,
+    board_events_view
 )
 
 
 urlpatterns = [
     path('board/list/', BoardListView.as_view(), name='board_list'),
+    path('board/list/v2/', BoardListV2View.as_view(), name='board_list_v2'),
+    path('board/list/async/', board_list_async_view, name='board_list_async'),
+    path('board/events/', board_events_view, name='board_events'),
+    path(
+        'board/events/ticket/',
+        BoardEventsTicketView.as_view(),
+        name='board_events_ticket'
+    ),
     path('column/create/', ColumnCreateView.as_view(), name='column_create'),
     path('column/update/', ColumnUpdateView.as_view(), name='column_update'),
     path(
@@ -30,5 +46,21 @@ urlpatterns = [
         TicketUpdateSequenceView.as_view(),
         name='ticket_sequence_update'
     ),
-    path('ticket/delete/', TicketDeleteView.as_view(), name='ticket_delete')
+    path('ticket/delete/', TicketDeleteView.as_view(), name='ticket_delete'),
+    path(
+        'ticket/bulk/create/',
+        TicketBulkCreateView.as_view(),
+        name='ticket_bulk_create'
+    ),
+    path(
+        'ticket/bulk/update/',
+        TicketBulkUpdateView.as_view(),
+        name='ticket_bulk_update'
+    ),
+    path(
+        'ticket/bulk/delete/',
+        TicketBulkDeleteView.as_view(),
+        name='ticket_bulk_delete'
+    ),
+    path('ticket/list/', TicketListView.as_view(), name='ticket_list')
 ]
@@ -0,0 +1,64 @@
+from django.db.models import F
+from django.utils.http import parse_etags, quote_etag
+
+
+# 컬럼, 티켓 수정의 낙관적 동시성 제어
+# 클라이언트는 마지막으로 받은 컬럼, 티켓의 버전을 If-Match 헤더("버전")나 version 값으로 보냄
+# 버전이 DB와 다르다면 그 사이에 다른 사용자가 수정한 것이므로 잠금을 기다리지 않고 바로 409 응답
+# 버전을 보내지 않은 요청은 이전처럼 마지막에 수정한 값이 반영됨
+
+
+# 다른 요청이 먼저 수정해 클라이언트가 알고 있는 버전이 DB와 다를 때 발생
+class VersionConflict(Exception):
+    def __init__(self, version):
+        super().__init__('다른 사용자가 먼저 수정했습니다. 최신 데이터를 다시 조회한 다음 수정해주세요.')
+        self.version = version
+
+
+# 컬럼, 티켓 버전의 ETag
+def version_etag(version):
+    return quote_etag(f'{version}')
+
+
+# 요청에서 클라이언트가 알고 있는 버전
+# 버전을 보내지 않았거나 If-Match가 '*'이면 None, 형식이 잘못되었다면 ValueError 발생
+def expected_version(request):
+    if_match = request.headers.get('If-Match')
+    if if_match is not None:
+        etags = parse_etags(if_match)
+        if etags == ['*']:
+            return None
+        if len(etags) != 1:
+            raise ValueError('If-Match에는 버전을 하나만 입력해주세요.')
+
+        # parse_etags는 따옴표를 포함한 값을 반환함
+        version = etags[0].removeprefix('W/').strip('"')
+    else:
+        version = request.data.get('version')
+        if version is None:
+            return None
+
+    version = int(version)
+    if version <= 0:
+        raise ValueError('버전은 1 이상이어야 합니다.')
+
+    return version
+
+
+# 버전이 expected와 같을 때만 버전을 1 올림
+# 비교와 증가를 하나의 UPDATE 문으로 실행하므로 행을 미리 잠그지 않음
+# 이후의 수정과 같은 트랜잭션 안에서 호출해야 함
+def claim_version(obj, expected=None):
+    queryset = type(obj).objects.filter(id=obj.id)
+    if expected is not None:
+        queryset = queryset.filter(version=expected)
+
+    if not queryset.update(version=F('version') + 1):
+        raise VersionConflict(
+            type(obj).objects.filter(id=obj.id).values_list('version', flat=True).first()
+        )
+
+    if expected is None:
+        obj.refresh_from_db(fields=['version'])
+    else:
+        obj.version = expected + 1
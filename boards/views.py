@@ -2,26 +2,104 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.utils.encoders import JSONEncoder
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction, DatabaseError
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.conf import settings
+from django.utils.http import parse_etags
 
 from drf_yasg.utils import swagger_auto_schema
 
+from config.authentication import TeamJWTAuthentication, issue_events_ticket
+from config.circuit_breaker import CACHE_UNAVAILABLE, cache_circuit
+from config.metrics import measure_serialization
 from config.permissions import IsTeamLeader, IsTeamMember
-from teams.models import Team
 from users.models import User
 from .models import Board, Column, Ticket
 from .serializers import (
     ColumnSerializer,
     BoardSerializer,
-    TicketSerializer
+    TicketSerializer,
+    build_ticket_data,
+    build_board_v2_data
+)
+from .caches import (
+    board_etag,
+    board_v2_etag,
+    get_board_data,
+    record_and_get_board_version,
+    arecord_and_get_board_version,
+    board_cache_headers,
+    aget_board_version,
+    aget_board_data,
+    get_board_v2_data,
+    patch_board_cache,
+    rebuild_board_cache,
+    insert_column,
+    update_column,
+    move_column,
+    delete_column,
+    insert_ticket,
+    update_ticket,
+    move_ticket,
+    move_ticket_to_column,
+    delete_ticket
+)
+from .events import board_events, board_events_channel
+from .bulk import (
+    bulk_items,
+    prepare_ticket_create,
+    assign_ticket_positions,
+    prepare_ticket_update,
+    claim_ticket_versions,
+    version_conflict_errors,
+    prepare_ticket_delete,
+    renumber_tickets
+)
+from .streaming import stream_board_json
+from .pagination import InvalidCursor, encode_cursor, decode_cursor, after
+from .versions import VersionConflict, version_etag, expected_version, claim_version
+from .ranks import is_rank_ordering, ordering_field
+from .sequences import (
+    column_position,
+    ticket_position,
+    column_at,
+    next_column_position,
+    append_ticket,
+    atomic_with_retry,
+    lock_columns,
+    reorder_column,
+    reorder_ticket,
+    relocate_ticket,
+    close_ticket_gap
 )
 
 from swagger import *
 
+from asgiref.sync import sync_to_async
+
 from datetime import datetime
+from time import monotonic
+import json
+
+
+# 다른 요청이 먼저 수정해 버전이 맞지 않을 때의 응답
+# 현재 버전을 ETag로 알려줌
+def version_conflict_response(error):
+    headers = {}
+    if error.version is not None:
+        headers['ETag'] = version_etag(error.version)
+
+    return Response(
+        {'data': f'{error}'},
+        status=status.HTTP_409_CONFLICT,
+        headers=headers
+    )
 
 
 # /api/v1/boards/column/create/
@@ -44,34 +122,19 @@ class ColumnCreateView(APIView):
         }
     )
     def post(self, request):
-        user = request.user
-
         # 컬럼 제목
         title = request.data.get('title')
         # 컬럼 제목은 필수값이므로 없다면 상태 코드 반환
         if title is None:
             return Response({'data': '컬럼 제목을 입력해주세요.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            # 사용자 그룹의 팀명으로 팀 객체 찾기
-            # 현재 로그인한 사용자가 팀장으로 있는 팀이 맞는지는 권한 레벨에서 체크중
-            team = Team.objects.get(
-                name=user.groups.exclude(name='leader').first().name
-            )
-            # 팀 객체로 보드 찾기
-            board = Board.objects.get(team=team)
-        except ObjectDoesNotExist as error:
-            return Response({'data': f'{error}'}, status=status.HTTP_404_NOT_FOUND)
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        # 현재 로그인한 사용자가 팀장으로 있는 팀이 맞는지는 권한 레벨에서 체크중
+        board = request.membership.board
 
-        try:
-            # 보드 내부의 컬럼을 정렬
-            # 순서 필드를 내림차순으로 정렬하면 첫번째 객체의 순서는 가장 마지막 순서가 됨
-            last_sequence = Column.objects.filter(
-                board=board
-            ).order_by('-sequence').first().sequence + 1
-        except AttributeError:
-            # 보드 내부에 컬럼이 없다면 순서를 1번으로 설정
-            last_sequence = 1
+        # 보드의 가장 마지막 순서와 정렬 키
+        # 보드 내부에 컬럼이 없다면 순서를 1번으로 설정
+        last_sequence, rank = next_column_position(board)
 
         # 직렬화 전 데이터를 묶어줌
         column_data = {
@@ -82,14 +145,10 @@ class ColumnCreateView(APIView):
 
         serializer = ColumnSerializer(data=column_data)
         if serializer.is_valid():
-            serializer.save()
+            serializer.save(rank=rank)
 
-            # 변경된 보드 데이터를 캐싱
-            cache.set(
-                f'{team.name}',
-                BoardSerializer(Board.objects.get(team=team)).data,
-                60 * 60
-            )
+            # 캐싱된 보드 데이터에 새 컬럼만 추가
+            patch_board_cache(board, insert_column, serializer.instance)
 
             # 값이 유효한 경우
             return Response({'data': serializer.data}, status=status.HTTP_201_CREATED)
@@ -109,12 +168,14 @@ class ColumnUpdateView(APIView):
         operation_description='컬럼 id와 기타 데이터를 받아 컬럼을 수정합니다.',
         tags=['컬럼', '수정'],
         request_body=COLUMN_UPDATE_PARAMETER,
+        manual_parameters=[IF_MATCH_PARAMETER],
         responses={
             200: SUCCESS_MESSAGE_200,
             400: ERROR_MESSAGE_400,
             401: ERROR_MESSAGE_401,
             403: ERROR_MESSAGE_403,
-            404: ERROR_MESSAGE_404
+            404: ERROR_MESSAGE_404,
+            409: ERROR_MESSAGE_409
         }
     )
     def put(self, request):
@@ -123,12 +184,14 @@ class ColumnUpdateView(APIView):
                 {'data': '순서 변경은 시도할 수 없습니다.'}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        user = request.user
+        try:
+            # 클라이언트가 알고 있는 컬럼 버전
+            version = expected_version(request)
+        except (ValueError, TypeError) as error:
+            return Response({'data': f'{error}'}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 사용자 그룹 정보로 팀 객체 가져옴
-        own_board = Board.objects.get(
-            team__name=user.groups.exclude(name='leader').first().name
-        )
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
 
         try:
             # 현재 사용자의 팀이 소유한 보드의 특정 컬럼을 가져옴
@@ -139,22 +202,31 @@ class ColumnUpdateView(APIView):
         except (ObjectDoesNotExist, ValueError) as error:
             return Response({'data': f'{error}'}, status=status.HTTP_404_NOT_FOUND)
 
+        # 캐시된 데이터에서 컬럼을 찾기 위해 수정 전 제목을 기억해둠
+        old_title = column.title
+
         # 해당하는 필드만 업데이트
         # 여기서 변경할 수 있는 값은 제목밖에 없음
         serializer = ColumnSerializer(column, request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            try:
+                # 버전이 맞을 때만 수정
+                with transaction.atomic():
+                    claim_version(column, version)
+                    # 조회한 뒤에 다른 컬럼의 순서 변경으로 바뀌었을 수 있는 순서값을 덮어쓰지 않도록 다시 읽음
+                    column.refresh_from_db(fields=['sequence', 'rank'])
+                    serializer.save()
+            except VersionConflict as error:
+                return version_conflict_response(error)
 
-            # 변경된 보드 데이터를 캐싱
-            cache.set(
-                f'{own_board.team.name}',
-                BoardSerializer(
-                    Board.objects.get(team=own_board.team)
-                ).data,
-                60 * 60
-            )
+            # 캐싱된 보드 데이터에서 수정된 컬럼만 변경
+            patch_board_cache(own_board, update_column, column, old_title)
 
-            return Response({'data': serializer.data}, status=status.HTTP_200_OK)
+            return Response(
+                {'data': serializer.data},
+                status=status.HTTP_200_OK,
+                headers={'ETag': version_etag(column.version)}
+            )
 
         return Response({'data': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -170,30 +242,30 @@ class ColumnUpdateSequenceView(APIView):
         operation_description='컬럼 id와 변경된 순서를 받아 컬럼 순서를 수정합니다.',
         tags=['컬럼', '수정', '순서'],
         request_body=COLUMN_UPDATE_SEQUENCE_PARAMETER,
+        manual_parameters=[IF_MATCH_PARAMETER],
         responses={
             200: SUCCESS_MESSAGE_200,
             400: ERROR_MESSAGE_400,
             401: ERROR_MESSAGE_401,
             403: ERROR_MESSAGE_403,
-            404: ERROR_MESSAGE_404
+            404: ERROR_MESSAGE_404,
+            409: ERROR_MESSAGE_409
         }
     )
     def put(self, request):
-        user = request.user
-
         try:
             # 유효하지 않은 순서값을 입력했을 때를 대비한 예외처리
             update_sequence = int(request.data.get('sequence'))
+            # 클라이언트가 알고 있는 컬럼 버전
+            version = expected_version(request)
         except (ValueError, TypeError) as error:
             return Response(
                 {'data': f'{error}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 사용자 그룹 정보로 팀 객체 가져옴
-        own_board = Board.objects.get(
-            team__name=user.groups.exclude(name='leader').first().name
-        )
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
 
         try:
             # 현재 사용자의 팀이 소유한 보드의 특정 컬럼을 가져옴
@@ -205,7 +277,9 @@ class ColumnUpdateSequenceView(APIView):
             return Response({'data': f'{error}'}, status=status.HTTP_404_NOT_FOUND)
 
         # 현재 보드에 있는 컬럼 총 갯수
-        column_count = len(Column.objects.filter(board=own_board))
+        column_count = Column.objects.filter(board=own_board).count()
+        # 정렬 키 방식에서는 정렬 키 순서상의 위치가 순서값
+        target_column.sequence = column_position(target_column)
         # 만약 업데이트할 순서값이 현재 위치 그대로일 경우
         if target_column.sequence == update_sequence:
             return Response(
@@ -220,61 +294,38 @@ class ColumnUpdateSequenceView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # 캐시된 데이터의 순서를 옮기기 위해 변경 전 순서를 기억해둠
+        old_sequence = target_column.sequence
+
         try:
             # 트랜잭션으로 관리
             # 하나라도 문제가 발생하면 전부 롤백
             with transaction.atomic():
-                # 순서를 변경할 컬럼의 순서가 원래 있던 자리보다 왼쪽으로 갈 때(순서값이 작아질 때)
-                if target_column.sequence > update_sequence:
-                    # 순서를 변경할 컬럼과 변경 후 가게 될 자리 사이에 있는 컬럼들을 오름차순으로 가져옴
-                    before_target_columns = Column.objects.filter(
-                        sequence__gte=update_sequence,
-                        sequence__lt=target_column.sequence
-                    ).order_by('sequence')
-
-                    # 순회하면서 순서값들을 1씩 상승
-                    for column in before_target_columns:
-                        column.sequence += 1
-                        column.save()
-
-                    # 순서를 변경할 컬럼의 순서를 변경하고자 했던 순서로 변경
-                    target_column.sequence = update_sequence
-                    target_column.save()
-                # 순서를 변경할 컬럼의 순서가 원래 있던 자리보다 오른쪽으로 갈 때(순서값이 커질 때)
-                else:
-                    # 순서를 변경할 컬럼과 변경 후 가게 될 자리 사이에 있는 컬럼들을 오름차순으로 가져옴
-                    after_target_columns = Column.objects.filter(
-                        sequence__gt=target_column.sequence,
-                        sequence__lte=update_sequence
-                    ).order_by('sequence')
-
-                    # 순회하면서 순서값들을 1씩 감소
-                    for column in after_target_columns:
-                        column.sequence -= 1
-                        column.save()
-
-                    # 순서를 변경할 컬럼의 순서를 변경하고자 했던 순서로 변경
-                    target_column.sequence = update_sequence
-                    target_column.save()
+                # 버전이 맞을 때만 순서 변경
+                claim_version(target_column, version)
+                # 순서를 변경할 컬럼과 변경 후 가게 될 자리 사이에 있는 컬럼들을 한 번에 옮김
+                reorder_column(target_column, update_sequence)
+        except VersionConflict as error:
+            return version_conflict_response(error)
         except DatabaseError as error:
             return Response(
                 {'data': f'{error}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-        # 데이터 직렬화
-        serializer = BoardSerializer(own_board)
-
-        # 변경된 보드 데이터를 캐싱
-        cache.set(
-            f'{own_board.team.name}',
-            serializer.data,
-            60 * 60
+        # 캐싱된 보드 데이터에서 컬럼 순서만 변경
+        board_data = patch_board_cache(
+            own_board,
+            move_column,
+            target_column,
+            old_sequence,
+            column_count
         )
 
         return Response(
-            {'data': serializer.data},
-            status=status.HTTP_200_OK
+            {'data': board_data},
+            status=status.HTTP_200_OK,
+            headers={'ETag': version_etag(target_column.version)}
         )
 
 
@@ -297,12 +348,8 @@ class ColumnDeleteView(APIView):
         }
     )
     def delete(self, request):
-        user = request.user
-
-        # 사용자 그룹 정보로 팀 객체 가져옴
-        own_board = Board.objects.get(
-            team__name=user.groups.exclude(name='leader').first().name
-        )
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
 
         try:
             # 현재 사용자의 팀이 소유한 보드의 특정 컬럼을 가져옴
@@ -314,19 +361,17 @@ class ColumnDeleteView(APIView):
             return Response({'data': f'{error}'}, status=status.HTTP_404_NOT_FOUND)
 
         # 해당 컬럼 삭제
+        # 삭제 후에는 id가 사라지므로 캐시 수정을 위해 기억해둠
+        column_id = column.id
+        # 정렬 키 방식에서는 정렬 키 순서상의 위치가 순서값
+        column.sequence = column_position(column)
         column.delete()
+        column.id = column_id
 
-        # 컬럼이 삭제된 다음의 보드 제공
-        serializer = BoardSerializer(own_board)
+        # 캐싱된 보드 데이터에서 컬럼만 삭제한 다음의 보드 제공
+        board_data = patch_board_cache(own_board, delete_column, column)
 
-        # 변경된 보드 데이터를 캐싱
-        cache.set(
-            f'{own_board.team.name}',
-            serializer.data,
-            60 * 60
-        )
-
-        return Response({'data': serializer.data}, status=status.HTTP_200_OK)
+        return Response({'data': board_data}, status=status.HTTP_200_OK)
 
 
 # /api/v1/boards/ticket/create/
@@ -349,8 +394,6 @@ class TicketCreateView(APIView):
         }
     )
     def post(self, request):
-        user = request.user
-
         try:
             # 티켓 제목
             title = request.data.get('title')
@@ -399,10 +442,8 @@ class TicketCreateView(APIView):
             )
 
         try:
-            # 사용자 그룹 정보로 팀 객체 가져옴
-            own_board = Board.objects.get(
-                team__name=user.groups.exclude(name='leader').first().name
-            )
+            # 인증 단계에서 가져온 사용자 팀의 보드
+            own_board = request.membership.board
 
             # 입력된 컬럼 id와 보드가 일치하는 컬럼을 가져옴
             # 컬럼 id는 정상적인데 타 팀의 보드인 경우 방지
@@ -416,16 +457,6 @@ class TicketCreateView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        try:
-            # 컬럼 내부의 티켓을 정렬
-            # 순서 필드를 내림차순으로 정렬하면 첫번째 객체는 가장 마지막에 위치하고 있는 티켓이 됨
-            last_sequence = Ticket.objects.filter(
-                column=column
-            ).order_by('-sequence').first().sequence + 1
-        except AttributeError:
-            # 컬럼 내부에 티켓이 없다면 순서를 1번으로 설정
-            last_sequence = 1
-
         charge_user = request.data.get('charge')
         if charge_user is not None:
             # 입력받은 담당자 계정명이 유효하지 않은 경우
@@ -443,21 +474,24 @@ class TicketCreateView(APIView):
             'charge': charge_user,
             'title': title,
             'tag': tag,
-            'sequence': last_sequence,
             'volume': volume,
             'ended_at': ended_at,
         }
 
         serializer = TicketSerializer(data=ticket_data)
         if serializer.is_valid():
-            serializer.save()
+            try:
+                # 컬럼을 잠근 상태에서 컬럼의 마지막 순서값을 읽어 맨 뒤 순서로 저장
+                # 컬럼 내부에 티켓이 없다면 순서를 1번으로 설정
+                append_ticket(serializer, column)
+            except DatabaseError as error:
+                return Response(
+                    {'data': f'{error}'},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
 
-            # 변경된 보드 데이터를 캐싱
-            cache.set(
-                f'{own_board.team.name}',
-                BoardSerializer(Board.objects.get(team=own_board.team)).data,
-                60 * 60
-            )
+            # 캐싱된 보드 데이터에 새 티켓만 추가
+            patch_board_cache(own_board, insert_ticket, serializer.instance)
 
             # 값이 유효한 경우
             return Response({'data': serializer.data}, status=status.HTTP_201_CREATED)
@@ -477,12 +511,14 @@ class TicketUpdateView(APIView):
         operation_description='티켓 id와 기타 데이터를 받아 티켓을 수정합니다.',
         tags=['티켓', '수정'],
         request_body=TICKET_UPDATE_PARAMETER,
+        manual_parameters=[IF_MATCH_PARAMETER],
         responses={
             200: SUCCESS_MESSAGE_200,
             400: ERROR_MESSAGE_400,
             401: ERROR_MESSAGE_401,
             403: ERROR_MESSAGE_403,
-            404: ERROR_MESSAGE_404
+            404: ERROR_MESSAGE_404,
+            409: ERROR_MESSAGE_409
         }
     )
     def put(self, request):
@@ -491,16 +527,18 @@ class TicketUpdateView(APIView):
                 {'data': '순서 변경은 시도할 수 없습니다.'}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        user = request.user
+        try:
+            # 클라이언트가 알고 있는 티켓 버전
+            version = expected_version(request)
+        except (ValueError, TypeError) as error:
+            return Response({'data': f'{error}'}, status=status.HTTP_400_BAD_REQUEST)
 
         # request.data는 불변 객체
         # 값이 변경되어야 하는 케이스들이 있으므로 깊은 복사한 값을 사용
         request_data = request.data.copy()
 
-        # 사용자 그룹 정보로 팀 객체 가져옴
-        own_board = Board.objects.get(
-            team__name=user.groups.exclude(name='leader').first().name
-        )
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
 
         try:
             ended_at = request.data.get('ended_at')
@@ -536,19 +574,38 @@ class TicketUpdateView(APIView):
         except (ObjectDoesNotExist, ValueError, AttributeError) as error:
             return Response({'data': f'{error}'}, status=status.HTTP_404_NOT_FOUND)
 
+        # 캐시된 데이터에서 티켓을 찾기 위해 수정 전 제목과 컬럼을 기억해둠
+        old_title = ticket.title
+        old_column_id = ticket.column_id
+
         # 해당하는 필드만 업데이트
         serializer = TicketSerializer(ticket, request_data, partial=True)
         if serializer.is_valid():
-            serializer.save()
-
-            # 변경된 보드 데이터를 캐싱
-            cache.set(
-                f'{own_board.team.name}',
-                BoardSerializer(Board.objects.get(team=own_board.team)).data,
-                60 * 60
+            try:
+                # 버전이 맞을 때만 수정
+                with transaction.atomic():
+                    claim_version(ticket, version)
+                    # 조회한 뒤에 다른 요청의 순서 변경, 이동으로 바뀌었을 수 있는 값을 다시 읽음
+                    # 저장은 요청에 들어온 필드만 하므로 이 값들을 덮어쓰지 않고 캐시 수정에만 사용됨
+                    ticket.refresh_from_db(fields=['column', 'sequence', 'rank'])
+                    serializer.save()
+            except VersionConflict as error:
+                return version_conflict_response(error)
+
+            # 캐싱된 보드 데이터에서 수정된 티켓만 변경
+            patch_board_cache(
+                own_board,
+                update_ticket,
+                ticket,
+                old_title,
+                old_column_id
             )
 
-            return Response({'data': serializer.data}, status=status.HTTP_200_OK)
+            return Response(
+                {'data': serializer.data},
+                status=status.HTTP_200_OK,
+                headers={'ETag': version_etag(ticket.version)}
+            )
 
         return Response({'data': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -564,25 +621,24 @@ class TicketUpdateSequenceView(APIView):
         operation_description='변경할 컬럼 id와 티켓 id를 받아 티켓 순서를 수정합니다.',
         tags=['티켓', '수정', '순서'],
         request_body=TICKET_UPDATE_SEQUENCE_PARAMETER,
+        manual_parameters=[IF_MATCH_PARAMETER],
         responses={
             200: SUCCESS_MESSAGE_200,
             400: ERROR_MESSAGE_400,
             401: ERROR_MESSAGE_401,
             403: ERROR_MESSAGE_403,
-            404: ERROR_MESSAGE_404
+            404: ERROR_MESSAGE_404,
+            409: ERROR_MESSAGE_409
         }
     )
     def put(self, request):
-        user = request.user
-
-        # 사용자 그룹 정보로 팀 객체 가져옴
-        own_board = Board.objects.get(
-            team__name=user.groups.exclude(name='leader').first().name
-        )
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
 
         try:
             # 현재 사용자의 팀이 소유한 보드의 순서를 변경할 티켓을 가져옴
-            target_ticket = Ticket.objects.get(
+            # 캐시된 데이터 수정에 필요한 컬럼, 담당자도 함께 가져옴
+            target_ticket = Ticket.objects.select_related('column', 'charge').get(
                 id=request.data.get('ticket'),
                 column__board=own_board
             )
@@ -593,19 +649,29 @@ class TicketUpdateSequenceView(APIView):
         try:
             update_column_sequence = int(request.data.get('column_sequence'))
             update_ticket_sequence = int(request.data.get('ticket_sequence'))
+            # 클라이언트가 알고 있는 티켓 버전
+            version = expected_version(request)
         except (ValueError, TypeError) as error:
             return Response(
                 {'data': f'{error}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # 정렬 키 방식에서는 정렬 키 순서상의 위치가 순서값
+        target_ticket.sequence = ticket_position(target_ticket)
+        target_ticket.column.sequence = column_position(target_ticket.column)
+
+        # 캐시된 데이터의 순서를 옮기기 위해 변경 전 컬럼과 순서를 기억해둠
+        past_column = target_ticket.column
+        old_sequence = target_ticket.sequence
+
         try:
             # 만약 컬럼 단위의 변경이 없다면
             if update_column_sequence == target_ticket.column.sequence:
                 # 해당 컬럼의 티켓 갯수
-                ticket_count = len(
-                    Ticket.objects.filter(column=target_ticket.column)
-                )
+                ticket_count = Ticket.objects.filter(
+                    column=target_ticket.column
+                ).count()
 
                 # 티켓 단위의 변경도 없다면
                 if target_ticket.sequence == update_ticket_sequence:
@@ -623,45 +689,16 @@ class TicketUpdateSequenceView(APIView):
                 # 트랜잭션으로 관리
                 # 하나라도 문제가 발생하면 전부 롤백
                 with transaction.atomic():
-                    # 순서를 변경할 티켓의 순서가 원래 있던 자리보다 왼쪽으로 갈 때(순서값이 작아질 때)
-                    if target_ticket.sequence > update_ticket_sequence:
-                        # 순서를 변경할 티켓과 변경 후 가게 될 자리 사이에 있는 티켓들을 오름차순으로 가져옴
-                        before_target_tickets = Ticket.objects.filter(
-                            column=target_ticket.column,
-                            sequence__gte=update_ticket_sequence,
-                            sequence__lt=target_ticket.sequence
-                        ).order_by('sequence')
-
-                        # 순회하면서 순서값들을 1씩 상승
-                        for ticket in before_target_tickets:
-                            ticket.sequence += 1
-                            ticket.save()
-
-                        target_ticket.sequence = update_ticket_sequence
-                        target_ticket.save()
-                    # 순서를 변경할 컬럼의 순서가 원래 있던 자리보다 오른쪽으로 갈 때(순서값이 커질 때)
-                    else:
-                        # 순서를 변경할 컬럼과 변경 후 가게 될 자리 사이에 있는 컬럼들을 오름차순으로 가져옴
-                        after_target_tickets = Ticket.objects.filter(
-                            column=target_ticket.column,
-                            sequence__gt=target_ticket.sequence,
-                            sequence__lte=update_ticket_sequence
-                        ).order_by('sequence')
-
-                        # 순회하면서 순서값들을 1씩 감소
-                        for ticket in after_target_tickets:
-                            ticket.sequence -= 1
-                            ticket.save()
-
-                        # 순서를 변경할 티켓의 순서를 변경하고자 했던 순서로 변경
-                        target_ticket.sequence = update_ticket_sequence
-                        target_ticket.save()
+                    # 버전이 맞을 때만 순서 변경
+                    claim_version(target_ticket, version)
+                    # 순서를 변경할 티켓과 변경 후 가게 될 자리 사이에 있는 티켓들을 한 번에 옮김
+                    reorder_ticket(target_ticket, update_ticket_sequence)
             # 컬럼 단위의 변경이 있다면
             else:
                 try:
-                    destination_column = Column.objects.get(
-                        board=own_board,
-                        sequence=update_column_sequence
+                    destination_column = column_at(
+                        own_board,
+                        update_column_sequence
                     )
                 except ObjectDoesNotExist as error:
                     return Response(
@@ -669,53 +706,57 @@ class TicketUpdateSequenceView(APIView):
                         status=status.HTTP_404_NOT_FOUND
                     )
 
-                # 도착할 컬럼의, 티켓 데이터가 들어갈 순서값 이상의 데이터를 오름차순으로
-                destination_column_tickets = Ticket.objects.filter(
-                    column=destination_column,
-                    sequence__gte=update_ticket_sequence
-                ).order_by('sequence')
+                # 도착할 컬럼의 티켓 갯수
+                destination_count = Ticket.objects.filter(
+                    column=destination_column
+                ).count()
 
-                # 원래 있던 컬럼의 티켓 데이터를 오름차순으로
-                past_column_tickets = Ticket.objects.filter(
-                    column=target_ticket.column
-                ).order_by('sequence')
+                # 도착할 컬럼의 맨 뒤(티켓 수 + 1)보다 큰 값을 받았거나 0 이하의 값을 받았을 경우
+                # 그대로 저장하면 0번 순서나 빈 순서가 생기고 이후에도 메워지지 않음
+                if (update_ticket_sequence > destination_count + 1) or (update_ticket_sequence <= 0):
+                    return Response(
+                        {'data': '유효한 순서값을 입력해주세요.'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
 
                 # 트랜잭션으로 관리
                 # 하나라도 문제가 발생하면 전부 롤백
                 with transaction.atomic():
-                    # 순회 돌면서 순서를 수정할 티켓이 들어갈 자리 이상의 순서값을 가진 티켓들의 순서값을 전부 +1
-                    for ticket in destination_column_tickets:
-                        ticket.sequence += 1
-                        ticket.save()
-
-                    # 순서를 수정할 티켓값의 컬럼값과 순서값을 수정
-                    target_ticket.column = destination_column
-                    target_ticket.sequence = update_ticket_sequence
-                    target_ticket.save()
-
-                    # 원래 있던 컬럼의 티켓들을 순회하면서 순서 수정
-                    for i in range(len(past_column_tickets)):
-                        past_column_tickets[i].sequence = i + 1
-                        past_column_tickets[i].save()
+                    claim_version(target_ticket, version)
+                    # 도착할 컬럼의 티켓들을 밀어내고, 원래 있던 컬럼의 빈자리를 메움
+                    relocate_ticket(
+                        target_ticket,
+                        destination_column,
+                        update_ticket_sequence
+                    )
+        except VersionConflict as error:
+            return version_conflict_response(error)
         except DatabaseError as error:
             return Response(
                 {'data': f'{error}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-        # 직렬화
-        serializer = BoardSerializer(own_board)
-
-        # 변경된 보드 데이터를 캐싱
-        cache.set(
-            f'{own_board.team.name}',
-            serializer.data,
-            60 * 60
-        )
+        # 캐싱된 보드 데이터에서 옮겨진 티켓 부분만 변경
+        if target_ticket.column_id == past_column.id:
+            board_data = patch_board_cache(
+                own_board,
+                move_ticket,
+                target_ticket,
+                old_sequence
+            )
+        else:
+            board_data = patch_board_cache(
+                own_board,
+                move_ticket_to_column,
+                target_ticket,
+                past_column
+            )
 
         return Response(
-            {'data': serializer.data},
-            status=status.HTTP_200_OK
+            {'data': board_data},
+            status=status.HTTP_200_OK,
+            headers={'ETag': version_etag(target_ticket.version)}
         )
 
 
@@ -738,12 +779,8 @@ class TicketDeleteView(APIView):
         }
     )
     def delete(self, request):
-        user = request.user
-
-        # 사용자 그룹 정보로 팀 객체 가져옴
-        own_board = Board.objects.get(
-            team__name=user.groups.exclude(name='leader').first().name
-        )
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
 
         try:
             # 현재 사용자의 팀이 소유한 보드의 특정 티켓을 가져옴
@@ -754,34 +791,191 @@ class TicketDeleteView(APIView):
         except (ObjectDoesNotExist, ValueError, TypeError) as error:
             return Response({'data': f'{error}'}, status=status.HTTP_404_NOT_FOUND)
 
+        # 삭제 후에는 id가 사라지므로 캐시 수정을 위해 기억해둠
+        ticket_id = ticket.id
+        # 정렬 키 방식에서는 정렬 키 순서상의 위치가 순서값
+        ticket.sequence = ticket_position(ticket)
+
         try:
             with transaction.atomic():
-                # 해당 컬럼 삭제
+                # 해당 티켓 삭제
                 ticket.delete()
 
                 # 남은 티켓들의 순서 정리
-                remain_tickets = Ticket.objects.filter(
-                    column=ticket.column
-                ).order_by('sequence')
-                for i in range(len(remain_tickets)):
-                    remain_tickets[i].sequence = (i + 1)
+                close_ticket_gap(ticket.column_id, ticket.sequence)
+        except DatabaseError as error:
+            return Response(
+                {'data': f'{error}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        # 캐싱된 보드 데이터에서 티켓만 삭제한 다음의 보드 제공
+        ticket.id = ticket_id
+        board_data = patch_board_cache(own_board, delete_ticket, ticket)
+
+        return Response({'data': board_data}, status=status.HTTP_200_OK)
+
+
+# /api/v1/boards/ticket/bulk/create/
+class TicketBulkCreateView(APIView):
+    # 권한 설정
+    # 팀에 소속된 팀원에게 권한 부여
+    permission_classes = [IsAuthenticated, IsTeamMember]
+
+    @swagger_auto_schema(
+        operation_id='티켓 일괄 생성',
+        operation_description='티켓 목록을 받아 한 번에 생성합니다. 하나라도 잘못된 티켓이 있다면 아무것도 생성하지 않습니다.',
+        tags=['티켓', '생성'],
+        request_body=TICKET_BULK_CREATE_PARAMETER,
+        responses={
+            201: SUCCESS_MESSAGE_201,
+            400: ERROR_MESSAGE_400,
+            401: ERROR_MESSAGE_401,
+            403: ERROR_MESSAGE_403
+        }
+    )
+    def post(self, request):
+        try:
+            items = bulk_items(request.data)
+        except ValueError as error:
+            return Response({'data': f'{error}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
+
+        # 전체 티켓을 한꺼번에 검증하고 컬럼별 순서값을 배정
+        tickets, errors = prepare_ticket_create(own_board, items)
+        if errors:
+            return Response({'data': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 티켓이 추가될 컬럼들을 잠근 상태에서 순서값을 배정하고 저장
+        def create():
+            lock_columns({ticket.column_id for ticket in tickets})
+            assign_ticket_positions(tickets)
+
+            return Ticket.objects.bulk_create(tickets, batch_size=500)
+
+        try:
+            tickets = atomic_with_retry(create)
         except DatabaseError as error:
             return Response(
                 {'data': f'{error}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-        # 티켓이 삭제된 다음의 보드 제공
-        serializer = BoardSerializer(own_board)
+        # 티켓마다 캐시를 수정하지 않고 마지막에 한 번만 다시 캐싱
+        rebuild_board_cache(own_board)
 
-        # 변경된 보드 데이터를 캐싱
-        cache.set(
-            f'{own_board.team.name}',
-            serializer.data,
-            60 * 60
+        return Response(
+            {'data': TicketSerializer(tickets, many=True).data},
+            status=status.HTTP_201_CREATED
         )
 
-        return Response({'data': serializer.data}, status=status.HTTP_200_OK)
+
+# /api/v1/boards/ticket/bulk/update/
+class TicketBulkUpdateView(APIView):
+    # 권한 설정
+    # 인증된 사용자, 팀 구성원 전체에 권한 부여
+    permission_classes = [IsAuthenticated, IsTeamMember]
+
+    @swagger_auto_schema(
+        operation_id='티켓 일괄 수정',
+        operation_description='티켓 id와 수정할 데이터의 목록을 받아 한 번에 수정합니다. 하나라도 잘못된 티켓이 있거나 입력된 버전(version)이 다르다면 아무것도 수정하지 않습니다.',
+        tags=['티켓', '수정'],
+        request_body=TICKET_BULK_UPDATE_PARAMETER,
+        responses={
+            200: SUCCESS_MESSAGE_200,
+            400: ERROR_MESSAGE_400,
+            401: ERROR_MESSAGE_401,
+            403: ERROR_MESSAGE_403,
+            409: ERROR_MESSAGE_409
+        }
+    )
+    def put(self, request):
+        try:
+            items = bulk_items(request.data)
+        except ValueError as error:
+            return Response({'data': f'{error}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
+
+        tickets, fields, versions, errors = prepare_ticket_update(own_board, items)
+        if errors:
+            return Response({'data': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                # 단일 수정(TicketUpdateView)과 같이 수정된 티켓마다 버전을 올림
+                # 버전이 입력된 티켓 중 하나라도 그 사이에 수정되었다면 아무것도 수정하지 않음
+                claim_ticket_versions(tickets, versions)
+                if fields:
+                    Ticket.objects.bulk_update(tickets, fields, batch_size=500)
+        except VersionConflict:
+            return Response(
+                {'data': version_conflict_errors(items, versions)},
+                status=status.HTTP_409_CONFLICT
+            )
+        except DatabaseError as error:
+            return Response(
+                {'data': f'{error}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        rebuild_board_cache(own_board)
+
+        return Response(
+            {'data': TicketSerializer(tickets, many=True).data},
+            status=status.HTTP_200_OK
+        )
+
+
+# /api/v1/boards/ticket/bulk/delete/
+class TicketBulkDeleteView(APIView):
+    # 권한 설정
+    # 인증된 사용자, 팀 구성원 전체에 권한 부여
+    permission_classes = [IsAuthenticated, IsTeamMember]
+
+    @swagger_auto_schema(
+        operation_id='티켓 일괄 삭제',
+        operation_description='티켓 id 목록을 받아 한 번에 삭제합니다. 하나라도 잘못된 티켓이 있다면 아무것도 삭제하지 않습니다.',
+        tags=['티켓', '삭제'],
+        request_body=TICKET_BULK_DELETE_PARAMETER,
+        responses={
+            200: SUCCESS_MESSAGE_200,
+            400: ERROR_MESSAGE_400,
+            401: ERROR_MESSAGE_401,
+            403: ERROR_MESSAGE_403
+        }
+    )
+    def delete(self, request):
+        try:
+            items = bulk_items(request.data)
+        except ValueError as error:
+            return Response({'data': f'{error}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
+
+        ticket_ids, column_ids, errors = prepare_ticket_delete(own_board, items)
+        if errors:
+            return Response({'data': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                Ticket.objects.filter(id__in=ticket_ids).delete()
+
+                # 남은 티켓들의 순서 정리
+                renumber_tickets(column_ids)
+        except DatabaseError as error:
+            return Response(
+                {'data': f'{error}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        board_data = rebuild_board_cache(own_board)
+
+        return Response({'data': board_data}, status=status.HTTP_200_OK)
 
 
 # /api/v1/boards/board/list/
@@ -794,33 +988,421 @@ class BoardListView(APIView):
         operation_id='보드 목록',
         operation_description='현재 사용자의 소속 팀이 소유한 보드와 관련된 데이터를 제공합니다.',
         tags=['보드', '컬럼', '목록'],
+        manual_parameters=[BOARD_LIST_STREAM_PARAMETER],
         responses={
             200: SUCCESS_MESSAGE_200,
+            304: SUCCESS_MESSAGE_304,
             401: ERROR_MESSAGE_401,
             403: ERROR_MESSAGE_403
         }
     )
     def get(self, request):
-        user = request.user
-        # 구조상 사용자가 소속된 그룹들 중 팀장 그룹을 제외하면 팀 그룹 하나밖에 없음
-        # 그 팀 그룹의 이름을 통해 팀 객체 가져옴
-        user_team = Team.objects.get(
-            name=user.groups.exclude(name='leader').first().name
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        board = request.membership.board
+
+        # 컬럼, 티켓이 바뀔 때마다 올라가는 보드 버전으로 ETag를 만듦
+        # 클라이언트가 같은 버전의 데이터를 가지고 있다면 직렬화 없이 본문 없는 응답 반환
+        # 캐시를 사용할 수 없어 버전을 모른다면 ETag 없이 DB에서 직렬화해 응답
+        version = record_and_get_board_version(board)
+        headers = board_cache_headers(board_etag, board, version)
+        if (version is not None) and (
+            headers['ETag'] in parse_etags(request.headers.get('If-None-Match', ''))
+        ):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # 매우 큰 보드는 캐싱하지 않고 DB에서 조금씩 읽으면서 바로 응답
+        # 보드 전체를 메모리에 올리지 않으므로 보드 크기와 관계없이 메모리 사용량이 일정함
+        if request.query_params.get('stream') in ('true', '1'):
+            response = StreamingHttpResponse(
+                stream_board_json(board), content_type='application/json'
+            )
+            for header, value in headers.items():
+                response[header] = value
+
+            return response
+
+        # 해당 버전으로 저장된 보드 데이터가 있을 경우 해당 데이터 반환
+        # 없다면 시리얼라이저로 직렬화한 후 캐싱해둠(핵심 기능이므로)
+        # 동시에 캐시를 찾지 못한 요청들 중 하나만 직렬화함
+        board_data = None
+        if version is not None:
+            try:
+                with cache_circuit:
+                    board_data = get_board_data(board, version)
+            except CACHE_UNAVAILABLE:
+                pass
+        if board_data is None:
+            board_data = BoardSerializer(board).data
+
+        return Response(
+            {'data': board_data}, status=status.HTTP_200_OK, headers=headers
+        )
+
+
+# /api/v1/boards/board/list/v2/
+class BoardListV2View(APIView):
+    # 권한 설정
+    # 인증된 사용자, 팀 구성원 전체에 권한 부여
+    permission_classes = [IsAuthenticated, IsTeamMember]
+
+    @swagger_auto_schema(
+        operation_id='보드 목록(v2)',
+        operation_description='현재 사용자의 소속 팀이 소유한 보드를 id로 구분된 컬럼 배열과 티켓 목록으로 제공합니다.',
+        tags=['보드', '컬럼', '목록'],
+        responses={
+            200: SUCCESS_MESSAGE_200,
+            304: SUCCESS_MESSAGE_304,
+            401: ERROR_MESSAGE_401,
+            403: ERROR_MESSAGE_403
+        }
+    )
+    def get(self, request):
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        board = request.membership.board
+
+        # v1과 같은 보드 버전을 사용하지만 ETag는 구분됨
+        version = record_and_get_board_version(board)
+        headers = board_cache_headers(board_v2_etag, board, version)
+        if (version is not None) and (
+            headers['ETag'] in parse_etags(request.headers.get('If-None-Match', ''))
+        ):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # 컬럼, 티켓이 바뀌면 캐싱된 데이터에서 해당 항목만 수정되므로 대부분 캐시에서 제공됨
+        board_data = None
+        if version is not None:
+            try:
+                with cache_circuit:
+                    board_data = get_board_v2_data(board, version)
+            except CACHE_UNAVAILABLE:
+                pass
+        if board_data is None:
+            board_data = build_board_v2_data(board)
+
+        return Response(
+            {'data': board_data}, status=status.HTTP_200_OK, headers=headers
+        )
+
+
+# /api/v1/boards/ticket/list/
+class TicketListView(APIView):
+    # 권한 설정
+    # 인증된 사용자, 팀 구성원 전체에 권한 부여
+    permission_classes = [IsAuthenticated, IsTeamMember]
+
+    # 한 페이지의 기본 티켓 수와 최대 티켓 수
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 200
+
+    @swagger_auto_schema(
+        operation_id='티켓 목록',
+        operation_description='보드 전체 대신 티켓을 컬럼 순서, 티켓 순서대로 한 페이지씩 제공합니다. 응답의 next를 cursor로 넘기면 다음 페이지를 받을 수 있습니다.',
+        tags=['티켓', '목록'],
+        manual_parameters=TICKET_LIST_PARAMETERS,
+        responses={
+            200: SUCCESS_MESSAGE_200,
+            400: ERROR_MESSAGE_400,
+            401: ERROR_MESSAGE_401,
+            403: ERROR_MESSAGE_403,
+            404: ERROR_MESSAGE_404
+        }
+    )
+    def get(self, request):
+        # 인증 단계에서 가져온 사용자 팀의 보드
+        own_board = request.membership.board
+        params = request.query_params
+
+        tickets = Ticket.objects.all()
+        columns = Column.objects.filter(board=own_board)
+
+        # 특정 컬럼의 티켓만
+        if params.get('column'):
+            try:
+                column = Column.objects.get(
+                    id=int(params.get('column')),
+                    board=own_board
+                )
+            except (ObjectDoesNotExist, ValueError) as error:
+                return Response({'data': f'{error}'}, status=status.HTTP_404_NOT_FOUND)
+
+            columns = columns.filter(id=column.id)
+
+        # 태그 필터, 쉼표로 여러 태그 지정 가능
+        if params.get('tag'):
+            tags = params.get('tag').split(',')
+            if not set(tags) <= {tag for tag, _ in Ticket.TAG_CHOICES}:
+                return Response(
+                    {'data': f'태그는 {[tag for tag, _ in Ticket.TAG_CHOICES]} 중에서 선택해주세요.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            tickets = tickets.filter(tag__in=tags)
+
+        # 담당자 필터
+        if params.get('charge'):
+            tickets = tickets.filter(charge__username=params.get('charge'))
+
+        # 마감일 범위 필터
+        try:
+            if params.get('ended_from'):
+                tickets = tickets.filter(
+                    ended_at__gte=datetime.strptime(params.get('ended_from'), '%Y-%m-%d').date()
+                )
+            if params.get('ended_to'):
+                tickets = tickets.filter(
+                    ended_at__lte=datetime.strptime(params.get('ended_to'), '%Y-%m-%d').date()
+                )
+        except ValueError:
+            return Response(
+                {'data': '마감일은 YYYY-MM-DD 형식으로 입력해주세요.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(params.get('limit', self.DEFAULT_LIMIT))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= self.MAX_LIMIT:
+            return Response(
+                {'data': f'limit은 1 이상 {self.MAX_LIMIT} 이하로 입력해주세요.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 컬럼 순서, 티켓 순서 기준의 키셋 페이지네이션
+        # 순서가 같은 경우를 대비해 id까지 정렬 기준에 포함
+        # 티켓은 컬럼별로 (컬럼, 순서) 인덱스 순서대로 읽어서 정렬용 임시 테이블을 만들지 않음
+        field = ordering_field()
+        columns = columns.order_by(field, 'id')
+        cursor = None
+
+        if params.get('cursor'):
+            # 정렬 키는 문자열, 순서값과 id는 정수
+            key_type = str if is_rank_ordering() else int
+            try:
+                cursor = decode_cursor(params.get('cursor'), [key_type, int, key_type, int])
+            except InvalidCursor as error:
+                return Response({'data': f'{error}'}, status=status.HTTP_400_BAD_REQUEST)
+
+            # 커서의 컬럼과 그 뒤의 컬럼만
+            columns = columns.filter(
+                Q(**{f'{field}__gt': cursor[0]}) | Q(**{field: cursor[0], 'id__gte': cursor[1]})
+            )
+
+        # 정렬 키 방식에서는 컬럼 안에서 정렬된 위치가 순서값
+        if is_rank_ordering():
+            tickets = tickets.annotate(
+                position=Coalesce(
+                    Subquery(
+                        Ticket.objects.filter(
+                            column_id=OuterRef('column_id'),
+                            rank__lt=OuterRef('rank')
+                        ).order_by().values('column_id').annotate(
+                            count=Count('id')
+                        ).values('count')
+                    ),
+                    0
+                ) + 1
+            )
+
+        # 다음 페이지가 있는지 알기 위해 한 개 더 가져옴
+        page = []
+        for column in columns:
+            column_tickets = tickets.filter(column_id=column.id)
+            if (cursor is not None) and ([getattr(column, field), column.id] == cursor[:2]):
+                column_tickets = column_tickets.filter(after([field, 'id'], cursor[2:]))
+
+            column_tickets = column_tickets.select_related('charge').order_by(field, 'id')
+            for ticket in column_tickets[:limit + 1 - len(page)]:
+                ticket.column_key = getattr(column, field)
+                page.append(ticket)
+
+            if len(page) > limit:
+                break
+
+        has_next = len(page) > limit
+        page = page[:limit]
+
+        ticket_data = []
+        for ticket in page:
+            if is_rank_ordering():
+                ticket.sequence = ticket.position
+
+            ticket_data.append({
+                'title': ticket.title,
+                'column': ticket.column_id,
+                **build_ticket_data(ticket),
+                # 수정할 때 If-Match로 보낼 티켓 버전
+                'version': ticket.version
+            })
+
+        next_cursor = None
+        if has_next:
+            last = page[-1]
+            next_cursor = encode_cursor(
+                [last.column_key, last.column_id, getattr(last, field), last.id]
+            )
+
+        return Response(
+            {'data': {'ticket': ticket_data, 'next': next_cursor}},
+            status=status.HTTP_200_OK
         )
 
-        # 팀 이름으로 저장된 보드 데이터가 있을 경우 해당 데이터 반환
-        cached_board = cache.get(f'{user_team.name}')
-        if cached_board:
-            return Response({'data': cached_board}, status=status.HTTP_200_OK)
 
-        # 가져온 팀 객체로 보드 가져옴
-        board = Board.objects.get(team=user_team)
-        # 시리얼라이저로 직렬화 한 후 데이터 반환
-        # 컬럼명과 순서를 딕셔너리 형태로 직렬화함
-        serializer = BoardSerializer(board)
+# 비동기 뷰의 인증, 권한 확인
+# IsAuthenticated, IsTeamMember와 같은 기준으로 확인하고 실패하면 오류 응답을 반환
+# events_ticket이 True이면 ticket 파라미터가 있을 때 Authorization 헤더 대신 이벤트 티켓으로 인증
+async def _authenticate_team_member(request, events_ticket=False):
+    if request.method != 'GET':
+        return JsonResponse(
+            {'data': '허용되지 않은 메소드입니다.'},
+            status=status.HTTP_405_METHOD_NOT_ALLOWED
+        )
+
+    authentication = TeamJWTAuthentication()
+    if events_ticket and ('ticket' in request.GET):
+        result = await authentication.aauthenticate_events_ticket(request)
+    else:
+        result = await authentication.aauthenticate(request)
+
+    if result is None:
+        return JsonResponse(
+            {'data': '인증 정보가 올바르지 않습니다.'},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    if not request.membership.is_team_member:
+        return JsonResponse(
+            {'data': '팀에 소속된 사용자만 조회할 수 있습니다.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    return None
 
-        # 핵심 기능이므로 캐싱해둠
-        # 만료 시간은 1시간
-        cache.set(f'{user_team.name}', serializer.data, 60 * 60)
 
-        return Response({'data': serializer.data}, status=status.HTTP_200_OK)
+# /api/v1/boards/board/list/async/
+# 보드 목록(BoardListView)의 비동기 버전
+# 인증, 팀 정보, 보드 버전, 캐싱된 보드 데이터를 모두 비동기 Redis 클라이언트와 비동기 ORM으로 조회하므로
+# ASGI 서버(config.asgi)로 실행하면 워커 하나가 캐시, DB 응답을 기다리는 많은 요청을 동시에 처리할 수 있음
+# 캐시가 없어 보드를 직렬화해야 할 때만 동기 코드(get_board_data)를 스레드에서 실행함
+# 응답은 BoardListView와 같음(stream 파라미터는 지원하지 않음)
+async def board_list_async_view(request):
+    error = await _authenticate_team_member(request)
+    if error is not None:
+        return error
+
+    board = request.membership.board
+
+    # 캐시를 사용할 수 없을 때는 BoardListView와 같이 ETag 없이 DB에서 직렬화
+    version = await arecord_and_get_board_version(board)
+
+    headers = board_cache_headers(board_etag, board, version)
+    if (version is not None) and (
+        headers['ETag'] in parse_etags(request.headers.get('If-None-Match', ''))
+    ):
+        return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    board_data = None
+    if version is not None:
+        try:
+            with cache_circuit:
+                board_data = await aget_board_data(board, version)
+        except CACHE_UNAVAILABLE:
+            pass
+    if board_data is None:
+        board_data = await sync_to_async(lambda: BoardSerializer(board).data)()
+
+    # DRF의 JSONRenderer와 같은 형식으로 직렬화
+    with measure_serialization():
+        return JsonResponse(
+            {'data': board_data},
+            encoder=JSONEncoder,
+            json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')},
+            headers=headers
+        )
+
+
+# /api/v1/boards/board/events/ticket/
+class BoardEventsTicketView(APIView):
+    # 권한 설정
+    # 인증된 사용자, 팀 구성원 전체에 권한 부여
+    permission_classes = [IsAuthenticated, IsTeamMember]
+
+    @swagger_auto_schema(
+        operation_id='보드 이벤트 티켓 발급',
+        operation_description='보드 이벤트 API에 ticket 파라미터로 연결할 때 사용하는 이벤트 티켓을 발급합니다. 티켓은 짧은 시간(expires_in초) 뒤에 만료되므로 연결하기 직전에 발급받아주세요.',
+        tags=['보드', '이벤트'],
+        responses={
+            200: SUCCESS_MESSAGE_200,
+            401: ERROR_MESSAGE_401,
+            403: ERROR_MESSAGE_403
+        }
+    )
+    def post(self, request):
+        return Response(
+            {
+                'data': {
+                    'ticket': issue_events_ticket(request.user),
+                    'expires_in': settings.BOARD_EVENTS_TICKET_TIMEOUT
+                }
+            },
+            status=status.HTTP_200_OK
+        )
+
+
+# SSE 메시지 하나
+def _sse_message(data, event_id=None):
+    if event_id is None:
+        return f'data: {data}\n\n'
+
+    return f'id: {event_id}\ndata: {data}\n\n'
+
+
+# 보드 변경 이벤트를 SSE 메시지로 내보내는 비동기 제너레이터
+# 현재 버전을 조회하기 전에 구독을 시작하므로 그 사이에 발행된 이벤트도 빠지지 않음
+# 클라이언트가 연결을 끊어도 서버가 알 수 없는 경우가 있으므로 BOARD_EVENTS_MAX_AGE초가 지나면 응답을 끝냄
+# EventSource는 응답이 끝나면 자동으로 다시 연결함
+async def _board_event_stream(board):
+    subscription = await board_events().subscribe(board_events_channel(board.id))
+    deadline = monotonic() + settings.BOARD_EVENTS_MAX_AGE
+
+    try:
+        version = await aget_board_version(board)
+        yield _sse_message(
+            json.dumps({'type': 'board.hello', 'version': version}), version
+        )
+
+        while monotonic() < deadline:
+            message = await subscription.get(
+                min(settings.BOARD_EVENTS_HEARTBEAT, deadline - monotonic())
+            )
+
+            # 프록시가 유휴 연결을 끊지 않도록 주기적으로 주석을 보냄
+            if message is None:
+                yield ': heartbeat\n\n'
+                continue
+
+            yield _sse_message(message, json.loads(message)['version'])
+    finally:
+        await subscription.close()
+
+
+# /api/v1/boards/board/events/
+# 보드 변경 이벤트(Server-Sent Events)
+# 연결되면 현재 보드 버전을 담은 'board.hello' 이벤트를 보내고
+# 이후 컬럼, 티켓이 바뀔 때마다 바뀐 부분만 담은 이벤트를 보냄(boards.events 참고)
+# 연결이 유지되는 동안 워커를 점유하지 않도록 비동기 뷰로 작성했으므로 ASGI 서버(config.asgi)로 실행해야 함
+async def board_events_view(request):
+    # 브라우저의 EventSource는 헤더를 보낼 수 없으므로 Authorization 헤더 대신 ticket 파라미터로도 인증
+    # 액세스 토큰은 로그에 남지 않도록 URL로 받지 않고 이벤트 티켓(BoardEventsTicketView)만 받음
+    error = await _authenticate_team_member(request, events_ticket=True)
+    if error is not None:
+        return error
+
+    response = StreamingHttpResponse(
+        _board_event_stream(request.membership.board),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    # nginx가 이벤트를 모아서 보내지 않도록 함
+    response['X-Accel-Buffering'] = 'no'
+
+    return response
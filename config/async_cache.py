@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from .cache_backends import is_redis_cache
+from .metrics import measure_cache, record_cache_lookup
+
+from weakref import WeakKeyDictionary
+import asyncio
+
+
+# 비동기 뷰에서 사용하는 캐시 읽기, 쓰기
+# django_redis의 캐시는 동기 클라이언트뿐이므로 같은 Redis에 redis.asyncio 클라이언트로 접근함
+# 키와 값의 형식은 django_redis의 make_key, encode, decode를 그대로 사용하므로
+# 동기 코드에서 cache로 저장한 값을 그대로 읽을 수 있고 그 반대도 같음
+# Redis가 아닌 캐시(locmem, file)는 cache의 비동기 메소드를 그대로 사용
+
+
+# 이벤트 루프별 클라이언트
+# redis.asyncio의 연결은 연결을 만든 이벤트 루프에서만 사용할 수 있음
+_clients = WeakKeyDictionary()
+
+
+# 현재 이벤트 루프의 비동기 Redis 클라이언트
+# 동기 캐시와 같은 연결 풀, 타임아웃 설정을 사용
+def async_cache_client():
+    loop = asyncio.get_running_loop()
+
+    client = _clients.get(loop)
+    if client is None:
+        client = Redis(
+            connection_pool=BlockingConnectionPool.from_url(
+                settings.CACHES['default']['LOCATION'],
+                max_connections=settings.ASYNC_CACHE_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT
+            )
+        )
+        _clients[loop] = client
+
+    return client
+
+
+# cache.get_many와 같음
+# 값이 없는 키는 결과에 포함되지 않음
+async def aget_many(keys):
+    if not keys:
+        return {}
+    if not is_redis_cache():
+        return await cache.aget_many(keys)
+
+    with measure_cache() as metrics:
+        values = await async_cache_client().mget([cache.make_key(key) for key in keys])
+
+    found = {
+        key: cache.client.decode(value)
+        for key, value in zip(keys, values) if value is not None
+    }
+    record_cache_lookup(metrics, len(found), len(keys) - len(found))
+
+    return found
+
+
+# cache.get과 같음
+async def aget(key, default=None):
+    return (await aget_many([key])).get(key, default)
+
+
+# cache.set_many와 같음
+# 여러 값을 한 번의 왕복으로 저장
+async def aset_many(data, timeout):
+    if not is_redis_cache():
+        await cache.aset_many(data, timeout)
+        return
+
+    async with async_cache_client().pipeline(transaction=False) as pipeline:
+        for key, value in data.items():
+            pipeline.set(cache.make_key(key), cache.client.encode(value), ex=timeout)
+
+        with measure_cache():
+            await pipeline.execute()
@@ -0,0 +1,111 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from django.conf import settings
+from django.core import signing
+from django.utils.functional import SimpleLazyObject
+
+from .memberships import load_membership, aload_membership
+
+
+# 이벤트 티켓 서명에 사용하는 salt, 다른 용도로 서명된 값은 이벤트 티켓으로 사용할 수 없음
+EVENTS_TICKET_SALT = 'boards.events.ticket'
+
+
+# 보드 이벤트 API(/api/v1/boards/board/events/) 연결에만 사용하는 이벤트 티켓 발급
+# 브라우저의 EventSource는 헤더를 보낼 수 없어 인증 정보를 URL에 넣어야 하므로
+# 접근 로그, 프록시 로그, 방문 기록에 남아도 되도록 액세스 토큰 대신
+# BOARD_EVENTS_TICKET_TIMEOUT초 뒤에 만료되는 서명 값을 사용
+def issue_events_ticket(user):
+    return signing.dumps(
+        {'user': getattr(user, api_settings.USER_ID_FIELD)}, salt=EVENTS_TICKET_SALT
+    )
+
+
+# JWT 인증 후 요청에 사용자의 팀 정보(request.membership)를 붙여줌
+# 팀 정보는 처음 사용될 때 한 번만 조회되고 같은 요청 안에서는 재사용됨
+class TeamJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is None:
+            return None
+
+        user, token = result
+        request.membership = SimpleLazyObject(lambda: load_membership(user))
+
+        return user, token
+
+    # 비동기 뷰(DRF를 거치지 않는 Django 뷰)의 인증
+    # 사용자는 비동기 ORM으로, 팀 정보는 비동기 캐시 클라이언트로 조회해 request.membership에 붙여줌
+    # 액세스 토큰은 Authorization 헤더로만 받음
+    # 인증 정보가 없거나 올바르지 않다면 None
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        try:
+            validated_token = self.get_validated_token(raw_token)
+            user = await self.aget_user(validated_token)
+        except (InvalidToken, AuthenticationFailed):
+            return None
+
+        request.user = user
+        request.membership = await aload_membership(user)
+
+        return user, validated_token
+
+    # ticket 파라미터로 받은 이벤트 티켓(issue_events_ticket)으로 인증
+    # 티켓이 없거나 만료, 위조되었다면 None
+    async def aauthenticate_events_ticket(self, request):
+        try:
+            payload = signing.loads(
+                request.GET.get('ticket', ''),
+                salt=EVENTS_TICKET_SALT,
+                max_age=settings.BOARD_EVENTS_TICKET_TIMEOUT
+            )
+            user = await self.aget_active_user(payload['user'])
+        except (signing.BadSignature, KeyError, TypeError, AuthenticationFailed):
+            return None
+
+        request.user = user
+        request.membership = await aload_membership(user)
+
+        return user, None
+
+    # get_user의 비동기 버전
+    async def aget_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('토큰에 사용자 정보가 없습니다.')
+
+        user = await self.aget_active_user(user_id)
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    '비밀번호가 변경되었습니다.', code='password_changed'
+                )
+
+        return user
+
+    # 활성화된 사용자 조회
+    async def aget_active_user(self, user_id):
+        try:
+            user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed('사용자를 찾을 수 없습니다.', code='user_not_found')
+
+        if not user.is_active:
+            raise AuthenticationFailed('비활성화된 사용자입니다.', code='user_inactive')
+
+        return user
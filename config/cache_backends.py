@@ -0,0 +1,239 @@
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache as BaseLocMemCache
+from django.core.files import locks
+from django_redis.cache import RedisCache as BaseRedisCache
+
+from .metrics import measure_cache, record_cache_lookup
+
+from contextlib import contextmanager
+import mmap
+import os
+import pickle
+import struct
+import time
+
+
+# 캐시 구현(settings.CACHE_BACKEND)
+# 'redis': django_redis, 여러 서버가 함께 사용(배포 기본값)
+# 'locmem': 프로세스 메모리, Redis 없이 개발, 테스트
+# 'file': 메모리 맵 파일(MmapFileCache), Redis 없이 한 서버의 여러 프로세스가 함께 사용
+#
+# 세 구현 모두 키마다 만료 시간(timeout)이 있고 None이면 만료되지 않으며
+# 가득 차면 가장 오래 사용되지 않은 키부터 삭제(LRU)함
+# locmem, file은 MAX_ENTRIES를 넘으면 1 / CULL_FREQUENCY만큼 삭제하고
+# Redis는 서버의 maxmemory, maxmemory-policy(allkeys-lru) 설정을 따름
+#
+# Redis에만 있는 기능(파이프라인, pub/sub, 비동기 클라이언트)은 is_redis_cache()로 확인하고
+# 다른 구현에서는 cache의 기본 메소드로 같은 결과를 냄(config.cache_pipeline, config.async_cache)
+#
+# 모든 구현은 요청별 캐시 호출 수, 적중, 실패, 시간을 기록함(config.metrics)
+
+
+def is_redis_cache(alias='default'):
+    return isinstance(caches[alias], BaseRedisCache)
+
+
+# 조회 결과가 없음을 나타내는 값(None도 저장될 수 있으므로 따로 사용)
+_MISSING = object()
+
+
+def _measured(name):
+    def method(self, *args, **kwargs):
+        with measure_cache():
+            return getattr(super(InstrumentedCacheMixin, self), name)(*args, **kwargs)
+
+    method.__name__ = name
+
+    return method
+
+
+# 캐시 호출을 현재 요청의 측정 결과에 기록
+class InstrumentedCacheMixin:
+    def get(self, key, default=None, *args, **kwargs):
+        with measure_cache() as metrics:
+            value = super().get(key, _MISSING, *args, **kwargs)
+            found = value is not _MISSING
+            record_cache_lookup(metrics, int(found), int(not found))
+
+        return value if found else default
+
+    def get_many(self, keys, *args, **kwargs):
+        keys = list(keys)
+        with measure_cache() as metrics:
+            values = super().get_many(keys, *args, **kwargs)
+            record_cache_lookup(metrics, len(values), len(keys) - len(values))
+
+        return values
+
+    set = _measured('set')
+    add = _measured('add')
+    set_many = _measured('set_many')
+    delete = _measured('delete')
+    delete_many = _measured('delete_many')
+    incr = _measured('incr')
+    decr = _measured('decr')
+    has_key = _measured('has_key')
+    touch = _measured('touch')
+
+
+class RedisCache(InstrumentedCacheMixin, BaseRedisCache):
+    pass
+
+
+class LocMemCache(InstrumentedCacheMixin, BaseLocMemCache):
+    pass
+
+
+# 파일 앞부분의 만료 시각(유닉스 시간, 만료되지 않으면 inf)
+_HEADER = struct.Struct('<d')
+
+
+# 키마다 하나의 파일에 저장하고 메모리 맵으로 읽는 파일 캐시
+# FileBasedCache와 달리
+# - 값을 압축하지 않고(보드 스냅샷은 이미 압축되어 있음) 메모리 맵에서 바로 역직렬화해 복사를 줄임
+# - 읽을 때마다 파일의 수정 시각을 갱신하고 가득 차면 오래 사용되지 않은 파일부터 삭제(LRU)
+# - add, incr은 파일 잠금 안에서 실행되어 여러 프로세스가 동시에 호출해도 안전함
+# 호출 기록은 MmapFileCache에서 InstrumentedCacheMixin으로 감싸서 추가함
+class _MmapFileCache(FileBasedCache):
+    cache_suffix = '.mmcache'
+
+    # 같은 디렉토리를 사용하는 모든 프로세스의 add, incr을 순서대로 실행
+    @contextmanager
+    def _locked(self):
+        self._createdir()
+        with open(os.path.join(self._dir, '.lock'), 'ab') as lock_file:
+            locks.lock(lock_file, locks.LOCK_EX)
+            try:
+                yield
+            finally:
+                locks.unlock(lock_file)
+
+    # (만료 시각, 값), 없거나 만료되었다면 None
+    def _read(self, fname):
+        try:
+            with open(fname, 'rb') as f:
+                # 빈 파일은 메모리 맵으로 열 수 없음(쓰는 중에 남은 파일)
+                if os.fstat(f.fileno()).st_size < _HEADER.size:
+                    return None
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    expiry, = _HEADER.unpack_from(mapped)
+                    if expiry < time.time():
+                        expired = True
+                    else:
+                        expired = False
+                        with memoryview(mapped) as view, view[_HEADER.size:] as payload:
+                            value = pickle.loads(payload)
+        except FileNotFoundError:
+            return None
+
+        if expired:
+            self._delete(fname)
+            return None
+
+        return expiry, value
+
+    def get(self, key, default=None, version=None):
+        fname = self._key_to_file(key, version)
+        entry = self._read(fname)
+        if entry is None:
+            return default
+
+        # 최근에 사용되었음을 기록(LRU)
+        try:
+            os.utime(fname)
+        except FileNotFoundError:
+            pass
+
+        return entry[1]
+
+    def _write_content(self, file, timeout, value):
+        expiry = self.get_backend_timeout(timeout)
+        self._write_entry(file, float('inf') if expiry is None else expiry, value)
+
+    def _write_entry(self, file, expiry, value):
+        file.write(_HEADER.pack(expiry))
+        file.write(pickle.dumps(value, self.pickle_protocol))
+
+    # 만료 시각을 유지한 채 값만 바꿈
+    def _replace(self, fname, expiry, value):
+        self._createdir()
+        tmp_path = f'{fname}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            self._write_entry(f, expiry, value)
+        os.replace(tmp_path, fname)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        with self._locked():
+            if self._read(self._key_to_file(key, version)) is not None:
+                return False
+
+            self.set(key, value, timeout, version)
+
+            return True
+
+    def incr(self, key, delta=1, version=None):
+        fname = self._key_to_file(key, version)
+        with self._locked():
+            entry = self._read(fname)
+            if entry is None:
+                raise ValueError("Key '%s' not found" % key)
+
+            expiry, value = entry
+            value += delta
+            self._replace(fname, expiry, value)
+
+        return value
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        fname = self._key_to_file(key, version)
+        with self._locked():
+            entry = self._read(fname)
+            if entry is None:
+                return False
+
+            expiry = self.get_backend_timeout(timeout)
+            self._replace(fname, float('inf') if expiry is None else expiry, entry[1])
+
+        return True
+
+    def has_key(self, key, version=None):
+        return self._read(self._key_to_file(key, version)) is not None
+
+    def _is_expired(self, f):
+        try:
+            expiry, = _HEADER.unpack(f.read(_HEADER.size))
+        except struct.error:
+            expiry = 0
+        if expiry < time.time():
+            f.close()
+            self._delete(f.name)
+            return True
+
+        return False
+
+    # 가장 오래 사용되지 않은 파일부터 1 / CULL_FREQUENCY만큼 삭제
+    def _cull(self):
+        filelist = self._list_cache_files()
+        num_entries = len(filelist)
+        if num_entries < self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            return self.clear()
+
+        used = []
+        for fname in filelist:
+            try:
+                used.append((os.stat(fname).st_mtime, fname))
+            except FileNotFoundError:
+                continue
+        used.sort()
+
+        for _, fname in used[:int(num_entries / self._cull_frequency)]:
+            self._delete(fname)
+
+
+class MmapFileCache(InstrumentedCacheMixin, _MmapFileCache):
+    pass
@@ -0,0 +1,210 @@
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django_redis import get_redis_connection
+
+from .cache_backends import is_redis_cache
+from .metrics import current_metrics, measure_cache, record_cache_lookup
+
+
+# 설정된 캐시 구현에 맞는 파이프라인
+# Redis가 아니라면 작업을 모아두었다가 execute()에서 cache로 하나씩 실행함
+def cache_pipeline():
+    if is_redis_cache():
+        return CachePipeline()
+
+    return SequentialCachePipeline()
+
+
+# 여러 캐시 작업을 Redis 파이프라인으로 묶어 한 번의 왕복으로 실행
+# cache와 같은 이름, 인자의 메소드를 제공하므로 cache를 받는 함수에 그대로 넘길 수 있음
+# 작업은 execute()를 호출할 때 한꺼번에 실행되고, 추가한 순서대로 각 작업의 결과가 반환됨
+#
+#   pipeline = cache_pipeline()
+#   pipeline.add(key, 0, None)
+#   pipeline.incr(key)
+#   version = pipeline.execute()[-1]
+#
+# 키와 값의 형식은 django_redis의 make_key, encode, decode를 그대로 사용하므로 cache로 저장한 값과 호환됨
+# 여러 작업이 한 번에 적용되는 것(트랜잭션)은 보장하지 않음
+class CachePipeline:
+    def __init__(self):
+        self.pipeline = get_redis_connection().pipeline(transaction=False)
+        # 작업별 (파이프라인 명령 수, 결과 변환 함수)
+        self.operations = []
+
+    def __len__(self):
+        return len(self.operations)
+
+    def _queue(self, commands, convert):
+        self.operations.append((commands, convert))
+
+        return self
+
+    def _decode(self, value):
+        return cache.client.decode(value)
+
+    # 타임아웃(초)을 Redis의 밀리초 만료 시간으로 변환, 만료되지 않으면 None
+    def _expiry(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = cache.default_timeout
+        if timeout is None:
+            return None
+
+        # cache와 마찬가지로 0 이하의 타임아웃은 바로 만료됨
+        return max(int(timeout * 1000), 1)
+
+    def get(self, key, default=None):
+        self.pipeline.get(cache.make_key(key))
+
+        def convert(values):
+            record_cache_lookup(current_metrics(), int(values[0] is not None), int(values[0] is None))
+            return default if values[0] is None else self._decode(values[0])
+
+        return self._queue(1, convert)
+
+    # 값이 없는 키는 결과에 포함되지 않음
+    def get_many(self, keys):
+        keys = list(keys)
+        if not keys:
+            return self._queue(0, lambda values: {})
+
+        self.pipeline.mget([cache.make_key(key) for key in keys])
+
+        def convert(values):
+            found = {
+                key: self._decode(value)
+                for key, value in zip(keys, values[0]) if value is not None
+            }
+            record_cache_lookup(current_metrics(), len(found), len(keys) - len(found))
+            return found
+
+        return self._queue(1, convert)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, nx=False):
+        self.pipeline.set(
+            cache.make_key(key),
+            cache.client.encode(value),
+            px=self._expiry(timeout),
+            nx=nx
+        )
+
+        return self._queue(1, lambda values: bool(values[0]))
+
+    # 키가 없을 때만 저장
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT):
+        return self.set(key, value, timeout, nx=True)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT):
+        for key, value in data.items():
+            self.pipeline.set(
+                cache.make_key(key), cache.client.encode(value), px=self._expiry(timeout)
+            )
+
+        return self._queue(len(data), lambda values: [])
+
+    # cache.incr와 달리 키가 없으면 0에서 시작함
+    # 키가 없을 수 있다면 먼저 add로 초기값을 넣어야 함
+    def incr(self, key, delta=1):
+        self.pipeline.incrby(cache.make_key(key), delta)
+
+        return self._queue(1, lambda values: values[0])
+
+    def delete_many(self, keys):
+        keys = list(keys)
+        if not keys:
+            return self._queue(0, lambda values: 0)
+
+        self.pipeline.delete(*[cache.make_key(key) for key in keys])
+
+        return self._queue(1, lambda values: values[0])
+
+    # Redis pub/sub 채널에 메시지 발행, 결과는 메시지를 받은 구독자 수
+    def publish(self, channel, message):
+        self.pipeline.publish(channel, message)
+
+        return self._queue(1, lambda values: values[0])
+
+    def execute(self):
+        with measure_cache():
+            values = self.pipeline.execute() if len(self.pipeline) else []
+
+        results = []
+        start = 0
+        for commands, convert in self.operations:
+            results.append(convert(values[start:start + commands]))
+            start += commands
+
+        self.operations = []
+
+        return results
+
+
+# Redis가 아닌 캐시(locmem, file)에서 사용하는 파이프라인
+# CachePipeline과 같은 메소드, 결과를 제공하지만 execute()에서 작업을 cache로 하나씩 실행함
+# pub/sub이 없으므로 publish는 아무것도 하지 않음
+class SequentialCachePipeline:
+    def __init__(self):
+        self.operations = []
+
+    def __len__(self):
+        return len(self.operations)
+
+    def _queue(self, operation):
+        self.operations.append(operation)
+
+        return self
+
+    def get(self, key, default=None):
+        return self._queue(lambda: cache.get(key, default))
+
+    def get_many(self, keys):
+        keys = list(keys)
+
+        return self._queue(lambda: cache.get_many(keys))
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, nx=False):
+        if nx:
+            return self.add(key, value, timeout)
+
+        return self._queue(lambda: cache.set(key, value, timeout) is not False)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT):
+        return self._queue(lambda: cache.add(key, value, timeout))
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT):
+        data = dict(data)
+
+        def set_many():
+            cache.set_many(data, timeout)
+            return []
+
+        return self._queue(set_many)
+
+    # CachePipeline.incr와 같이 키가 없으면 0에서 시작함
+    def incr(self, key, delta=1):
+        def incr():
+            try:
+                return cache.incr(key, delta)
+            except ValueError:
+                cache.add(key, 0, None)
+                return cache.incr(key, delta)
+
+        return self._queue(incr)
+
+    def delete_many(self, keys):
+        keys = list(keys)
+
+        def delete_many():
+            deleted = [key for key in keys if cache.has_key(key)]
+            cache.delete_many(deleted)
+            return len(deleted)
+
+        return self._queue(delete_many)
+
+    def publish(self, channel, message):
+        return self._queue(lambda: 0)
+
+    def execute(self):
+        operations, self.operations = self.operations, []
+
+        return [operation() for operation in operations]
@@ -0,0 +1,106 @@
+from django.conf import settings
+from django_redis.exceptions import ConnectionInterrupted
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from contextvars import ContextVar
+from threading import Lock
+from time import monotonic
+
+
+# Redis 장애, 응답 지연 시 캐시를 건너뛰기 위한 차단기
+# 캐시 작업이 연속으로 CACHE_CIRCUIT_FAILURE_THRESHOLD번 실패하면 차단기가 열리고
+# CACHE_CIRCUIT_RESET_TIMEOUT초 동안은 캐시에 요청하지 않고 바로 CircuitOpen 발생
+# 이후 요청 하나만 캐시에 시도해(반열림) 성공하면 닫히고 실패하면 다시 열림
+# 응답 지연은 소켓 타임아웃(settings.CACHES의 SOCKET_TIMEOUT)을 넘어 TimeoutError가 발생한 경우
+#
+#   try:
+#       with cache_circuit:
+#           data = cache.get(key)
+#   except CACHE_UNAVAILABLE:
+#       data = DB에서 조회
+
+
+# 차단기가 열려 캐시를 사용하지 않을 때 발생
+class CircuitOpen(Exception):
+    pass
+
+
+# 캐시 장애로 판단하는 예외
+CACHE_ERRORS = (ConnectionInterrupted, RedisConnectionError, RedisTimeoutError, TimeoutError)
+# 캐시를 사용할 수 없을 때 발생하는 예외 전체
+CACHE_UNAVAILABLE = (CircuitOpen, *CACHE_ERRORS)
+
+# 현재 컨텍스트(스레드, 비동기 작업)에서 들어가 있는 차단기 블록마다 반열림 시도를 맡았는지 여부
+# 차단기 하나를 여러 요청이 함께 사용하므로 시도를 맡은 블록이 끝날 때만 probing을 해제하기 위해 사용
+_probes = ContextVar('circuit_breaker_probes', default=())
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        # 반열림 상태에서 시도 중인 요청이 있는지 여부
+        self.probing = False
+
+    def __enter__(self):
+        probe = False
+        with self.lock:
+            if self.state == self.OPEN:
+                if monotonic() - self.opened_at < settings.CACHE_CIRCUIT_RESET_TIMEOUT:
+                    raise CircuitOpen(f'{self.name} 차단기가 열려있습니다.')
+                self.state = self.HALF_OPEN
+
+            if self.state == self.HALF_OPEN:
+                if self.probing:
+                    raise CircuitOpen(f'{self.name} 차단기가 열려있습니다.')
+                self.probing = probe = True
+
+        _probes.set(_probes.get() + (probe,))
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        probes = _probes.get()
+        probe = probes[-1]
+        _probes.set(probes[:-1])
+
+        with self.lock:
+            # 반열림 시도를 맡은 블록이 끝날 때만 다음 시도를 허용
+            # 시도 중에 다른 요청의 블록이 끝나도 두 번째 시도가 들어오지 않음
+            if probe:
+                self.probing = False
+
+            if (exc_type is not None) and issubclass(exc_type, CACHE_ERRORS):
+                self.failures += 1
+                if (
+                    self.state == self.HALF_OPEN
+                    or self.failures >= settings.CACHE_CIRCUIT_FAILURE_THRESHOLD
+                ):
+                    self.state = self.OPEN
+                    self.opened_at = monotonic()
+            # 캐시와 관계없는 예외는 실패로 보지 않음
+            elif exc_type is None:
+                self.failures = 0
+                self.state = self.CLOSED
+
+        return False
+
+    def reset(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+
+# 프로세스 안의 모든 요청이 함께 사용하는 캐시 차단기
+cache_circuit = CircuitBreaker('cache')
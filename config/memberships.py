@@ -0,0 +1,339 @@
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Exists, Subquery
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from teams.models import Team
+from users.models import User
+from boards.models import Board
+from .async_cache import aget, aset_many
+from .circuit_breaker import CACHE_UNAVAILABLE, cache_circuit
+
+from asgiref.sync import sync_to_async
+
+from threading import Lock
+
+
+# 캐시 적중률 집계
+# 요청마다 캐시에 쓰지 않도록 프로세스 안에서 모아두었다가 주기적으로 캐시에 더함
+_stats = {'hits': 0, 'misses': 0}
+_stats_lock = Lock()
+MEMBERSHIP_STATS_KEYS = {
+    'hits': 'membership:stats:hits',
+    'misses': 'membership:stats:misses',
+}
+
+
+# 사용자가 소속된 팀, 팀이 소유한 보드, 팀장 여부
+# 요청마다 한 번만 조회해 권한 클래스와 뷰에서 함께 사용
+class TeamMembership:
+    def __init__(self, user, board=None, is_leader=False):
+        self.user = user
+        self.board = board
+        self.team = board.team if board is not None else None
+        self.is_leader = is_leader
+
+    # 팀에 소속되어 있는지 여부
+    @property
+    def is_team_member(self):
+        return self.team is not None
+
+    # 소속 팀의 팀장인지 여부
+    @property
+    def is_team_leader(self):
+        return self.is_team_member and self.is_leader and (self.team.leader_id == self.user.id)
+
+
+# 사용자의 팀 정보가 저장되는 캐시 키
+def membership_cache_key(user_id):
+    return f'membership:{user_id}'
+
+
+# 캐시에 저장할 값
+# 팀에 소속되지 않은 사용자는 빈 딕셔너리로 저장해 다음 조회도 캐시에서 끝나도록 함
+def _membership_data(board, is_leader):
+    if board is None:
+        return {}
+
+    return {
+        'board_id': board.id,
+        'team_id': board.team.id,
+        'team_name': board.team.name,
+        'leader_id': board.team.leader_id,
+        'is_leader': is_leader,
+    }
+
+
+# 캐시된 값으로 팀, 보드 객체를 만듦(쿼리 없음)
+def _membership_from_data(user, data):
+    if not data:
+        return TeamMembership(user)
+
+    # from_db는 필드가 정의된 순서대로 값을 받음
+    team = Team.from_db(
+        DEFAULT_DB_ALIAS,
+        ['id', 'leader_id', 'name'],
+        [data['team_id'], data['leader_id'], data['team_name']]
+    )
+    board = Board.from_db(DEFAULT_DB_ALIAS, ['id', 'team_id'], [data['board_id'], team.id])
+    board.team = team
+
+    return TeamMembership(user, board, data['is_leader'])
+
+
+# 사용자의 팀 보드를 팀장 여부와 함께 조회하는 쿼리
+def _membership_board(user):
+    # 구조상 사용자가 소속된 그룹들 중 팀장 그룹을 제외하면 팀 그룹 하나밖에 없음
+    team_name = Group.objects.filter(
+        user=user
+    ).exclude(name='leader').order_by('id').values('name')[:1]
+
+    return Board.objects.filter(
+        team__name=Subquery(team_name)
+    ).select_related('team').annotate(
+        is_leader=Exists(
+            Group.objects.filter(user=user, name='leader')
+        )
+    ).order_by('id')
+
+
+def _membership(user, board):
+    # 팀에 소속되지 않은 사용자
+    if board is None:
+        return TeamMembership(user)
+
+    return TeamMembership(user, board, board.is_leader)
+
+
+# 사용자의 팀, 보드, 팀장 여부를 한 번의 쿼리로 가져옴
+def query_membership(user):
+    return _membership(user, _membership_board(user).first())
+
+
+# query_membership의 비동기 버전
+async def aquery_membership(user):
+    return _membership(user, await _membership_board(user).afirst())
+
+
+# 사용자의 팀 정보
+# 캐시에 있다면 캐시에서, 없다면 DB에서 가져와 캐싱
+# 캐시를 사용할 수 없다면(차단기) DB에서만 가져옴
+def load_membership(user):
+    try:
+        with cache_circuit:
+            data = cache.get(membership_cache_key(user.id))
+    except CACHE_UNAVAILABLE:
+        return query_membership(user)
+
+    if data is not None:
+        _count('hits')
+
+        return _membership_from_data(user, data)
+
+    _count('misses')
+
+    membership = query_membership(user)
+    try:
+        with cache_circuit:
+            cache.set(
+                membership_cache_key(user.id),
+                _membership_data(membership.board, membership.is_leader),
+                settings.MEMBERSHIP_CACHE_TIMEOUT
+            )
+    except CACHE_UNAVAILABLE:
+        pass
+
+    return membership
+
+
+# load_membership의 비동기 버전
+# 캐시는 비동기 Redis 클라이언트로, DB는 비동기 ORM으로 조회
+async def aload_membership(user):
+    try:
+        with cache_circuit:
+            data = await aget(membership_cache_key(user.id))
+    except CACHE_UNAVAILABLE:
+        return await aquery_membership(user)
+
+    if data is not None:
+        await _acount('hits')
+
+        return _membership_from_data(user, data)
+
+    await _acount('misses')
+
+    membership = await aquery_membership(user)
+    try:
+        with cache_circuit:
+            await aset_many(
+                {
+                    membership_cache_key(user.id): _membership_data(
+                        membership.board, membership.is_leader
+                    )
+                },
+                settings.MEMBERSHIP_CACHE_TIMEOUT
+            )
+    except CACHE_UNAVAILABLE:
+        pass
+
+    return membership
+
+
+# 전체 사용자의 팀 정보를 미리 캐싱
+# 사용자 수와 관계없이 보드 조회 한 번, 사용자 그룹 조회는 batch_size명마다 한 번
+def warm_membership_cache(batch_size=500):
+    boards = {}
+    for board in Board.objects.select_related('team').order_by('-id'):
+        # 같은 팀의 보드가 여러 개라면 id가 가장 작은 보드(order_by('id').first()와 같음)
+        boards[board.team.name] = board
+
+    users = User.objects.prefetch_related('groups').order_by('id')
+    warmed = 0
+    data = {}
+    for user in users.iterator(chunk_size=batch_size):
+        groups = sorted(user.groups.all(), key=lambda group: group.id)
+        team_group = next((group for group in groups if group.name != 'leader'), None)
+
+        board = boards.get(team_group.name) if team_group is not None else None
+        is_leader = any(group.name == 'leader' for group in groups)
+        data[membership_cache_key(user.id)] = _membership_data(board, is_leader)
+
+        if len(data) >= batch_size:
+            cache.set_many(data, settings.MEMBERSHIP_CACHE_TIMEOUT)
+            warmed += len(data)
+            data = {}
+
+    if data:
+        cache.set_many(data, settings.MEMBERSHIP_CACHE_TIMEOUT)
+        warmed += len(data)
+
+    return warmed
+
+
+# 사용자들의 팀 정보 캐시 삭제
+# 트랜잭션 안이라면 커밋 전에 다른 요청이 이전 값을 다시 캐싱할 수 있으므로 커밋 후에도 한 번 더 삭제
+def invalidate_memberships(user_ids):
+    keys = [membership_cache_key(user_id) for user_id in user_ids]
+    if not keys:
+        return
+
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+# 팀 구성원 전체의 팀 정보 캐시 삭제
+def invalidate_team_memberships(team_name):
+    invalidate_memberships(
+        User.objects.filter(groups__name=team_name).values_list('id', flat=True)
+    )
+
+
+# 캐시에 더할 때가 되었다면 모아둔 값, 아니면 None
+def _add_count(result):
+    with _stats_lock:
+        _stats[result] += 1
+        # 일정 횟수마다 모아둔 값을 캐시에 더함
+        if _stats['hits'] + _stats['misses'] < settings.MEMBERSHIP_STATS_FLUSH_EVERY:
+            return None
+        pending = dict(_stats)
+        _stats['hits'] = _stats['misses'] = 0
+
+    return pending
+
+
+def _count(result):
+    pending = _add_count(result)
+    if pending is not None:
+        _flush_stats(pending)
+
+
+async def _acount(result):
+    pending = _add_count(result)
+    if pending is not None:
+        await sync_to_async(_flush_stats)(pending)
+
+
+def _flush_stats(pending):
+    try:
+        with cache_circuit:
+            for result, count in pending.items():
+                if count == 0:
+                    continue
+
+                # 키가 없으면 incr가 실패하므로 먼저 만들어 둠
+                cache.add(MEMBERSHIP_STATS_KEYS[result], 0, None)
+                cache.incr(MEMBERSHIP_STATS_KEYS[result], count)
+    # 캐시를 사용할 수 없다면 모아둔 값은 버림
+    except CACHE_UNAVAILABLE:
+        pass
+
+
+# 팀 정보 캐시 적중률
+# 아직 캐시에 더해지지 않은 현재 프로세스의 값도 함께 계산
+def membership_cache_stats():
+    with _stats_lock:
+        pending = dict(_stats)
+
+    stored = cache.get_many(list(MEMBERSHIP_STATS_KEYS.values()))
+    hits = stored.get(MEMBERSHIP_STATS_KEYS['hits'], 0) + pending['hits']
+    misses = stored.get(MEMBERSHIP_STATS_KEYS['misses'], 0) + pending['misses']
+    total = hits + misses
+
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': (hits / total) if total else 0.0,
+    }
+
+
+# 적중률 집계 초기화
+def reset_membership_cache_stats():
+    with _stats_lock:
+        _stats['hits'] = _stats['misses'] = 0
+
+    cache.delete_many(list(MEMBERSHIP_STATS_KEYS.values()))
+
+
+# 사용자의 그룹이 바뀌면(팀 생성, 초대 수락 등) 팀 정보 캐시 삭제
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_on_groups_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+
+    # user.groups를 수정한 경우
+    if not reverse:
+        invalidate_memberships([instance.id])
+    # group.user_set을 수정한 경우
+    elif action == 'pre_clear':
+        invalidate_memberships(instance.user_set.values_list('id', flat=True))
+    else:
+        invalidate_memberships(pk_set)
+
+
+# 그룹이 삭제되면 소속되어 있던 사용자들의 팀 정보 캐시 삭제
+@receiver(pre_delete, sender=Group)
+def invalidate_on_group_deleted(sender, instance, **kwargs):
+    invalidate_memberships(instance.user_set.values_list('id', flat=True))
+
+
+# 팀명, 팀장이 바뀌면 구성원들의 팀 정보 캐시 삭제
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_on_team_changed(sender, instance, **kwargs):
+    invalidate_team_memberships(instance.name)
+
+
+# 보드가 생성, 삭제되면 구성원들의 팀 정보 캐시 삭제
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def invalidate_on_board_changed(sender, instance, **kwargs):
+    try:
+        team = instance.team
+    # 팀과 함께 삭제되는 경우
+    except Team.DoesNotExist:
+        return
+
+    invalidate_team_memberships(team.name)
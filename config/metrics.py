@@ -0,0 +1,401 @@
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse, JsonResponse
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from contextlib import ContextDecorator, contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import monotonic, perf_counter
+
+
+# 요청별 SQL, 캐시, 직렬화 측정
+# RequestMetricsMiddleware가 요청마다 측정을 시작하고 요청 처리 중 실행된 작업을 기록함
+# - SQL: 모든 DB 연결에 설치된 실행 래퍼(record_query)가 쿼리 수와 실행 시간을 기록
+# - 캐시: 캐시 구현(config.cache_backends)과 Redis 파이프라인, 비동기 클라이언트가 호출 수, 적중, 실패, 시간을 기록
+# - 직렬화: 응답 렌더링과 measure_serialization으로 감싼 보드 직렬화, 스냅샷 변환 시간을 기록
+#
+# 측정 결과는 응답의 Server-Timing 헤더로 바로 확인할 수 있고
+# URL 이름(board_list, ticket_sequence_update ...)별로 모아 /metrics/에서 Prometheus 형식으로 제공함
+# 쿼리 수 분포(pms_db_queries_per_request)가 갑자기 커진 URL이 N+1 쿼리가 생긴 곳
+#
+# 모은 값은 프로세스마다 REQUEST_METRICS_FLUSH_INTERVAL초마다 캐시에 저장하고(config.process_stats)
+# /metrics/는 모든 프로세스의 값을 더해서 응답함
+
+
+# 요청 처리 시간 분포의 구간(초)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# 요청당 쿼리 수 분포의 구간
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# 프로세스별 측정 결과가 저장되는 캐시 키(config.process_stats)
+METRICS_KEY_PREFIX = 'metrics:requests:'
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.cache_calls = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_time = 0.0
+        self.serialize_time = 0.0
+        # 캐시 작업, 직렬화 안에서 다시 호출된 작업은 중복으로 기록하지 않음
+        self.in_cache = False
+        self.in_serialize = False
+
+    def server_timing(self, total):
+        return ', '.join([
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"',
+            f'cache;dur={self.cache_time * 1000:.2f}'
+            f';desc="{self.cache_calls} calls {self.cache_hits} hits {self.cache_misses} misses"',
+            f'serialize;dur={self.serialize_time * 1000:.2f}',
+            f'total;dur={total * 1000:.2f}',
+        ])
+
+
+# 현재 요청의 측정 결과, 요청 밖에서는 None
+# sync_to_async로 실행되는 코드에도 그대로 전달됨
+_current = ContextVar('request_metrics', default=None)
+
+
+def current_metrics():
+    return _current.get()
+
+
+# DB 연결의 실행 래퍼
+def record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += perf_counter() - started
+
+
+# connection.execute_wrapper()로 추가된 래퍼는 마지막에서 꺼내므로 가장 앞에 설치
+def install_query_recorder(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+# 스레드마다 새로 만들어지는 DB 연결에도 설치
+connection_created.connect(install_query_recorder)
+
+
+# 캐시 작업 하나의 시간을 기록하고 현재 요청의 측정 결과를 반환
+# 요청 밖이거나 다른 캐시 작업 안에서 호출되었다면 None
+@contextmanager
+def measure_cache():
+    metrics = _current.get()
+    if (metrics is None) or metrics.in_cache:
+        yield None
+        return
+
+    metrics.in_cache = True
+    started = perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.in_cache = False
+        metrics.cache_calls += 1
+        metrics.cache_time += perf_counter() - started
+
+
+def record_cache_lookup(metrics, hits, misses):
+    if metrics is not None:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+
+
+# 직렬화 시간 기록, 함수 데코레이터로도 사용할 수 있음
+class measure_serialization(ContextDecorator):
+    # 데코레이터로 사용할 때 호출마다 새 객체를 사용(동시에 여러 스레드에서 호출될 수 있음)
+    def _recreate_cm(self):
+        return measure_serialization()
+
+    def __enter__(self):
+        self.metrics = _current.get()
+        if (self.metrics is None) or self.metrics.in_serialize:
+            self.metrics = None
+            return self
+
+        self.metrics.in_serialize = True
+        self.started = perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.metrics is not None:
+            self.metrics.in_serialize = False
+            self.metrics.serialize_time += perf_counter() - self.started
+
+        return False
+
+
+# URL 이름, 메소드별 측정 결과
+# 캐시에 저장하고 프로세스끼리 더할 수 있도록 기본 자료형으로만 구성
+def _empty_view_stats():
+    return {
+        'statuses': {},
+        'count': 0,
+        'duration_sum': 0.0,
+        'duration_buckets': [0] * (len(DURATION_BUCKETS) + 1),
+        'queries': 0,
+        'query_buckets': [0] * (len(QUERY_BUCKETS) + 1),
+        'db_seconds': 0.0,
+        'cache_calls': 0,
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'cache_seconds': 0.0,
+        'serialize_seconds': 0.0,
+    }
+
+
+# value가 들어가는 구간의 위치, 마지막은 +Inf
+def _bucket(buckets, value):
+    for i, bound in enumerate(buckets):
+        if value <= bound:
+            return i
+
+    return len(buckets)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.lock = Lock()
+        # {(URL 이름, 메소드): 측정 결과}
+        self.views = {}
+        self.flushed_at = monotonic()
+
+    def observe(self, view, method, status, metrics, duration):
+        with self.lock:
+            stats = self.views.get((view, method))
+            if stats is None:
+                stats = self.views[(view, method)] = _empty_view_stats()
+
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + 1
+            stats['count'] += 1
+            stats['duration_sum'] += duration
+            stats['duration_buckets'][_bucket(DURATION_BUCKETS, duration)] += 1
+            stats['queries'] += metrics.queries
+            stats['query_buckets'][_bucket(QUERY_BUCKETS, metrics.queries)] += 1
+            stats['db_seconds'] += metrics.db_time
+            stats['cache_calls'] += metrics.cache_calls
+            stats['cache_hits'] += metrics.cache_hits
+            stats['cache_misses'] += metrics.cache_misses
+            stats['cache_seconds'] += metrics.cache_time
+            stats['serialize_seconds'] += metrics.serialize_time
+
+            if monotonic() - self.flushed_at < settings.REQUEST_METRICS_FLUSH_INTERVAL:
+                return
+            self.flushed_at = monotonic()
+
+        self.flush()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                key: {
+                    **stats,
+                    'statuses': dict(stats['statuses']),
+                    'duration_buckets': list(stats['duration_buckets']),
+                    'query_buckets': list(stats['query_buckets']),
+                } for key, stats in self.views.items()
+            }
+
+    def flush(self):
+        # 캐시 구현(config.cache_backends)이 이 모듈을 사용하므로 순환 참조를 피해 여기서 가져옴
+        from .process_stats import store_process_stats
+
+        store_process_stats(METRICS_KEY_PREFIX, self.snapshot())
+
+    def clear(self):
+        with self.lock:
+            self.views.clear()
+            self.flushed_at = monotonic()
+
+
+# 프로세스 안의 모든 요청이 함께 사용하는 측정 결과
+metrics_registry = MetricsRegistry()
+
+
+# 모든 프로세스의 측정 결과를 더함
+def collect_metrics():
+    from .process_stats import load_process_stats
+
+    metrics_registry.flush()
+
+    views = {}
+    for process_views in load_process_stats(METRICS_KEY_PREFIX).values():
+        for key, stats in process_views.items():
+            total = views.setdefault(key, _empty_view_stats())
+            for name, value in stats.items():
+                if name == 'statuses':
+                    for status, count in value.items():
+                        total['statuses'][status] = total['statuses'].get(status, 0) + count
+                elif isinstance(value, list):
+                    total[name] = [a + b for a, b in zip(total[name], value)]
+                else:
+                    total[name] += value
+
+    return views
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+# 측정 결과를 Prometheus 텍스트 형식으로 변환
+def render_metrics(views):
+    lines = []
+
+    def metric(name, kind, description, samples):
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {kind}')
+        lines.extend(samples)
+
+    def counter(name, description, field):
+        metric(name, 'counter', description, [
+            f'{name}{_labels(view=view, method=method)} {stats[field]}'
+            for (view, method), stats in sorted(views.items())
+        ])
+
+    def histogram(name, description, buckets, field, total, count='count'):
+        samples = []
+        for (view, method), stats in sorted(views.items()):
+            cumulative = 0
+            for bound, observed in zip((*buckets, '+Inf'), stats[field]):
+                cumulative += observed
+                samples.append(
+                    f'{name}_bucket{_labels(view=view, method=method, le=bound)} {cumulative}'
+                )
+            samples.append(f'{name}_sum{_labels(view=view, method=method)} {stats[total]}')
+            samples.append(f'{name}_count{_labels(view=view, method=method)} {stats[count]}')
+        metric(name, 'histogram', description, samples)
+
+    metric('pms_http_requests_total', 'counter', 'URL 이름, 메소드, 상태 코드별 요청 수', [
+        f'pms_http_requests_total{_labels(view=view, method=method, status=status)} {count}'
+        for (view, method), stats in sorted(views.items())
+        for status, count in sorted(stats['statuses'].items())
+    ])
+    histogram(
+        'pms_http_request_duration_seconds', '요청 처리 시간(초)',
+        DURATION_BUCKETS, 'duration_buckets', 'duration_sum'
+    )
+    histogram(
+        'pms_db_queries_per_request', '요청당 SQL 쿼리 수',
+        QUERY_BUCKETS, 'query_buckets', 'queries'
+    )
+    counter('pms_db_queries_total', 'SQL 쿼리 수', 'queries')
+    counter('pms_db_duration_seconds_total', 'SQL 실행 시간(초)', 'db_seconds')
+    counter('pms_cache_calls_total', '캐시 호출 수', 'cache_calls')
+    counter('pms_cache_hits_total', '캐시 조회 적중 수', 'cache_hits')
+    counter('pms_cache_misses_total', '캐시 조회 실패 수', 'cache_misses')
+    counter('pms_cache_duration_seconds_total', '캐시 호출 시간(초)', 'cache_seconds')
+    counter('pms_serialization_duration_seconds_total', '직렬화 시간(초)', 'serialize_seconds')
+
+    return '\n'.join(lines) + '\n'
+
+
+# /metrics/
+# 'Authorization: Bearer <METRICS_TOKEN>' 헤더가 있어야 함
+# 뷰별 응답 시간, 쿼리 수, 캐시 상태가 드러나므로 METRICS_TOKEN이 비어있다면
+# METRICS_ALLOW_ANONYMOUS로 명시적으로 허용했을 때만 토큰 없이 제공
+def metrics_view(request):
+    if request.method != 'GET':
+        return JsonResponse({'data': '허용되지 않은 메소드입니다.'}, status=405)
+
+    if not settings.METRICS_TOKEN:
+        if not settings.METRICS_ALLOW_ANONYMOUS:
+            return JsonResponse({'data': 'METRICS_TOKEN이 설정되지 않았습니다.'}, status=403)
+    elif request.headers.get('Authorization') != f'Bearer {settings.METRICS_TOKEN}':
+        return JsonResponse({'data': '인증 정보가 올바르지 않습니다.'}, status=401)
+
+    return HttpResponse(
+        render_metrics(collect_metrics()),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
+
+
+# 요청별 측정을 시작하고 끝나면 Server-Timing 헤더를 붙이고 URL 이름별로 모음
+# 다른 미들웨어의 작업까지 측정하도록 MIDDLEWARE의 가장 앞에 둠
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics, token = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics, token = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        return self.finish(request, response, metrics)
+
+    def start(self):
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+
+        metrics = RequestMetrics()
+
+        return metrics, _current.set(metrics)
+
+    def finish(self, request, response, metrics):
+        duration = perf_counter() - metrics.started
+
+        if settings.REQUEST_METRICS_SERVER_TIMING:
+            response['Server-Timing'] = metrics.server_timing(duration)
+
+        match = request.resolver_match
+        metrics_registry.observe(
+            match.url_name if (match is not None) and match.url_name else 'unmatched',
+            request.method,
+            response.status_code,
+            metrics,
+            duration
+        )
+
+        return response
+
+    # DRF 응답은 뷰가 끝난 다음 렌더링되므로 렌더링 시간도 직렬화 시간으로 기록
+    def process_template_response(self, request, response):
+        metrics = _current.get()
+        if metrics is not None:
+            started = perf_counter()
+
+            def rendered(response):
+                metrics.serialize_time += perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+
+        return response
@@ -0,0 +1,58 @@
+from django.core.cache import cache
+
+from .cache_backends import is_redis_cache
+from .circuit_breaker import CACHE_UNAVAILABLE, cache_circuit
+
+import os
+import socket
+
+
+# 서버 프로세스별로 모은 통계를 캐시에 저장하고 모든 프로세스의 통계를 함께 조회
+# 각 프로세스는 prefix + 프로세스명(호스트명:pid) 키에 통계를 저장함
+# Redis에서는 키를 검색하고, 키를 검색할 수 없는 캐시(locmem, file)에서는 프로세스 목록을 따로 저장함
+# 종료된 프로세스의 통계는 PROCESS_STATS_TIMEOUT이 지나면 사라짐
+
+
+# 통계를 캐시에 유지하는 시간(1일)
+PROCESS_STATS_TIMEOUT = 60 * 60 * 24
+
+
+def process_name():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def _processes_key(prefix):
+    return f'processes:{prefix}'
+
+
+# 현재 프로세스의 통계 저장
+# 캐시를 사용할 수 없다면 저장하지 않음(다음에 다시 저장)
+def store_process_stats(prefix, stats):
+    try:
+        with cache_circuit:
+            cache.set(f'{prefix}{process_name()}', stats, PROCESS_STATS_TIMEOUT)
+
+            if not is_redis_cache():
+                processes = cache.get(_processes_key(prefix), [])
+                if process_name() not in processes:
+                    cache.set(
+                        _processes_key(prefix),
+                        [*processes, process_name()],
+                        PROCESS_STATS_TIMEOUT
+                    )
+    except CACHE_UNAVAILABLE:
+        pass
+
+
+# 프로세스별 통계
+# {프로세스명: 통계}
+def load_process_stats(prefix):
+    if is_redis_cache():
+        keys = list(cache.iter_keys(f'{prefix}*'))
+    else:
+        keys = [f'{prefix}{process}' for process in cache.get(_processes_key(prefix), [])]
+
+    return {
+        key[len(prefix):]: value
+        for key, value in cache.get_many(keys).items()
+    }
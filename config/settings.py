@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 
 from datetime import timedelta
 import os
+import tempfile
 
 load_dotenv()
 
@@ -48,6 +49,8 @@ SYSTEM_APPS = [
 INSTALLED_APPS = SYSTEM_APPS + THIRD_PARTY_APPS + CUSTOM_APPS
 
 MIDDLEWARE = [
+    # 요청별 SQL, 캐시, 직렬화 측정(config.metrics), 다른 미들웨어까지 측정하도록 가장 앞에 둠
+    'config.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -128,7 +131,8 @@ AUTH_USER_MODEL = 'users.User'
 # DRF 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # JWT 인증 후 요청에 사용자의 팀 정보를 붙여줌
+        "config.authentication.TeamJWTAuthentication",
     ),
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
 }
@@ -141,16 +145,87 @@ SIMPLE_JWT = {
 }
 
 # Redis 설정
-CACHES = {
-    'default': {
-        'BACKEND': 'django_redis.cache.RedisCache',
-        'LOCATION': 'redis://127.0.0.1:6379/1',  # 배포시 변경
+# 프로세스 안의 모든 요청이 하나의 연결 풀을 함께 사용
+# 연결이 모두 사용 중이면 REDIS_POOL_TIMEOUT초까지 기다린 다음 실패
+# Redis 응답이 REDIS_SOCKET_TIMEOUT초를 넘으면 실패로 보고 보드 조회는 DB에서 직렬화함(config.circuit_breaker)
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 50))
+REDIS_POOL_TIMEOUT = float(os.getenv('REDIS_POOL_TIMEOUT', 1))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv('REDIS_SOCKET_CONNECT_TIMEOUT', 0.5))
+REDIS_SOCKET_TIMEOUT = float(os.getenv('REDIS_SOCKET_TIMEOUT', 1))
+
+# 캐시 구현(config.cache_backends)
+# 'redis': Redis(배포 기본값)
+# 'locmem': 프로세스 메모리, Redis 없이 개발, 테스트(CACHE_BACKEND=locmem python manage.py test)
+# 'file': 메모리 맵 파일, Redis 없이 한 서버의 여러 프로세스가 함께 사용
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'redis')
+# locmem, file 캐시의 최대 키 수, 넘으면 오래 사용되지 않은 키부터 1 / CACHE_CULL_FREQUENCY만큼 삭제
+# Redis는 서버의 maxmemory, maxmemory-policy(allkeys-lru) 설정을 따름
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 100000))
+CACHE_CULL_FREQUENCY = 3
+
+CACHE_BACKENDS = {
+    'redis': {
+        'BACKEND': 'config.cache_backends.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1'),  # 배포시 변경
         'OPTIONS': {
-            'CLIENT_CLASS': 'django_redis.client.DefaultClient'
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_CLASS': 'redis.BlockingConnectionPool',
+            'CONNECTION_POOL_KWARGS': {
+                'max_connections': REDIS_MAX_CONNECTIONS,
+                'timeout': REDIS_POOL_TIMEOUT,
+                # 오래 사용되지 않은 연결은 사용하기 전에 확인
+                'health_check_interval': 30,
+            },
+            'SOCKET_CONNECT_TIMEOUT': REDIS_SOCKET_CONNECT_TIMEOUT,
+            'SOCKET_TIMEOUT': REDIS_SOCKET_TIMEOUT,
         }
-    }
+    },
+    'locmem': {
+        'BACKEND': 'config.cache_backends.LocMemCache',
+        'LOCATION': 'project-management-system',
+        'OPTIONS': {
+            'MAX_ENTRIES': CACHE_MAX_ENTRIES,
+            'CULL_FREQUENCY': CACHE_CULL_FREQUENCY,
+        }
+    },
+    'file': {
+        'BACKEND': 'config.cache_backends.MmapFileCache',
+        # 같은 서버의 모든 프로세스가 같은 디렉토리를 사용해야 함
+        'LOCATION': os.getenv(
+            'CACHE_FILE_LOCATION',
+            os.path.join(tempfile.gettempdir(), 'project-management-system-cache')
+        ),
+        'OPTIONS': {
+            'MAX_ENTRIES': CACHE_MAX_ENTRIES,
+            'CULL_FREQUENCY': CACHE_CULL_FREQUENCY,
+        }
+    },
+}
+
+CACHES = {
+    'default': CACHE_BACKENDS[CACHE_BACKEND]
 }
 
+# 비동기 뷰에서 사용하는 Redis 연결(config.async_cache)의 최대 수(이벤트 루프마다)
+ASYNC_CACHE_MAX_CONNECTIONS = REDIS_MAX_CONNECTIONS
+
+# 요청별 SQL, 캐시, 직렬화 측정(config.metrics)
+# 응답에 Server-Timing 헤더를 붙일지 여부
+REQUEST_METRICS_SERVER_TIMING = os.getenv('REQUEST_METRICS_SERVER_TIMING', 'True') == 'True'
+# 프로세스별 측정 결과를 캐시에 저장하는 간격(초)
+REQUEST_METRICS_FLUSH_INTERVAL = 10
+# /metrics/ 요청에 필요한 토큰('Authorization: Bearer <토큰>')
+# 비어있으면 METRICS_ALLOW_ANONYMOUS일 때만 토큰 없이 조회할 수 있고 그 외에는 조회할 수 없음
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+# 토큰 없는 /metrics/ 조회를 허용할지 여부(로컬 개발용)
+METRICS_ALLOW_ANONYMOUS = os.getenv('METRICS_ALLOW_ANONYMOUS', 'False') == 'True'
+
+# 캐시 차단기(config.circuit_breaker)
+# 연속으로 실패한 횟수가 이 값에 도달하면 차단기가 열림
+CACHE_CIRCUIT_FAILURE_THRESHOLD = 5
+# 차단기가 열린 뒤 다시 캐시를 시도할 때까지의 시간(초)
+CACHE_CIRCUIT_RESET_TIMEOUT = 10
+
 # Swagger 설정
 SWAGGER_SETTINGS = {
     "SECURITY_DEFINITIONS": {
@@ -173,4 +248,86 @@ CELERY_BEAT_SCHEDULE = {
         # 월~금 09:00 스케쥴러 작동
         'schedule': crontab(minute='0', hour='9', day_of_week='1-5'),
     },
+    'rebalance_ranks': {
+        'task': 'boards.tasks.rebalance_ranks',
+        # 매시 30분에 길어진 정렬 키 재배치
+        'schedule': crontab(minute='30'),
+    },
 }
+
+# 보드 캐시가 만료된 뒤에도 이전 데이터를 제공하는 시간(초)
+# 이 시간 동안은 만료된 데이터를 바로 응답하고 백그라운드에서 다시 캐싱함, 0이면 사용하지 않음
+BOARD_CACHE_STALE_TIMEOUT = 60 * 10
+# 보드를 다시 직렬화하는 요청이 잡는 잠금의 최대 유지 시간(초)
+BOARD_CACHE_LOCK_TIMEOUT = 30
+# 다른 요청이 보드를 직렬화하는 동안 기다리는 최대 시간(초), 넘으면 직접 직렬화
+BOARD_CACHE_LOCK_WAIT = 5
+# 캐싱되는 보드 데이터를 zlib으로 압축하는 최소 크기(바이트)와 압축 수준
+BOARD_SNAPSHOT_COMPRESS_MIN_SIZE = 1024
+BOARD_SNAPSHOT_COMPRESS_LEVEL = 6
+# 티켓 일괄 생성, 수정, 삭제 API가 한 번에 처리하는 최대 티켓 수
+BOARD_BULK_MAX_TICKETS = 500
+# 동시에 쓰는 요청으로 DB가 잠겨있을 때(SQLite) 티켓 추가를 다시 시도하는 횟수와 기본 대기 시간(초)
+BOARD_WRITE_RETRY_ATTEMPTS = 10
+BOARD_WRITE_RETRY_DELAY = 0.05
+# 보드 변경 이벤트(/api/v1/boards/board/events/) 채널
+# 'boards.events.RedisBoardEvents': Redis pub/sub, 여러 서버 프로세스에 전달
+# 'boards.events.InMemoryBoardEvents': 같은 프로세스 안에서만 전달(개발, 테스트용)
+BOARD_EVENTS_BACKEND = os.getenv(
+    'BOARD_EVENTS_BACKEND',
+    # Redis가 아닌 캐시에서는 pub/sub이 없으므로 프로세스 안에서만 전달
+    'boards.events.RedisBoardEvents' if CACHE_BACKEND == 'redis' else 'boards.events.InMemoryBoardEvents'
+)
+# 이벤트가 없을 때 연결 유지를 위해 보내는 주석의 간격(초)
+BOARD_EVENTS_HEARTBEAT = 15
+# 하나의 이벤트 응답을 유지하는 최대 시간(초), 지나면 응답을 끝내고 클라이언트가 다시 연결함
+BOARD_EVENTS_MAX_AGE = 60 * 5
+# 이벤트 API 연결에 사용하는 이벤트 티켓의 유효 시간(초)
+# 티켓은 URL에 들어가므로 연결하기 직전에 발급받도록 짧게 유지
+BOARD_EVENTS_TICKET_TIMEOUT = 60
+# 프로세스 안의 보드 데이터 캐시(boards.local_cache)
+# 저장하는 보드 데이터의 최대 크기(바이트, Redis에 저장된 스냅샷 기준), 0이면 사용하지 않음
+BOARD_LOCAL_CACHE_MAX_BYTES = int(os.getenv('BOARD_LOCAL_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+# 보드 데이터를 유지하는 시간(초)
+BOARD_LOCAL_CACHE_TTL = int(os.getenv('BOARD_LOCAL_CACHE_TTL', 60 * 5))
+# 무효화 메시지 없이 팀의 보드 버전을 기억하는 최대 시간(초)
+BOARD_LOCAL_VERSION_TTL = int(os.getenv('BOARD_LOCAL_VERSION_TTL', 5))
+# 같은 팀의 보드 사용 기록(preload_boards)을 Redis에 남기는 최소 간격(초)
+BOARD_LOCAL_ACTIVITY_INTERVAL = 60
+# 조회 결과(board_local_cache_stats 명령)를 캐시에 저장하는 조회 횟수 간격
+BOARD_LOCAL_CACHE_STATS_FLUSH_EVERY = 100
+
+# 보드 미리 캐싱(preload_boards) 설정
+# 전체 보드를 나눠서 동시에 처리할 하위 작업 수
+BOARD_PRELOAD_CONCURRENCY = int(os.getenv('BOARD_PRELOAD_CONCURRENCY', 4))
+# 하위 작업이 한 번에 조회, 캐싱하는 보드 수
+BOARD_PRELOAD_BATCH_SIZE = 200
+# 미리 캐싱한 보드 데이터의 만료 시간(초), 출근 시간대 동안 유지
+BOARD_PRELOAD_TIMEOUT = 60 * 60 * 3
+# 미리 캐싱할 보드를 고르는 방식
+# 'all': 전체 보드
+# 'recent': 최근 BOARD_PRELOAD_ACTIVE_DAYS일 안에 사용된 보드 중 최근 순으로 BOARD_PRELOAD_TOP_N개
+# 'weekday': 'recent'와 같지만 오늘과 같은 요일에 사용된 적이 있는 보드만
+BOARD_PRELOAD_POLICY = os.getenv('BOARD_PRELOAD_POLICY', 'recent')
+BOARD_PRELOAD_TOP_N = 1000
+BOARD_PRELOAD_ACTIVE_DAYS = 14
+
+# 보드 스트리밍 응답(/api/v1/boards/board/list/?stream=true) 설정
+# 서버 측 커서로 한 번에 읽는 티켓 수
+BOARD_STREAM_CHUNK_SIZE = 2000
+# 응답으로 한 번에 내보내는 JSON 문자열 크기(글자 수)
+BOARD_STREAM_BUFFER_SIZE = 64 * 1024
+
+# 사용자 팀 정보 캐시 만료 시간(1일)
+# 사용자의 그룹, 팀, 보드가 바뀌면 시그널로 바로 삭제되므로 길게 유지
+MEMBERSHIP_CACHE_TIMEOUT = 60 * 60 * 24
+# 팀 정보 캐시 적중률을 이 횟수의 조회마다 캐시에 합산
+MEMBERSHIP_STATS_FLUSH_EVERY = 100
+
+# 보드 정렬 방식
+# 'sequence': 정수 순서값으로 정렬, 이동할 때 사이에 있는 행들의 순서값을 함께 수정
+# 'rank': 정렬 키로 정렬, 이동할 때 옮겨지는 행 하나만 수정(API의 순서값은 정렬된 위치로 제공)
+# 방식을 바꾸기 전에 python manage.py rebalance_ranks 로 정렬 키와 순서값을 맞춰야 함
+BOARD_ORDERING = os.getenv('BOARD_ORDERING', 'sequence')
+# 정렬 키가 이 길이를 넘으면 재배치 작업에서 정렬 키를 다시 고르게 배분
+BOARD_RANK_MAX_LENGTH = 16
@@ -4,6 +4,8 @@ from django.urls import path, include, re_path
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from .metrics import metrics_view
+
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -33,6 +35,9 @@ urlpatterns = [
 
     path('admin/', admin.site.urls),
 
+    # Prometheus 측정 결과(config.metrics)
+    path('metrics/', metrics_view, name='metrics'),
+
     path('api/v1/users/', include('users.urls')),
     path('api/v1/teams/', include('teams.urls')),
     path('api/v1/boards/', include('boards.urls')),
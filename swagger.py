@@ -4,10 +4,12 @@ from drf_yasg import openapi
 SUCCESS_MESSAGE_200 = '성공적으로 요청을 완료했습니다.'
 SUCCESS_MESSAGE_201 = '성공적으로 데이터 생성을 완료했습니다.'
 SUCCESS_MESSAGE_204 = '성공적으로 요청을 완료했습니다. 그러나 반환할 값이 없습니다.'
+SUCCESS_MESSAGE_304 = '변경 사항 없음, 클라이언트가 가진 데이터(If-None-Match)가 최신입니다.'
 ERROR_MESSAGE_400 = '입력값 오류, 잘못된 값이 입력되었습니다. 상세한 내용은 에러 메시지를 확인해주세요.'
 ERROR_MESSAGE_401 = '인증 오류, 인증되지 않은 사용자는 이용할 수 없습니다.'
 ERROR_MESSAGE_403 = '권한 오류, 권한이 없는 사용자는 이용할 수 없습니다.'
 ERROR_MESSAGE_404 = '입력값 오류, 잘못된 값으로 인해 데이터를 찾을 수 없습니다.'
+ERROR_MESSAGE_409 = '충돌 오류, 다른 사용자가 먼저 수정했습니다. 최신 버전(ETag)으로 다시 시도해주세요.'
 ERROR_MESSAGE_423 = '상태 오류, 요청이 완료될 수 없는 상태입니다.'
 ERROR_MESSAGE_500 = '서버 오류, 요청을 처리하던 중 서버에 문제가 발생했습니다.'
 
@@ -100,7 +102,8 @@ TICKET_UPDATE_PARAMETER = openapi.Schema(
         'title': openapi.Schema(type=openapi.TYPE_STRING, description='티켓 제목'),
         'tag': openapi.Schema(type=openapi.TYPE_STRING, description='태그'),
         'volume': openapi.Schema(type=openapi.TYPE_NUMBER, description='작업량'),
-        'ended_at': openapi.Schema(type=openapi.TYPE_STRING, description='마감일')
+        'ended_at': openapi.Schema(type=openapi.TYPE_STRING, description='마감일'),
+        'version': openapi.Schema(type=openapi.TYPE_INTEGER, description='마지막으로 받은 티켓 버전, 다르면 409 응답')
     },
     required=['ticket']
 )
@@ -122,3 +125,63 @@ TICKET_DELETE_PARAMETER = openapi.Schema(
     },
     required=['ticket']
 )
+
+TICKET_BULK_CREATE_PARAMETER = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'ticket': openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=TICKET_CREATE_PARAMETER,
+            description='생성할 티켓 목록'
+        )
+    },
+    required=['ticket']
+)
+
+TICKET_BULK_UPDATE_PARAMETER = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'ticket': openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=TICKET_UPDATE_PARAMETER,
+            description='수정할 티켓 목록'
+        )
+    },
+    required=['ticket']
+)
+
+TICKET_BULK_DELETE_PARAMETER = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'ticket': openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(type=openapi.TYPE_INTEGER),
+            description='삭제할 티켓 id 목록'
+        )
+    },
+    required=['ticket']
+)
+
+IF_MATCH_PARAMETER = openapi.Parameter(
+    'If-Match',
+    openapi.IN_HEADER,
+    type=openapi.TYPE_STRING,
+    description='마지막으로 받은 컬럼, 티켓 버전(예: "3"), 본문의 version 값으로도 보낼 수 있음. 다르면 409 응답'
+)
+
+BOARD_LIST_STREAM_PARAMETER = openapi.Parameter(
+    'stream',
+    openapi.IN_QUERY,
+    type=openapi.TYPE_BOOLEAN,
+    description='true이면 보드를 캐싱하지 않고 DB에서 조금씩 읽어 스트리밍으로 응답(매우 큰 보드용)'
+)
+
+TICKET_LIST_PARAMETERS = [
+    openapi.Parameter('column', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='컬럼 id, 해당 컬럼의 티켓만 조회'),
+    openapi.Parameter('tag', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='태그, 쉼표로 여러 개 지정 가능(예: FE,BE)'),
+    openapi.Parameter('charge', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='담당자 계정명'),
+    openapi.Parameter('ended_from', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='마감일 시작(YYYY-MM-DD, 포함)'),
+    openapi.Parameter('ended_to', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='마감일 끝(YYYY-MM-DD, 포함)'),
+    openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='한 페이지의 티켓 수(기본 50, 최대 200)'),
+    openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='이전 응답의 next 값, 다음 페이지 조회'),
+]
@@ -136,13 +136,11 @@ class TeamInviteView(APIView):
     def post(self, request):
         user = request.user
 
-        try:
-            # 초대할 팀 객체
-            # 현재 로그인한 사용자가 팀장으로 있는 팀인지 아닌지는 권한 레벨에서 판단중
-            invite_team = Team.objects.get(
-                name=user.groups.exclude(name='leader').first().name
-            )
+        # 초대할 팀 객체
+        # 현재 로그인한 사용자가 팀장으로 있는 팀인지 아닌지는 권한 레벨에서 판단중
+        invite_team = request.membership.team
 
+        try:
             # 초대할 대상 객체
             target_user = User.objects.get(
                 username=request.data.get('target')
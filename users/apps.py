@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        # 사용자의 그룹이 바뀔 때 팀 정보 캐시를 삭제하는 시그널 등록
+        import config.memberships
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from config.memberships import warm_membership_cache, membership_cache_stats
+
+
+class Command(BaseCommand):
+    help = '전체 사용자의 팀 정보(소속 팀, 보드, 팀장 여부)를 미리 캐싱합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 조회, 캐싱할 사용자 수'
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='캐싱하지 않고 팀 정보 캐시 적중률만 출력'
+        )
+
+    def handle(self, *args, **options):
+        if not options['stats']:
+            warmed = warm_membership_cache(options['batch_size'])
+            self.stdout.write(f'사용자 {warmed}명의 팀 정보를 캐싱했습니다.')
+
+        stats = membership_cache_stats()
+        self.stdout.write(
+            f"적중 {stats['hits']}회, 실패 {stats['misses']}회, 적중률 {stats['hit_ratio']:.1%}"
+        )